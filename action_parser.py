@@ -21,12 +21,12 @@ Created on Sun Nov  9 09:35:20 2014
 @author: pavla
 """
 
-from ply import lex, yacc
-import os
+import sys, threading, parser_tables
+from copy import copy
 from collections import OrderedDict
+from expressions import (Number, Name, Unary, Binary, Paren, Index, Assign,
+                         Comma, InitList, makeOperation, TRUE, FALSE)
 
-newVars = None
-prefix = None
 typeConversions = {
     "int":["int", "int16", "int32", "uint8", "uint16", "uint32"],
     "byte":["bool", "char", "int8"],
@@ -101,6 +101,10 @@ def t_NEWLINE(t):
 def t_error(t):
     raise TypeError("Unknown text '%s'" % t.value)
 
+# identifiers true and false are the shared constants, recognized by the
+# planarization and the optimizations
+CONSTANTS = {"true":TRUE, "false":FALSE}
+
 def p_start(p):
     """start : empty
              | block_items"""
@@ -124,8 +128,6 @@ def p_block_items(p):
                    | statement block_items
                    | declaration
                    | statement"""
-    if isinstance(p[1], str):
-        p[1] = [p[1]]
     if len(p) == 3:
         if p[1] is None:
             p[0] = p[2]
@@ -175,9 +177,10 @@ def p_declaration(p):
         elif tempType in typeConversions["byte"]:
             finalType = "byte"
 
+        context = p.lexer.context
         for varInit in p[2]:
-            newVars[prefix + varInit[0]] = {"type":finalType, "const":const,
-                                            "init":varInit[1], "scope":"label"}
+            context.newVars[context.prefix + varInit[0]] = {"type":finalType,
+                "const":const, "init":varInit[1], "scope":"label"}
 
 def p_type_specifiers(p):
     """type_specifiers : type_specifier
@@ -226,13 +229,14 @@ def p_declarator(p):
                   | declarator LBRACKET assignment_expression RBRACKET
                   | declarator LBRACKET RBRACKET"""
     if len(p) == 2:
-        if prefix + p[1] in newVars:
-            p[1] = prefix + p[1]
+        context = p.lexer.context
+        if context.prefix + p[1] in context.newVars:
+            p[1] = context.prefix + p[1]
         p[0] = p[1]
     elif len(p) == 4:
         p[0] = p[1] + p[2] + p[3]
     else:
-        p[0] = p[1] + p[2] + p[3] + p[4]
+        p[0] = p[1] + p[2] + str(p[3]) + p[4]
 
 def p_initializer(p):
     """initializer : LBRACE initializer_list RBRACE
@@ -240,16 +244,16 @@ def p_initializer(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + p[2] + p[3]
+        p[0] = InitList(tuple(p[2]))
 
 def p_initializer_list(p):
     """initializer_list : initializer
                         | initializer ','
                         | initializer ',' initializer_list"""
-    if len(p) == 2:
-        p[0] = p[1]
+    if len(p) == 4:
+        p[0] = [p[1]] + p[3]
     else:
-        p[0] = p[1] + p[2] + ' ' + p[3]
+        p[0] = [p[1]]
 
 def p_statement(p):
     """statement : compound_statement
@@ -261,16 +265,24 @@ def p_expression_statement(p):
                             | expression ';'
                             | NEWLINE
                             | expression NEWLINE"""
+    # comma separated expressions are separate actions
     if len(p) == 3:
         p[0] = p[1]
 
+# list of comma separated expressions
 def p_expression(p):
     """expression : assignment_expression
                   | expression ',' assignment_expression"""
     if len(p) == 2:
-        p[0] = p[1]
+        p[0] = [p[1]]
     else:
-        p[0] = p[1] + ', ' + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
+
+def toExpression(expressions):
+    if len(expressions) == 1:
+        return expressions[0]
+    return Comma(tuple(expressions))
 
 def p_assignment_expression(p):
     """assignment_expression : inc_dec_assignment
@@ -278,32 +290,12 @@ def p_assignment_expression(p):
             | unary_expression assignment_operator assignment_expression"""
     if len(p) == 2:
         p[0] = p[1]
-    elif p[2] == '=':
-        p[0] = p[1] + ' = ' + p[3]
-    elif p[2] == ':=':
-        p[0] = p[1] + ' = ' + p[3]
-    elif p[2] == "+=":
-        p[0] = p[1] + ' = (' + p[1] + ') + (' + p[3] + ')'
-    elif p[2] == "-=":
-        p[0] = p[1] + ' = (' + p[1] + ') - (' + p[3] + ')'
-    elif p[2] == "*=":
-        p[0] = p[1] + ' = (' + p[1] + ') * (' + p[3] + ')'
-    elif p[2] == "/=":
-        p[0] = p[1] + ' = (' + p[1] + ') / (' + p[3] + ')'
-    elif p[2] == "%=":
-        p[0] = p[1] + ' = (' + p[1] + ') % (' + p[3] + ')'
-    elif p[2] == "&=":
-        p[0] = p[1] + ' = (' + p[1] + ') & (' + p[3] + ')'
-    elif p[2] == "^=":
-        p[0] = p[1] + ' = (' + p[1] + ') ^ (' + p[3] + ')'
-    elif p[2] == "|=":
-        p[0] = p[1] + ' = (' + p[1] + ') | (' + p[3] + ')'
-    elif p[2] == ">>=":
-        p[0] = p[1] + ' = (' + p[1] + ') >> (' + p[3] + ')'
-    elif p[2] == "<<=":
-        p[0] = p[1] + ' = (' + p[1] + ') << (' + p[3] + ')'
+    elif p[2] == '=' or p[2] == ':=':
+        p[0] = Assign(p[1], p[3])
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        # compound assignment, e.g. x += y is x = (x) + (y)
+        p[0] = Assign(p[1], makeOperation(p[2][:-1], Paren(p[1]),
+                                          Paren(p[3])))
 
 def p_inc_dec_assignment(p):
     """inc_dec_assignment : INC_OP unary_expression
@@ -311,13 +303,13 @@ def p_inc_dec_assignment(p):
                           | DEC_OP unary_expression
                           | unary_expression DEC_OP"""
     if p[1] == "++":
-        p[0] = p[2] + " = " + p[2] + " + 1"
+        p[0] = Assign(p[2], makeOperation("+", p[2], Number("1")))
     elif p[2] == "++":
-        p[0] = p[1] + " = " + p[1] + " + 1"
+        p[0] = Assign(p[1], makeOperation("+", p[1], Number("1")))
     elif p[1] == "--":
-        p[0] = p[2] + " = " + p[2] + " - 1"
+        p[0] = Assign(p[2], Binary("-", p[2], Number("1")))
     elif p[2] == "--":
-        p[0] = p[1] + " = " + p[1] + " - 1"
+        p[0] = Assign(p[1], Binary("-", p[1], Number("1")))
 
 def p_assignment_operator(p):
     """assignment_operator : '='
@@ -340,7 +332,7 @@ def p_logical_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' or ' + p[3]
+        p[0] = makeOperation("or", p[1], p[3])
  
 def p_logical_and_expression(p):
     """logical_and_expression : inclusive_or_expression
@@ -348,7 +340,7 @@ def p_logical_and_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' and ' + p[3]
+        p[0] = makeOperation("and", p[1], p[3])
 
 def p_inclusive_or_expression(p):
     """inclusive_or_expression : exclusive_or_expression
@@ -356,7 +348,7 @@ def p_inclusive_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
  
 def p_exclusive_or_expression(p):
     """exclusive_or_expression : and_expression
@@ -364,7 +356,7 @@ def p_exclusive_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_and_expression(p):
     """and_expression : equality_expression
@@ -372,7 +364,7 @@ def p_and_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
  
 def p_equality_expression(p):
     """equality_expression : relational_expression
@@ -381,7 +373,7 @@ def p_equality_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
  
 def p_relational_expression(p):
     """relational_expression : shift_expression
@@ -392,7 +384,7 @@ def p_relational_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
 
 def p_shift_expression(p):
     """shift_expression : additive_expression
@@ -401,7 +393,7 @@ def p_shift_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
 
 def p_additive_expression(p):
     """additive_expression : multiplicative_expression
@@ -410,7 +402,7 @@ def p_additive_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_multiplicative_expression(p):
     """multiplicative_expression : unary_expression
@@ -420,7 +412,7 @@ def p_multiplicative_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
  
 def p_unary_expression(p):
     """unary_expression : primary_expression
@@ -431,52 +423,68 @@ def p_unary_expression(p):
     elif len(p) == 3 and p[1] == '+':
         p[0] = p[2]
     elif len(p) == 3:
-        p[0] = p[1] + p[2]
+        p[0] = Unary(p[1], p[2])
     else:
-        p[0] = p[1] + p[2] + p[3] + p[4]
+        p[0] = Index(p[1], toExpression(p[3]))
 
 def p_unary_operator(p):
     """unary_operator : '+'
                       | '-'
                       | '~'
                       | '!'"""
-    if p[1] == '-' or p[1] == '~':
-        p[0] = p[1]
-    if p[1] == '!':
-        p[0] = ' not '
+    p[0] = p[1]
 
 def p_primary_expression(p):
     """primary_expression : IDENTIFIER
                           | NUMBER
                           | '(' expression ')'"""
-    if len(p) == 2:
-        if prefix + p[1] in newVars:
-            p[1] = prefix + p[1]
-        p[0] = p[1]
+    if len(p) == 2 and p.slice[1].type == "NUMBER":
+        p[0] = Number(p[1])
+    elif len(p) == 2 and p[1] in CONSTANTS:
+        p[0] = CONSTANTS[p[1]]
+    elif len(p) == 2:
+        context = p.lexer.context
+        if context.prefix + p[1] in context.newVars:
+            p[1] = context.prefix + p[1]
+        p[0] = Name(p[1])
     else: 
-        p[0] = p[1] + p[2] + p[3]
+        p[0] = Paren(toExpression(p[2]))
 
 def p_error(p):
     if p is None:
         raise ValueError("Unknown error")
     raise ValueError("Syntax error, line %s: %s" % (p.lineno, p.type))
 
-directory = os.path.join(os.path.dirname(__file__), 
-                         "parser_tables", 
-                         os.path.basename(__file__).rsplit('.', 1)[0])
-try:
-    os.makedirs(directory, exist_ok=True)
-except OSError:
-    pass
-
-lexer = lex.lex(debug=False, optimize=True, outputdir=directory)
-parser = yacc.yacc(debug=False, optimize=True, outputdir=directory)
-
-def parse(text, tempPrefix="", variables=None, lexer=lexer):
-    global prefix
-    global newVars
-    prefix = tempPrefix
+# state of one call of parse, available to the grammar actions as
+# p.lexer.context, so that labels can be parsed concurrently
+# prefix - prefix of variables declared in the label
+# newVars - variables declared in the label (and previous parts of it)
+class ParseContext:
+    prefix = ""
+    newVars = None
+
+    def __init__(self, prefix, newVars):
+        self.prefix = prefix
+        self.newVars = newVars
+
+lexer = None
+parser = None
+lock = threading.Lock()
+
+# lexer and parser are created when first needed
+def getParser():
+    global lexer, parser
+    with lock:
+        if parser is None:
+            (lexer, parser) = parser_tables.buildParser(sys.modules[__name__])
+    return (lexer, parser)
+
+def parse(text, tempPrefix="", variables=None, lexer=None):
+    (defaultLexer, defaultParser) = getParser()
+    if lexer is None:
+        lexer = defaultLexer.clone()
     if variables is None:
         variables = OrderedDict()
-    newVars = variables
-    return (parser.parse(text, lexer), newVars)
+    lexer.context = ParseContext(tempPrefix, variables)
+    # the parser keeps some state of the parse in its attributes
+    return (copy(defaultParser).parse(text, lexer), variables)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the time needed to build the label parsers, from the tables in the
+package parser_tables and from the grammars (as without the tables).
+Usage: python benchmarks/parser_startup.py [repeat]
+"""
+
+import sys, os, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ply import lex, yacc
+import parser_tables
+from build_tables import PARSERS
+
+def buildFromTables(module):
+    parser_tables.buildParser(module)
+
+def buildFromGrammar(module):
+    lex.lex(module=module, debug=False, optimize=False,
+            errorlog=yacc.NullLogger())
+    yacc.yacc(module=module, debug=False, optimize=False,
+              tabmodule="parser_tables.%s_missing" % module.__name__,
+              write_tables=False, errorlog=yacc.NullLogger())
+
+# Returns the best time of repeat builds of all parsers, in milliseconds.
+def measure(build, modules, repeat):
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        for module in modules:
+            build(module)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def main():
+    repeat = 5
+    if len(sys.argv) > 1:
+        repeat = int(sys.argv[1])
+    modules = [__import__(name) for name in PARSERS]
+    for module in modules:
+        if not parser_tables.isTableCurrent(
+                module, "parser_tables.%s_parsetab" % module.__name__):
+            print("Tables of %s are outdated, run build_tables.py"
+                  % module.__name__)
+            return 1
+    print("from tables:  %8.2f ms" % measure(buildFromTables, modules, repeat))
+    print("from grammar: %8.2f ms" % measure(buildFromGrammar, modules,
+                                             repeat))
+
+if __name__ == "__main__":
+    sys.exit(main())
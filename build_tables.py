@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Generates lexer and parser tables of the label parsers into the package
+parser_tables. To be run whenever a grammar changes.
+"""
+
+import sys, os, glob
+import parser_tables
+
+PARSERS = ["action_parser", "condition_parser", "state_parser",
+           "transition_parser"]
+
+def main():
+    directory = os.path.dirname(os.path.abspath(parser_tables.__file__))
+    for tableFile in glob.glob(os.path.join(directory, "*tab.py")):
+        os.remove(tableFile)
+    for name in PARSERS:
+        parser_tables.buildParser(__import__(name), write=True)
+        print("Tables of %s written" % name)
+
+if __name__ == "__main__":
+    sys.exit(main())
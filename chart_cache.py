@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+On-disk cache of planarized charts, keyed by the canonicalized XML of the
+chart, the version of sf2dve and the options affecting the planarization.
+"""
+
+import os, time, hashlib, pickle, tempfile
+from lxml import etree
+
+CACHE_SUFFIX = ".chart"
+TEMP_SUFFIX = ".tmp"
+# temporary files older than this (in seconds) are left by interrupted writes
+STALE_TEMP_AGE = 3600
+
+def getDefaultCacheDir():
+    cacheHome = os.environ.get("XDG_CACHE_HOME",
+                               os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cacheHome, "sf2dve")
+
+# Returns digest of the sources of sf2dve, so that the charts cached by
+# a different revision of the program are not used.
+def getSourceDigest():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            with open(os.path.join(directory, name), "rb") as sourceFile:
+                digest.update(sourceFile.read())
+    return digest.hexdigest()
+
+# on-disk cache of planarized charts
+# directory - cache directory, created when first needed
+# maxSize - maximal total size of the cached files in bytes; least recently
+#           used files are removed when the size is exceeded
+# version - version of sf2dve (including digest of its sources), part of
+#           every key
+# size - total size of the cached files found by the last sweep of the
+#        directory plus sizes of the files stored since then (None before
+#        the first sweep); the directory is swept again only when the size
+#        exceeds maxSize
+# Failures when reading or writing the cache are not errors, the chart is
+# just planarized again.
+class ChartCache:
+    directory = None
+    maxSize = 0
+    version = None
+    size = None
+
+    def __init__(self, directory, maxSize, version):
+        self.directory = directory
+        self.maxSize = maxSize
+        self.version = version
+
+    # key is computed from canonicalized XML of the chart, version and
+    # options affecting the result
+    def getKey(self, chartEl, options):
+        digest = hashlib.sha256()
+        digest.update(("%s\n%r\n" % (self.version, options)).encode("utf-8"))
+        digest.update(etree.tostring(chartEl, method="c14n"))
+        return digest.hexdigest()
+
+    def _getPath(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key):
+        path = self._getPath(key)
+        try:
+            cacheFile = open(path, "rb")
+        except (IOError, OSError):
+            return None
+        try:
+            with cacheFile:
+                chart = pickle.load(cacheFile)
+        except Exception:
+            # broken file (e.g. truncated or corrupted), removed so that the
+            # chart is stored again
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            # marking the file as recently used
+            os.utime(path, None)
+        except OSError:
+            pass
+        return chart
+
+    def put(self, key, chart):
+        tempPath = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            (fd, tempPath) = tempfile.mkstemp(dir=self.directory,
+                                              suffix=TEMP_SUFFIX)
+            with os.fdopen(fd, "wb") as cacheFile:
+                pickle.dump(chart, cacheFile, pickle.HIGHEST_PROTOCOL)
+                fileSize = cacheFile.tell()
+            os.replace(tempPath, self._getPath(key))
+            tempPath = None
+        except Exception:
+            # any failure (including e.g. RecursionError when pickling) only
+            # means that the chart is not cached
+            return
+        finally:
+            if tempPath is not None:
+                try:
+                    os.unlink(tempPath)
+                except OSError:
+                    pass
+        if self.size is not None:
+            self.size += fileSize
+        if self.size is None or self.size > self.maxSize:
+            self.evict()
+
+    # removes stale temporary files and least recently used files until the
+    # cache fits into maxSize
+    def evict(self):
+        entries = []
+        totalSize = 0
+        now = time.time()
+        try:
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if name.endswith(TEMP_SUFFIX):
+                    try:
+                        if now - os.stat(path).st_mtime > STALE_TEMP_AGE:
+                            os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                if not name.endswith(CACHE_SUFFIX):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                totalSize += stat.st_size
+        except OSError:
+            return
+        self.size = totalSize
+
+        entries.sort()
+        for (mtime, size, path) in entries:
+            if totalSize <= self.maxSize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            totalSize -= size
+        self.size = totalSize
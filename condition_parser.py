@@ -21,8 +21,10 @@ Created on Sun Nov  9 09:35:20 2014
 @author: pavla
 """
 
-from ply import lex, yacc
-import os
+import sys, threading, parser_tables
+from copy import copy
+from expressions import (Number, Name, Unary, Binary, Paren, Index,
+                         makeOperation, TRUE, FALSE)
 
 tokens = ("RIGHT_OP", "LEFT_OP", "AND_OP", "OR_OP", "LE_OP", "GE_OP", "EQ_OP",
           "NE_OP", "LBRACKET", "RBRACKET", "NUMBER", "IDENTIFIER")
@@ -51,6 +53,10 @@ def t_newline(t):
 def t_error(t):
     raise TypeError("Unknown text '%s'" % t.value)
 
+# identifiers true and false are the shared constants, recognized by the
+# planarization and the optimizations
+CONSTANTS = {"true":TRUE, "false":FALSE}
+
 def p_start(p):
     """start : empty
              | logical_or_expression"""
@@ -69,7 +75,7 @@ def p_logical_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' or ' + p[3]
+        p[0] = makeOperation("or", p[1], p[3])
 
 def p_logical_and_expression(p):
     """logical_and_expression : inclusive_or_expression
@@ -77,7 +83,7 @@ def p_logical_and_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' and ' + p[3]
+        p[0] = makeOperation("and", p[1], p[3])
 
 def p_inclusive_or_expression(p):
     """inclusive_or_expression : exclusive_or_expression
@@ -85,7 +91,7 @@ def p_inclusive_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_exclusive_or_expression(p):
     """exclusive_or_expression : and_expression
@@ -93,7 +99,7 @@ def p_exclusive_or_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_and_expression(p):
     """and_expression : equality_expression
@@ -101,7 +107,7 @@ def p_and_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_equality_expression(p):
     """equality_expression : relational_expression
@@ -110,7 +116,7 @@ def p_equality_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
  
 def p_relational_expression(p):
     """relational_expression : shift_expression
@@ -121,7 +127,7 @@ def p_relational_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
 
 def p_shift_expression(p):
     """shift_expression : additive_expression
@@ -130,7 +136,7 @@ def p_shift_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = Binary(p[2], p[1], p[3])
 
 def p_additive_expression(p):
     """additive_expression : multiplicative_expression
@@ -139,7 +145,7 @@ def p_additive_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_multiplicative_expression(p):
     """multiplicative_expression : unary_expression
@@ -149,7 +155,7 @@ def p_multiplicative_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = p[1] + ' ' + p[2] + ' ' + p[3]
+        p[0] = makeOperation(p[2], p[1], p[3])
 
 def p_unary_expression(p):
     """unary_expression : primary_expression
@@ -160,44 +166,50 @@ def p_unary_expression(p):
     elif len(p) == 3 and p[1] == '+':
         p[0] = p[2]
     elif len(p) == 3:
-        p[0] = p[1] + p[2]
+        p[0] = Unary(p[1], p[2])
     else:
-        p[0] = p[1] + p[2] + p[3] + p[4]
+        p[0] = Index(p[1], Number(p[3]))
 
 def p_unary_operator(p):
     """unary_operator : '+'
                       | '-'
                       | '~'
                       | '!'"""
-    if p[1] == '-' or p[1] == '~':
-        p[0] = p[1]
-    if p[1] == '!':
-        p[0] = ' not '
+    p[0] = p[1]
 
 def p_primary_expression(p):
     """primary_expression : IDENTIFIER
                           | NUMBER
                           | '(' logical_or_expression ')'"""
-    if len(p) == 2:
-        p[0] = p[1]
+    if len(p) == 2 and p.slice[1].type == "NUMBER":
+        p[0] = Number(p[1])
+    elif len(p) == 2 and p[1] in CONSTANTS:
+        p[0] = CONSTANTS[p[1]]
+    elif len(p) == 2:
+        p[0] = Name(p[1])
     else: 
-        p[0] = p[1] + p[2] + p[3]
+        p[0] = Paren(p[2])
 
 def p_error(p):
     if p is None:
         raise ValueError("Unknown error")
     raise ValueError("Syntax error, line %s: %s" % (p.lineno, p.type))
 
-directory = os.path.join(os.path.dirname(__file__), 
-                         "parser_tables", 
-                         os.path.basename(__file__).rsplit('.', 1)[0])
-try:
-    os.makedirs(directory, exist_ok=True)
-except OSError:
-    pass
-
-lexer = lex.lex(debug=False, optimize=True, outputdir=directory)
-parser = yacc.yacc(debug=False, optimize=True, outputdir=directory)
-
-def parse(text, lexer=lexer):
-    return (parser.parse(text, lexer))
+lexer = None
+parser = None
+lock = threading.Lock()
+
+# lexer and parser are created when first needed
+def getParser():
+    global lexer, parser
+    with lock:
+        if parser is None:
+            (lexer, parser) = parser_tables.buildParser(sys.modules[__name__])
+    return (lexer, parser)
+
+def parse(text, lexer=None):
+    (defaultLexer, defaultParser) = getParser()
+    if lexer is None:
+        lexer = defaultLexer.clone()
+    # the parser keeps some state of the parse in its attributes
+    return (copy(defaultParser).parse(text, lexer))
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Model of DVE source (global variables, processes with variables, states and
+transitions) and its serializer. Guards and effects are lists of
+expressions (see expressions.py) or strings. Processes of a model and
+transitions of a process may be given by generators, then the model can be
+written only once.
+"""
+
+from collections import OrderedDict
+
+# number of parts of the text joined and written at once
+BUFFER_PARTS = 8192
+# number of texts of expressions remembered by the writer
+WRITER_TEXTS = 1024
+
+class Variable:
+    varType = None
+    name = None
+    init = None
+    isInput = False
+    isConst = False
+
+    def __init__(self, varType, name, init=None, isInput=False,
+                 isConst=False):
+        self.varType = varType
+        self.name = name
+        self.init = init
+        self.isInput = isInput
+        self.isConst = isConst
+
+class Transition:
+    source = None
+    destination = None
+    guard = None
+    effect = None
+
+    def __init__(self, source, destination, guard=(), effect=()):
+        self.source = source
+        self.destination = destination
+        self.guard = guard
+        self.effect = effect
+
+# states - names of the states
+# init - name of the initial state
+# transitions - iterable of transitions
+class Process:
+    name = None
+    variables = None
+    states = None
+    init = None
+    transitions = None
+
+    def __init__(self, name, variables, states, init, transitions):
+        self.name = name
+        self.variables = variables
+        self.states = states
+        self.init = init
+        self.transitions = transitions
+
+# variables - global variables
+# processes - iterable of processes
+class Model:
+    variables = None
+    processes = None
+    system = "async"
+
+    def __init__(self, variables, processes):
+        self.variables = variables
+        self.processes = processes
+
+# Texts of expressions; expressions shared by more transitions (e.g. negated
+# guards of transitions with higher priority) are serialized only once.
+# With maxSize, only the texts of the last maxSize expressions are kept, as
+# the shared expressions are mostly used by consecutive transitions.
+class ExpressionTexts:
+    # id of expression = (expression, text)
+    texts = None
+    maxSize = None
+
+    def __init__(self, maxSize=None):
+        self.texts = OrderedDict()
+        self.maxSize = maxSize
+
+    def get(self, expr):
+        if isinstance(expr, str):
+            return expr
+        entry = self.texts.get(id(expr))
+        if entry is None:
+            # keeping the expression, so that its id is not reused while
+            # the text is remembered
+            entry = (expr, str(expr))
+            self.texts[id(expr)] = entry
+            if self.maxSize is not None and len(self.texts) > self.maxSize:
+                self.texts.popitem(last=False)
+        return entry[1]
+
+    def join(self, expressions):
+        return ", ".join([self.get(expr) for expr in expressions])
+
+# Buffered writer of the DVE text.
+class Writer:
+    outfile = None
+    parts = None
+    texts = None
+
+    def __init__(self, outfile):
+        self.outfile = outfile
+        self.parts = []
+        self.texts = ExpressionTexts(WRITER_TEXTS)
+
+    def write(self, text):
+        self.parts.append(text)
+        if len(self.parts) >= BUFFER_PARTS:
+            self.flush()
+
+    def flush(self):
+        self.outfile.write("".join(self.parts))
+        self.parts = []
+
+    def writeVariable(self, variable, indent):
+        self.write(indent)
+        if variable.isInput:
+            self.write("input ")
+        if variable.isConst:
+            self.write("const ")
+        self.write("%s %s" % (variable.varType, variable.name))
+        if variable.init is not None and variable.init != "":
+            self.write(" = %s" % variable.init)
+        self.write(";\n")
+
+    def writeTransition(self, transition):
+        self.write("\t\t%s -> %s {" % (transition.source,
+                                       transition.destination))
+        if transition.guard:
+            self.write(" guard %s;" % self.texts.join(transition.guard))
+        if transition.effect:
+            self.write(" effect %s;" % self.texts.join(transition.effect))
+        self.write(" }\n")
+
+    def writeProcess(self, process):
+        self.write("process %s {\n" % process.name)
+        for variable in process.variables:
+            self.writeVariable(variable, "\t")
+        self.write("\tstate %s;\n" % ", ".join(process.states))
+        self.write("\tinit %s;\n" % process.init)
+        first = True
+        for transition in process.transitions:
+            if first:
+                self.write("\ttrans\n")
+                first = False
+            self.writeTransition(transition)
+        self.write("}\n\n")
+        # texts of the expressions are not shared between processes
+        self.texts = ExpressionTexts(WRITER_TEXTS)
+
+    def writeModel(self, model):
+        for variable in model.variables:
+            self.writeVariable(variable, "")
+        if model.variables:
+            self.write("\n")
+        for process in model.processes:
+            self.writeProcess(process)
+        self.write("system %s;\n\n" % model.system)
+        self.flush()
+
+# Writes given model as DVE source to outfile.
+def writeModel(model, outfile):
+    Writer(outfile).writeModel(model)
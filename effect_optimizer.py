@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Optimization of the effects of the planarized transitions. Actions of an
+effect are executed one after another, so a value assigned to a variable
+is known to the following actions (constant propagation) and an assignment
+overwritten before the variable is read is useless (dead-store
+elimination). Only assignments to simple variables are optimized; other
+actions (assignments to array elements, nested assignments) are barriers.
+Assignments whose evaluation may fail are never removed.
+"""
+
+from expressions import Expression, Assign, Name, Number, Paren, Binary, \
+                        Chain, Index, getFields
+from feasibility import TYPE_DOMAINS
+
+# operators folded when both operands are constants
+FOLDED_OPERATORS = {"+":lambda a, b: a + b, "-":lambda a, b: a - b,
+                    "*":lambda a, b: a * b}
+
+# largest folded value (results of the folding fit into int of DVE)
+MAX_FOLDED = 32767
+
+def containsAssign(expr):
+    if isinstance(expr, Assign):
+        return True
+    for value in getFields(expr):
+        if isinstance(value, tuple):
+            if any(containsAssign(item) for item in value):
+                return True
+        elif isinstance(value, Expression) and containsAssign(value):
+            return True
+    return False
+
+# Returns True if evaluation of given expression may fail in DiVinE
+# (division by zero, index out of bounds).
+def mayFail(expr):
+    if isinstance(expr, Index):
+        return True
+    if isinstance(expr, Binary) and expr.op in ("/", "%"):
+        return True
+    for value in getFields(expr):
+        if isinstance(value, tuple):
+            if any(mayFail(item) for item in value):
+                return True
+        elif isinstance(value, Expression) and mayFail(value):
+            return True
+    return False
+
+# assignment of a side-effect free expression to a simple variable
+def isSimpleAssign(action):
+    return (isinstance(action, Assign) and isinstance(action.target, Name) and
+            not containsAssign(action.value))
+
+def addNames(expr, names):
+    if isinstance(expr, Name):
+        names.add(expr.name)
+    for value in getFields(expr):
+        if isinstance(value, tuple):
+            for item in value:
+                addNames(item, names)
+        elif isinstance(value, Expression):
+            addNames(value, names)
+
+def getConstant(expr):
+    while isinstance(expr, Paren):
+        expr = expr.expr
+    if isinstance(expr, Number) and expr.value.isdigit():
+        return int(expr.value)
+    return None
+
+# Returns given expression with known variables replaced by their values and
+# operations on constants folded.
+def propagate(expr, constants):
+    if isinstance(expr, Name):
+        if expr.name in constants:
+            return Number(str(constants[expr.name]))
+        return expr
+
+    fields = getFields(expr)
+    newFields = []
+    for value in fields:
+        if isinstance(value, tuple):
+            value = tuple(propagate(item, constants) for item in value)
+        elif isinstance(value, Expression):
+            value = propagate(value, constants)
+        newFields.append(value)
+    if any(new is not old for (new, old) in zip(newFields, fields)):
+        expr = type(expr)(*newFields)
+
+    if isinstance(expr, Paren) and getConstant(expr) is not None:
+        return expr.expr
+    if isinstance(expr, Binary) and expr.op in FOLDED_OPERATORS:
+        left = getConstant(expr.left)
+        right = getConstant(expr.right)
+        if left is not None and right is not None:
+            result = FOLDED_OPERATORS[expr.op](left, right)
+            if 0 <= result <= MAX_FOLDED:
+                return Number(str(result))
+    if isinstance(expr, Chain) and expr.op in FOLDED_OPERATORS:
+        # operands are evaluated from the left, so only the constants at
+        # the beginning of the chain are folded
+        value = getConstant(expr.items[0])
+        folded = 1
+        while value is not None and folded < len(expr.items):
+            right = getConstant(expr.items[folded])
+            if right is None:
+                break
+            result = FOLDED_OPERATORS[expr.op](value, right)
+            if not 0 <= result <= MAX_FOLDED:
+                break
+            value = result
+            folded += 1
+        if folded == len(expr.items):
+            return Number(str(value))
+        if folded > 1:
+            return Chain(expr.op, (Number(str(value)),) + expr.items[folded:])
+    return expr
+
+# Returns optimized list of actions of one effect.
+# variables - variables of the chart, values are propagated only for
+#             variables of known types
+def optimizeActions(actions, variables):
+    # constant propagation
+    constants = {}
+    propagated = []
+    for action in actions:
+        if not isSimpleAssign(action):
+            constants = {}
+            propagated.append(action)
+            continue
+        varName = action.target.name
+        value = propagate(action.value, constants)
+        if value is not action.value:
+            action = Assign(action.target, value)
+        propagated.append(action)
+
+        constant = getConstant(value)
+        varDef = variables.get(varName)
+        if (constant is not None and varDef is not None and
+            varDef["type"] in TYPE_DOMAINS and
+            TYPE_DOMAINS[varDef["type"]][0] <= constant
+                                           <= TYPE_DOMAINS[varDef["type"]][1]):
+            constants[varName] = constant
+        else:
+            constants.pop(varName, None)
+
+    # dead-store elimination, overwritten - variables assigned later without
+    # being read before
+    overwritten = set()
+    optimized = []
+    for action in reversed(propagated):
+        if isSimpleAssign(action):
+            varName = action.target.name
+            if varName in overwritten and not mayFail(action.value):
+                continue
+            overwritten.add(varName)
+            readNames = set()
+            addNames(action.value, readNames)
+            overwritten -= readNames
+        elif isinstance(action, Expression):
+            readNames = set()
+            addNames(action, readNames)
+            overwritten -= readNames
+        else:
+            overwritten = set()
+        optimized.append(action)
+    optimized.reverse()
+    return optimized
+
+# Optimizes effects of the transitions and during actions of given planarized
+# charts. Transitions with the same segments of actions share the optimized
+# segment.
+def optimizeEffects(charts):
+    for chart in charts:
+        # segments = optimized segments
+        optimized = {}
+        for trans in chart.transitions:
+            if trans.segments not in optimized:
+                optimized[trans.segments] = chart.getSegments(
+                    optimizeActions(trans.getActions(), chart.variables))
+            trans.segments = optimized[trans.segments]
+        for state in chart.states.values():
+            state.du = tuple(optimizeActions(state.du, chart.variables))
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Expression trees built by the parsers of conditions and actions. The trees
+are serialized to DVE only when written, str() of a node gives its DVE text.
+Subtrees are shared (e.g. the left side of compound assignments), nodes must
+not be modified after they are created.
+"""
+
+# base class of the expression nodes
+# write(parts) appends DVE text of the node to the list parts
+# replaceInNames(old, new) returns the node with old replaced by new in names
+# of variables; unchanged subtrees are shared
+class Expression:
+    __slots__ = ()
+
+    def __str__(self):
+        parts = []
+        self.write(parts)
+        return "".join(parts)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, str(self))
+
+    def replaceInNames(self, old, new):
+        return self
+
+# constants true and false, equal by value
+class Constant(Expression):
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def write(self, parts):
+        parts.append(self.value)
+
+    def __eq__(self, other):
+        if not isinstance(other, Constant):
+            return NotImplemented
+        return self.value == other.value
+
+    def __ne__(self, other):
+        if not isinstance(other, Constant):
+            return NotImplemented
+        return self.value != other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+TRUE = Constant("true")
+FALSE = Constant("false")
+
+class Number(Expression):
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def write(self, parts):
+        parts.append(self.value)
+
+# name of a variable
+class Name(Expression):
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def write(self, parts):
+        parts.append(self.name)
+
+    def replaceInNames(self, old, new):
+        if old in self.name:
+            return Name(self.name.replace(old, new))
+        return self
+
+# unary operators -, ~ and ! (written as not)
+class Unary(Expression):
+    __slots__ = ("op", "operand")
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+    def write(self, parts):
+        if self.op == "!":
+            parts.append("not ")
+        else:
+            parts.append(self.op)
+        self.operand.write(parts)
+
+    def replaceInNames(self, old, new):
+        operand = self.operand.replaceInNames(old, new)
+        if operand is self.operand:
+            return self
+        return Unary(self.op, operand)
+
+# binary operators, op is the DVE operator (e.g. "and", "or", "==", "+")
+class Binary(Expression):
+    __slots__ = ("op", "left", "right")
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def write(self, parts):
+        self.left.write(parts)
+        parts.append(" %s " % self.op)
+        self.right.write(parts)
+
+    def replaceInNames(self, old, new):
+        left = self.left.replaceInNames(old, new)
+        right = self.right.replaceInNames(old, new)
+        if left is self.left and right is self.right:
+            return self
+        return Binary(self.op, left, right)
+
+# operands joined by the same associative operator, a op b op c; long
+# chains (e.g. guards with many conditions) are kept flat, so that the
+# depth of the tree doesn't grow with their length
+class Chain(Expression):
+    __slots__ = ("op", "items")
+
+    def __init__(self, op, items):
+        self.op = op
+        self.items = items
+
+    def write(self, parts):
+        separator = " %s " % self.op
+        for i, item in enumerate(self.items):
+            if i > 0:
+                parts.append(separator)
+            item.write(parts)
+
+    def replaceInNames(self, old, new):
+        items = tuple(item.replaceInNames(old, new) for item in self.items)
+        if all(item is oldItem for (item, oldItem) in zip(items, self.items)):
+            return self
+        return Chain(self.op, items)
+
+# operators whose operands are joined into one chain
+ASSOCIATIVE_OPERATORS = frozenset(["and", "or", "|", "^", "&", "+", "*"])
+
+# Returns left op right; operands of associative operators are appended to
+# the chain of the left operand. Other operators give Binary.
+def makeOperation(op, left, right):
+    if op not in ASSOCIATIVE_OPERATORS:
+        return Binary(op, left, right)
+    if isinstance(left, Chain) and left.op == op:
+        return Chain(op, left.items + (right,))
+    return Chain(op, (left, right))
+
+class Paren(Expression):
+    __slots__ = ("expr",)
+
+    def __init__(self, expr):
+        self.expr = expr
+
+    def write(self, parts):
+        parts.append("(")
+        self.expr.write(parts)
+        parts.append(")")
+
+    def replaceInNames(self, old, new):
+        expr = self.expr.replaceInNames(old, new)
+        if expr is self.expr:
+            return self
+        return Paren(expr)
+
+# element of an array
+class Index(Expression):
+    __slots__ = ("base", "index")
+
+    def __init__(self, base, index):
+        self.base = base
+        self.index = index
+
+    def write(self, parts):
+        self.base.write(parts)
+        parts.append("[")
+        self.index.write(parts)
+        parts.append("]")
+
+    def replaceInNames(self, old, new):
+        base = self.base.replaceInNames(old, new)
+        index = self.index.replaceInNames(old, new)
+        if base is self.base and index is self.index:
+            return self
+        return Index(base, index)
+
+class Assign(Expression):
+    __slots__ = ("target", "value")
+
+    def __init__(self, target, value):
+        self.target = target
+        self.value = value
+
+    def write(self, parts):
+        self.target.write(parts)
+        parts.append(" = ")
+        self.value.write(parts)
+
+    def replaceInNames(self, old, new):
+        target = self.target.replaceInNames(old, new)
+        value = self.value.replaceInNames(old, new)
+        if target is self.target and value is self.value:
+            return self
+        return Assign(target, value)
+
+# comma separated expressions (within parentheses, as the top-level ones are
+# split into separate actions)
+class Comma(Expression):
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def write(self, parts):
+        for i, item in enumerate(self.items):
+            if i > 0:
+                parts.append(", ")
+            item.write(parts)
+
+    def replaceInNames(self, old, new):
+        items = tuple(item.replaceInNames(old, new) for item in self.items)
+        if all(item is oldItem for (item, oldItem) in zip(items, self.items)):
+            return self
+        return Comma(items)
+
+# initializer of an array, {a, b, ...}
+class InitList(Comma):
+    __slots__ = ()
+
+    def write(self, parts):
+        parts.append("{")
+        Comma.write(self, parts)
+        parts.append("}")
+
+    def replaceInNames(self, old, new):
+        replaced = Comma.replaceInNames(self, old, new)
+        if replaced is self:
+            return self
+        return InitList(replaced.items)
+
+# negation of a condition, not (condition)
+class Negation(Expression):
+    __slots__ = ("expr",)
+
+    def __init__(self, expr):
+        self.expr = expr
+
+    def write(self, parts):
+        parts.append("not (")
+        self.expr.write(parts)
+        parts.append(")")
+
+    def replaceInNames(self, old, new):
+        expr = self.expr.replaceInNames(old, new)
+        if expr is self.expr:
+            return self
+        return Negation(expr)
+
+# disjunction of conditions, a or b or ...
+class Disjunction(Expression):
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def write(self, parts):
+        for i, item in enumerate(self.items):
+            if i > 0:
+                parts.append(" or ")
+            item.write(parts)
+
+    def replaceInNames(self, old, new):
+        items = tuple(item.replaceInNames(old, new) for item in self.items)
+        if all(item is oldItem for (item, oldItem) in zip(items, self.items)):
+            return self
+        return Disjunction(items)
+
+# Returns values of the slots of given node (operators, names and operands),
+# in the order of the arguments of its constructor.
+def getFields(expr):
+    return [getattr(expr, slot) for cls in reversed(type(expr).__mro__)
+            for slot in getattr(cls, "__slots__", ())]
@@ -25,4 +25,16 @@ Created on Sun Nov 30 19:59:18 2014
 class notSupportedException(Exception): pass
 
 class invalidInputException(Exception): pass
-    
\ No newline at end of file
+
+# exception for outputs that would exceed a limit given by the user
+class limitExceededException(Exception): pass
+    
+# exception for more problems of the input found at once
+# problems - list of notSupportedException and invalidInputException
+class inputProblemsException(Exception):
+    def __init__(self, problems):
+        Exception.__init__(self, problems)
+        self.problems = problems
+
+    def __str__(self):
+        return "; ".join(str(problem) for problem in self.problems)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Removal of planarized transitions whose conditions can never hold. Every
+variable has an interval of possible values (given by its type, by its
+initial value if it is never assigned, or by the range of process
+feed_inputs); comparisons of variables with constants restrict the
+intervals and a transition is infeasible if some clause of its conditions
+can't be satisfied within them.
+"""
+
+import re
+from expressions import Expression, Assign, Index, Name, getFields
+from guard_simplifier import Atoms, toClauses
+
+# domains of the DVE types
+TYPE_DOMAINS = {"byte":(0, 255), "int":(-32768, 32767)}
+
+# range of byte inputs assigned by process feed_inputs
+FEED_BYTE_RANGE = (0, 1)
+
+INTEGER_RE = re.compile(r"^-?[0-9]+$")
+
+def getInteger(string):
+    if INTEGER_RE.match(string):
+        return int(string)
+    return None
+
+# Adds names of variables assigned in given expression (or in its
+# subexpressions) to the set names.
+def addAssignedNames(expr, names):
+    if not isinstance(expr, Expression):
+        return
+    if isinstance(expr, Assign):
+        target = expr.target
+        while isinstance(target, Index):
+            target = target.base
+        if isinstance(target, Name):
+            names.add(target.name)
+    for value in getFields(expr):
+        if isinstance(value, tuple):
+            for item in value:
+                addAssignedNames(item, names)
+        else:
+            addAssignedNames(value, names)
+
+def getAssignedNames(chart):
+    names = set()
+    for trans in chart.transitions:
+        for action in trans.getActions():
+            addAssignedNames(action, names)
+    for state in chart.states.values():
+        for action in state.en + state.du + state.ex:
+            addAssignedNames(action, names)
+    return names
+
+# Returns intervals of values of the variables of given chart.
+# assignedNames - variables assigned by actions of any chart (inputs are
+#                 global)
+def getDomains(chart, input_values, assignedNames):
+    assigned = getAssignedNames(chart)
+    domains = {}
+    for varName, varDef in chart.variables.items():
+        if varDef["type"] not in TYPE_DOMAINS:
+            continue
+        domain = TYPE_DOMAINS[varDef["type"]]
+        init = varDef["init"]
+        if init is None or str(init) == "":
+            initValue = 0
+        else:
+            initValue = getInteger(str(init))
+
+        if varDef["scope"] == "input":
+            if input_values is not None and varName not in assignedNames:
+                # inputs are global variables, 0 until they are fed
+                if varDef["type"] == "byte":
+                    feedRange = FEED_BYTE_RANGE
+                else:
+                    feedRange = input_values
+                domain = (min(feedRange[0], 0), max(feedRange[1], 0))
+        elif varDef["const"] or varName not in assigned:
+            if initValue is not None:
+                domain = (initValue, initValue)
+        domains[varName] = domain
+    return domains
+
+# Returns the restriction given by literal as (variable, low, high, excluded
+# value), True or False (for comparisons of constants) or None (literal is
+# not a comparison of a variable with a constant).
+def getRestriction(literal, domains):
+    (key, positive) = literal
+    if key[0] == "atom":
+        return None
+    (op, left, right) = key
+    leftValue = getInteger(left)
+    rightValue = getInteger(right)
+    if leftValue is not None and rightValue is not None:
+        if op == "<":
+            return (leftValue < rightValue) == positive
+        return (leftValue == rightValue) == positive
+
+    if left in domains and rightValue is not None:
+        (varName, value, varOnLeft) = (left, rightValue, True)
+    elif right in domains and leftValue is not None:
+        (varName, value, varOnLeft) = (right, leftValue, False)
+    else:
+        return None
+
+    if op == "==":
+        if positive:
+            return (varName, value, value, None)
+        return (varName, None, None, value)
+    if varOnLeft == positive:
+        # var < value or not (value < var)
+        if positive:
+            return (varName, None, value - 1, None)
+        return (varName, None, value, None)
+    # value < var or not (var < value)
+    if positive:
+        return (varName, value + 1, None, None)
+    return (varName, value, None, None)
+
+# Returns given interval restricted by given restriction, None if empty.
+def restrict(interval, restriction):
+    (varName, low, high, excluded) = restriction
+    (intervalLow, intervalHigh) = interval
+    if low is not None:
+        intervalLow = max(intervalLow, low)
+    if high is not None:
+        intervalHigh = min(intervalHigh, high)
+    if excluded is not None:
+        if intervalLow == excluded:
+            intervalLow += 1
+        if intervalHigh == excluded:
+            intervalHigh -= 1
+    if intervalLow > intervalHigh:
+        return None
+    return (intervalLow, intervalHigh)
+
+# Returns False if given conditions can't hold for values within given
+# domains, True otherwise.
+def isFeasible(conditions, domains):
+    atoms = Atoms()
+    clauses = []
+    for cond in conditions:
+        clauses.extend(toClauses(cond, True, atoms))
+    clauses = [[getRestriction(literal, domains) for literal in clause]
+               for clause in clauses]
+
+    intervals = {}
+    changed = True
+    while changed:
+        changed = False
+        for clause in clauses:
+            satisfiable = []
+            for restriction in clause:
+                if restriction is None or restriction is True:
+                    satisfiable.append(restriction)
+                elif restriction is not False:
+                    varName = restriction[0]
+                    interval = intervals.get(varName, domains[varName])
+                    if restrict(interval, restriction) is not None:
+                        satisfiable.append(restriction)
+            if satisfiable == []:
+                return False
+            if len(satisfiable) == 1 and isinstance(satisfiable[0], tuple):
+                varName = satisfiable[0][0]
+                interval = intervals.get(varName, domains[varName])
+                restricted = restrict(interval, satisfiable[0])
+                if restricted != interval:
+                    intervals[varName] = restricted
+                    changed = True
+    return True
+
+# Removes transitions with infeasible conditions from given planarized
+# charts.
+def pruneInfeasible(charts, input_values):
+    assignedNames = set()
+    for chart in charts:
+        assignedNames.update(getAssignedNames(chart))
+
+    for chart in charts:
+        domains = getDomains(chart, input_values, assignedNames)
+        chart.setTransitions([trans for trans in chart.transitions
+                              if isFeasible(trans.conditions, domains)])
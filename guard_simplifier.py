@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Simplification of guards of the planarized transitions. A guard (list of
+conditions, all of which must hold) is converted to a conjunction of
+clauses, each clause being a disjunction of literals. Constants are folded,
+duplicate literals and clauses are removed, clauses containing complementary
+literals are dropped as tautologies, clauses implied by other clauses are
+absorbed and complementary unit clauses make the whole guard false.
+"""
+
+from expressions import (Constant, Number, Unary, Binary, Chain, Paren,
+                         Negation, Disjunction)
+
+# complementary relational operators (on integers)
+COMPLEMENTS = {"<":">=", ">=":"<", ">":"<=", "<=":">", "==":"!=", "!=":"=="}
+
+# relational operators expressed by "<" and "==": operator = (canonical
+# operator, swap operands, positive)
+CANONICAL = {"<":("<", False, True), ">":("<", True, True),
+             ">=":("<", False, False), "<=":("<", True, False),
+             "==":("==", False, True), "!=":("==", False, False)}
+
+# atoms of the literals
+# atom key = {polarity = expression of the literal}
+class Atoms:
+    expressions = None
+
+    def __init__(self):
+        self.expressions = {}
+
+    # returns key of the atom of given comparison and polarity of the
+    # comparison relative to the atom
+    def addComparison(self, expr):
+        (op, swap, positive) = CANONICAL[expr.op]
+        left = str(expr.left)
+        right = str(expr.right)
+        if swap:
+            (left, right) = (right, left)
+        if op == "==" and right < left:
+            (left, right) = (right, left)
+        key = (op, left, right)
+        if key not in self.expressions:
+            # keeping orientation of the first occurrence
+            self.expressions[key] = {
+                positive:expr,
+                not positive:Binary(COMPLEMENTS[expr.op], expr.left,
+                                    expr.right)
+            }
+        return (key, positive)
+
+    def addOther(self, expr):
+        key = ("atom", str(expr))
+        if key not in self.expressions:
+            self.expressions[key] = {True:expr, False:Negation(expr)}
+        return key
+
+    def getExpression(self, literal):
+        return self.expressions[literal[0]][literal[1]]
+
+# Converts expression with given polarity to list of clauses (lists of
+# literals). An empty list of clauses is true, an empty clause is false.
+def toClauses(expr, positive, atoms):
+    while isinstance(expr, Paren):
+        expr = expr.expr
+
+    if isinstance(expr, Constant):
+        value = expr.value == "true"
+        if value == positive:
+            return []
+        return [[]]
+
+    if isinstance(expr, Number) and expr.value.isdigit():
+        value = int(expr.value) != 0
+        if value == positive:
+            return []
+        return [[]]
+
+    if isinstance(expr, Unary) and expr.op == "!":
+        return toClauses(expr.operand, not positive, atoms)
+    if isinstance(expr, Negation):
+        return toClauses(expr.expr, not positive, atoms)
+
+    if isinstance(expr, Chain) and expr.op in ("and", "or"):
+        items = expr.items
+        conjunction = (expr.op == "and") == positive
+    elif isinstance(expr, Disjunction):
+        items = expr.items
+        conjunction = not positive
+    else:
+        items = None
+
+    if items is not None and conjunction:
+        clauses = []
+        for item in items:
+            clauses.extend(toClauses(item, positive, atoms))
+        return clauses
+
+    if items is not None:
+        clause = []
+        for item in items:
+            itemClauses = toClauses(item, positive, atoms)
+            if itemClauses == []:
+                # one of the disjuncts is true
+                return []
+            if len(itemClauses) != 1:
+                # not distributing conjunctions over disjunctions
+                clause = None
+                break
+            clause.extend(itemClauses[0])
+        if clause is not None:
+            return [clause]
+        return [[(atoms.addOther(expr), positive)]]
+
+    if isinstance(expr, Binary) and expr.op in CANONICAL:
+        (key, polarity) = atoms.addComparison(expr)
+        return [[(key, polarity == positive)]]
+
+    return [[(atoms.addOther(expr), positive)]]
+
+def complement(literal):
+    return (literal[0], not literal[1])
+
+# Simplifies list of clauses. Returns None if the clauses are unsatisfiable.
+def simplifyClauses(clauses):
+    # removing duplicate literals, tautologies and duplicate clauses
+    seen = set()
+    uniqueClauses = []
+    for clause in clauses:
+        literals = []
+        for literal in clause:
+            if literal not in literals:
+                literals.append(literal)
+        if any(complement(literal) in literals for literal in literals):
+            continue
+        if literals == []:
+            return None
+        key = frozenset(literals)
+        if key not in seen:
+            seen.add(key)
+            uniqueClauses.append(literals)
+    clauses = uniqueClauses
+
+    # unit propagation: clauses containing a unit literal are absorbed,
+    # complements of unit literals are removed from the clauses
+    units = set()
+    changed = True
+    while changed:
+        changed = False
+        for clause in clauses:
+            if len(clause) == 1 and clause[0] not in units:
+                if complement(clause[0]) in units:
+                    return None
+                units.add(clause[0])
+                changed = True
+        newClauses = []
+        for clause in clauses:
+            if len(clause) == 1:
+                newClauses.append(clause)
+                continue
+            if any(literal in units for literal in clause):
+                continue
+            reduced = [literal for literal in clause
+                       if complement(literal) not in units]
+            if reduced == []:
+                return None
+            if len(reduced) != len(clause):
+                changed = True
+            newClauses.append(reduced)
+        clauses = newClauses
+
+    # removing duplicate units and clauses subsumed by other clauses (clauses
+    # subsumed by units were already absorbed)
+    literalSets = [frozenset(clause) for clause in clauses if len(clause) > 1]
+    result = []
+    keptUnits = set()
+    for clause in clauses:
+        if len(clause) == 1:
+            if clause[0] not in keptUnits:
+                keptUnits.add(clause[0])
+                result.append(clause)
+            continue
+        literals = frozenset(clause)
+        if not any(other < literals for other in literalSets):
+            result.append(clause)
+    return result
+
+def literalToExpression(literal, atoms, inDisjunction):
+    expr = atoms.getExpression(literal)
+    if (inDisjunction and isinstance(expr, Chain) and
+        expr.op in ("and", "or")):
+        return Paren(expr)
+    return expr
+
+# Simplifies guard given as list of conditions (expressions). Returns list
+# of simplified conditions, or None if the guard can never hold.
+def simplifyGuard(conditions):
+    atoms = Atoms()
+    clauses = []
+    for cond in conditions:
+        clauses.extend(toClauses(cond, True, atoms))
+    clauses = simplifyClauses(clauses)
+    if clauses is None:
+        return None
+
+    simplified = []
+    for clause in clauses:
+        if len(clause) == 1:
+            simplified.append(literalToExpression(clause[0], atoms, False))
+        else:
+            simplified.append(Disjunction(tuple(
+                literalToExpression(literal, atoms, True)
+                for literal in clause)))
+    return simplified
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Lexer and parser tables of the label parsers, generated by build_tables.py
+and imported by the parsers when they are first used.
+"""
+
+import importlib
+from ply import lex, yacc
+
+# Returns True if the parser table tabmodule was generated from the current
+# grammar of given parser module. yacc itself doesn't check the signature of
+# the table in the optimized mode.
+def isTableCurrent(module, tabmodule):
+    try:
+        table = importlib.import_module(tabmodule)
+    except ImportError:
+        return False
+    reflect = yacc.ParserReflect(dict((key, getattr(module, key))
+                                      for key in dir(module)),
+                                 log=yacc.NullLogger())
+    reflect.get_all()
+    return getattr(table, "_lr_signature", None) == reflect.signature()
+
+# Returns True if the lexer table lextab was generated from the current
+# tokens and rules of given parser module. Like yacc, lex doesn't check the
+# table in the optimized mode; the table is compared with the rules as lex
+# would write them, without compiling the regular expressions.
+def isLexTableCurrent(module, lextab):
+    try:
+        table = importlib.import_module(lextab)
+    except ImportError:
+        return False
+    reflect = lex.LexerReflect(dict((key, getattr(module, key))
+                                    for key in dir(module)),
+                               log=yacc.NullLogger())
+    reflect.get_all()
+    literals = reflect.literals
+    if isinstance(literals, (list, tuple)):
+        literals = "".join(literals)
+    getName = lambda function: function.__name__ if function else None
+
+    # inclusive states share the rules, ignored characters and error rule
+    # of INITIAL
+    patterns = {}
+    ignore = dict(reflect.ignore)
+    errorf = dict(reflect.errorf)
+    for state in reflect.stateinfo:
+        patterns[state] = (["(?P<%s>%s)"
+                            % (name, getattr(function, "regex",
+                                             function.__doc__))
+                            for (name, function) in reflect.funcsym[state]] +
+                           ["(?P<%s>%s)" % (name, regex)
+                            for (name, regex) in reflect.strsym[state]])
+    for state, stateType in reflect.stateinfo.items():
+        if stateType != "inclusive":
+            continue
+        if state != "INITIAL":
+            patterns[state] = patterns[state] + patterns["INITIAL"]
+        ignore.setdefault(state, ignore.get("INITIAL", ""))
+        errorf.setdefault(state, errorf.get("INITIAL"))
+
+    try:
+        tablePatterns = dict((state, "|".join(pattern for (pattern, names)
+                                              in statePatterns))
+                             for (state, statePatterns)
+                             in table._lexstatere.items())
+        return (table._tabversion == lex.__tabversion__ and
+                table._lextokens == set(reflect.tokens) and
+                table._lexliterals == literals and
+                table._lexstateinfo == reflect.stateinfo and
+                tablePatterns == dict((state, "|".join(statePatterns))
+                                      for (state, statePatterns)
+                                      in patterns.items()) and
+                table._lexstateignore == ignore and
+                table._lexstateerrorf == dict((state, getName(function))
+                                              for (state, function)
+                                              in errorf.items()) and
+                table._lexstateeoff == dict((state, getName(function))
+                                            for (state, function)
+                                            in reflect.eoff.items()))
+    except AttributeError:
+        return False
+
+# Builds lexer and parser of given parser module from the tables in this
+# package. If the tables are missing or outdated, they are generated in
+# memory and written to this package only if write is True (as done by
+# build_tables.py), so that nothing is written at run time.
+def buildParser(module, write=False):
+    name = module.__name__
+    if write:
+        errorlog = None
+    else:
+        errorlog = yacc.NullLogger()
+
+    lextab = "%s.%s_lextab" % (__name__, name)
+    # lex writes the missing table in optimized mode (build_tables.py
+    # removes the tables first)
+    lexOptimize = write or isLexTableCurrent(module, lextab)
+    lexer = lex.lex(module=module, debug=False, optimize=lexOptimize,
+                    lextab=lextab, errorlog=errorlog)
+    parsetab = "%s.%s_parsetab" % (__name__, name)
+    parser = yacc.yacc(module=module, debug=False,
+                       optimize=isTableCurrent(module, parsetab),
+                       tabmodule=parsetab, write_tables=write,
+                       errorlog=errorlog)
+    return (lexer, parser)
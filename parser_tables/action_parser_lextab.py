@@ -0,0 +1,10 @@
+# action_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD_ASSIGN', 'AND_ASSIGN', 'AND_OP', 'BOOL', 'CHAR', 'COLON_ASSIGN', 'CONST', 'DEC_OP', 'DIV_ASSIGN', 'EQ_OP', 'GE_OP', 'IDENTIFIER', 'INC_OP', 'INT', 'INT16', 'INT32', 'INT8', 'LBRACE', 'LBRACKET', 'LEFT_ASSIGN', 'LEFT_OP', 'LE_OP', 'LONG', 'MOD_ASSIGN', 'MUL_ASSIGN', 'NEWLINE', 'NE_OP', 'NUMBER', 'OR_ASSIGN', 'OR_OP', 'RBRACE', 'RBRACKET', 'RIGHT_ASSIGN', 'RIGHT_OP', 'SHORT', 'SIGNED', 'SUB_ASSIGN', 'UINT16', 'UINT32', 'UINT8', 'UNSIGNED', 'XOR_ASSIGN'))
+_lexreflags   = 64
+_lexliterals  = ';,:=()&!~-+*/%<>^|?@'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_NEWLINE>\\n)|(?P<t_ignore_COMMENT>(//.*)|(/\\*(.|\\n)*?\\*/))|(?P<t_LBRACKET>(\\[|<:))|(?P<t_RBRACKET>(\\]|:>))|(?P<t_LBRACE>({|<%))|(?P<t_NUMBER>[0-9]+)|(?P<t_RBRACE>(}|%>))|(?P<t_INC_OP>\\+\\+)|(?P<t_OR_OP>\\|\\|)|(?P<t_ADD_ASSIGN>\\+=)|(?P<t_LEFT_ASSIGN><<=)|(?P<t_MUL_ASSIGN>\\*=)|(?P<t_OR_ASSIGN>\\|=)|(?P<t_RIGHT_ASSIGN>>>=)|(?P<t_AND_ASSIGN>&=)|(?P<t_AND_OP>&&)|(?P<t_COLON_ASSIGN>:=)|(?P<t_DEC_OP>--)|(?P<t_DIV_ASSIGN>/=)|(?P<t_EQ_OP>==)|(?P<t_GE_OP>>=)|(?P<t_LEFT_OP><<)|(?P<t_LE_OP><=)|(?P<t_MOD_ASSIGN>%=)|(?P<t_NE_OP>!=)|(?P<t_RIGHT_OP>>>)|(?P<t_SUB_ASSIGN>-=)|(?P<t_XOR_ASSIGN>^=)', [None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_NEWLINE', 'NEWLINE'), (None, None), None, None, None, (None, 'LBRACKET'), None, (None, 'RBRACKET'), None, (None, 'LBRACE'), None, (None, 'NUMBER'), (None, 'RBRACE'), None, (None, 'INC_OP'), (None, 'OR_OP'), (None, 'ADD_ASSIGN'), (None, 'LEFT_ASSIGN'), (None, 'MUL_ASSIGN'), (None, 'OR_ASSIGN'), (None, 'RIGHT_ASSIGN'), (None, 'AND_ASSIGN'), (None, 'AND_OP'), (None, 'COLON_ASSIGN'), (None, 'DEC_OP'), (None, 'DIV_ASSIGN'), (None, 'EQ_OP'), (None, 'GE_OP'), (None, 'LEFT_OP'), (None, 'LE_OP'), (None, 'MOD_ASSIGN'), (None, 'NE_OP'), (None, 'RIGHT_OP'), (None, 'SUB_ASSIGN'), (None, 'XOR_ASSIGN')])]}
+_lexstateignore = {'INITIAL': ' \t\r\x0c\x0b'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,137 @@
+
+# action_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "ADD_ASSIGN AND_ASSIGN AND_OP BOOL CHAR COLON_ASSIGN CONST DEC_OP DIV_ASSIGN EQ_OP GE_OP IDENTIFIER INC_OP INT INT16 INT32 INT8 LBRACE LBRACKET LEFT_ASSIGN LEFT_OP LE_OP LONG MOD_ASSIGN MUL_ASSIGN NEWLINE NE_OP NUMBER OR_ASSIGN OR_OP RBRACE RBRACKET RIGHT_ASSIGN RIGHT_OP SHORT SIGNED SUB_ASSIGN UINT16 UINT32 UINT8 UNSIGNED XOR_ASSIGNstart : empty\n             | block_itemsempty :compound_statement : LBRACE RBRACE\n                          | LBRACE block_items RBRACEblock_items : declaration block_items\n                   | statement block_items\n                   | declaration\n                   | statementdeclaration : type_specifiers ';'\n                   | type_specifiers init_declarator_list ';'\n                   | type_specifiers NEWLINE\n                   | type_specifiers init_declarator_list NEWLINEtype_specifiers : type_specifier\n                       | type_specifier type_specifiers type_specifier : CONST\n                      | BOOL\n                      | CHAR\n                      | SHORT\n                      | INT\n                      | LONG\n                      | SIGNED\n                      | UNSIGNED\n                      | INT8\n                      | INT16\n                      | INT32\n                      | UINT8\n                      | UINT16\n                      | UINT32init_declarator_list : init_declarator\n                            | init_declarator ',' init_declarator_listinit_declarator : declarator '=' initializer\n                       | declaratordeclarator : IDENTIFIER\n                  | '(' declarator ')'\n                  | declarator LBRACKET assignment_expression RBRACKET\n                  | declarator LBRACKET RBRACKETinitializer : LBRACE initializer_list RBRACE\n                   | assignment_expressioninitializer_list : initializer\n                        | initializer ','\n                        | initializer ',' initializer_liststatement : compound_statement\n                 | expression_statementexpression_statement : ';'\n                            | expression ';'\n                            | NEWLINE\n                            | expression NEWLINEexpression : assignment_expression\n                  | expression ',' assignment_expressionassignment_expression : inc_dec_assignment\n            | logical_or_expression\n            | unary_expression assignment_operator assignment_expressioninc_dec_assignment : INC_OP unary_expression\n                          | unary_expression INC_OP\n                          | DEC_OP unary_expression\n                          | unary_expression DEC_OPassignment_operator : '='\n                           | COLON_ASSIGN\n                           | MUL_ASSIGN\n                           | DIV_ASSIGN\n                           | MOD_ASSIGN\n                           | ADD_ASSIGN\n                           | SUB_ASSIGN\n                           | LEFT_ASSIGN\n                           | RIGHT_ASSIGN\n                           | AND_ASSIGN\n                           | XOR_ASSIGN\n                           | OR_ASSIGNlogical_or_expression : logical_and_expression\n            | logical_or_expression OR_OP logical_and_expressionlogical_and_expression : inclusive_or_expression\n            | logical_and_expression AND_OP inclusive_or_expressioninclusive_or_expression : exclusive_or_expression\n            | inclusive_or_expression '|' exclusive_or_expressionexclusive_or_expression : and_expression\n                               | exclusive_or_expression '^' and_expressionand_expression : equality_expression\n                      | and_expression '&' equality_expressionequality_expression : relational_expression\n                           | equality_expression EQ_OP relational_expression\n                           | equality_expression NE_OP relational_expressionrelational_expression : shift_expression\n                             | relational_expression '<' shift_expression\n                             | relational_expression '>' shift_expression\n                             | relational_expression LE_OP shift_expression\n                             | relational_expression GE_OP shift_expressionshift_expression : additive_expression\n                        | shift_expression LEFT_OP additive_expression\n                        | shift_expression RIGHT_OP additive_expressionadditive_expression : multiplicative_expression\n            | additive_expression '+' multiplicative_expression\n            | additive_expression '-' multiplicative_expressionmultiplicative_expression : unary_expression\n            | multiplicative_expression '*' unary_expression\n            | multiplicative_expression '/' unary_expression\n            | multiplicative_expression '%' unary_expressionunary_expression : primary_expression\n                        | unary_operator unary_expression\n                        | primary_expression LBRACKET expression RBRACKETunary_operator : '+'\n                      | '-'\n                      | '~'\n                      | '!'primary_expression : IDENTIFIER\n                          | NUMBER\n                          | '(' expression ')'"
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,7,8,9,10,52,53,54,56,62,64,65,105,106,111,],[-3,0,-1,-2,-8,-9,-45,-47,-43,-44,-6,-7,-10,-12,-4,-46,-48,-11,-13,-5,]),'LBRACE':([0,4,5,7,8,9,10,12,54,56,62,64,65,105,106,108,111,137,147,],[12,12,12,-45,-47,-43,-44,12,-10,-12,-4,-46,-48,-11,-13,137,-5,137,137,]),';':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,54,55,56,57,58,59,61,62,64,65,69,70,83,84,87,105,106,111,112,113,114,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,141,142,145,146,],[7,7,7,54,-45,-47,-43,-44,-14,7,64,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-49,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-10,105,-12,-30,-33,-34,-15,-4,-46,-48,-55,-57,-54,-56,-99,-11,-13,-5,-50,-71,-94,-53,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-31,-32,-39,-37,-35,-100,-36,-38,]),'NEWLINE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,54,55,56,57,58,59,61,62,64,65,69,70,83,84,87,105,106,111,112,113,114,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,140,141,142,145,146,],[8,8,8,56,-45,-47,-43,-44,-14,8,65,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-49,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-10,106,-12,-30,-33,-34,-15,-4,-46,-48,-55,-57,-54,-56,-99,-11,-13,-5,-50,-71,-94,-53,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-31,-32,-39,-37,-35,-100,-36,-38,]),'CONST':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[14,14,14,-45,-47,-43,-44,14,14,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'BOOL':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[15,15,15,-45,-47,-43,-44,15,15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'CHAR':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[16,16,16,-45,-47,-43,-44,16,16,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'SHORT':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[17,17,17,-45,-47,-43,-44,17,17,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'INT':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[18,18,18,-45,-47,-43,-44,18,18,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'LONG':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[19,19,19,-45,-47,-43,-44,19,19,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'SIGNED':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[20,20,20,-45,-47,-43,-44,20,20,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'UNSIGNED':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[21,21,21,-45,-47,-43,-44,21,21,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'INT8':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[22,22,22,-45,-47,-43,-44,22,22,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'INT16':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[23,23,23,-45,-47,-43,-44,23,23,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'INT32':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[24,24,24,-45,-47,-43,-44,24,24,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'UINT8':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[25,25,25,-45,-47,-43,-44,25,25,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'UINT16':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[26,26,26,-45,-47,-43,-44,26,26,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'UINT32':([0,4,5,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,54,56,62,64,65,105,106,111,],[27,27,27,-45,-47,-43,-44,27,27,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-10,-12,-4,-46,-48,-11,-13,-5,]),'INC_OP':([0,4,5,7,8,9,10,12,31,35,38,39,40,54,56,62,64,65,66,68,71,72,73,74,75,76,77,78,79,80,81,82,86,87,105,106,108,109,111,119,137,142,147,],[32,32,32,-45,-47,-43,-44,32,69,-98,-105,-106,32,-10,-12,-4,-46,-48,32,32,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,32,-99,-11,-13,32,32,-5,-107,32,-100,32,]),'DEC_OP':([0,4,5,7,8,9,10,12,31,35,38,39,40,54,56,62,64,65,66,68,71,72,73,74,75,76,77,78,79,80,81,82,86,87,105,106,108,109,111,119,137,142,147,],[33,33,33,-45,-47,-43,-44,33,70,-98,-105,-106,33,-10,-12,-4,-46,-48,33,33,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,33,-99,-11,-13,33,33,-5,-107,33,-100,33,]),'IDENTIFIER':([0,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,32,33,36,40,41,42,43,44,54,56,60,61,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,137,147,],[38,38,38,59,-45,-47,-43,-44,-14,38,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,38,38,38,38,-101,-102,-103,-104,-10,-12,59,-15,-4,-46,-48,38,38,38,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-11,-13,59,38,38,-5,38,38,]),'NUMBER':([0,4,5,7,8,9,10,12,32,33,36,40,41,42,43,44,54,56,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,137,147,],[39,39,39,-45,-47,-43,-44,39,39,39,39,39,-101,-102,-103,-104,-10,-12,-4,-46,-48,39,39,39,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-11,-13,39,39,-5,39,39,]),'(':([0,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,32,33,36,40,41,42,43,44,54,56,60,61,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,137,147,],[40,40,40,60,-45,-47,-43,-44,-14,40,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,40,40,40,40,-101,-102,-103,-104,-10,-12,60,-15,-4,-46,-48,40,40,40,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-11,-13,60,40,40,-5,40,40,]),'+':([0,4,5,7,8,9,10,12,31,32,33,35,36,38,39,40,41,42,43,44,50,51,54,56,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,114,119,128,129,130,131,132,133,134,137,142,147,],[41,41,41,-45,-47,-43,-44,41,-94,41,41,-98,41,-105,-106,41,-101,-102,-103,-104,100,-91,-10,-12,-4,-46,-48,41,41,41,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,41,41,-99,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-11,-13,41,41,-5,-94,-107,100,100,-92,-93,-95,-96,-97,41,-100,41,]),'-':([0,4,5,7,8,9,10,12,31,32,33,35,36,38,39,40,41,42,43,44,50,51,54,56,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,114,119,128,129,130,131,132,133,134,137,142,147,],[42,42,42,-45,-47,-43,-44,42,-94,42,42,-98,42,-105,-106,42,-101,-102,-103,-104,101,-91,-10,-12,-4,-46,-48,42,42,42,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,42,42,-99,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-11,-13,42,42,-5,-94,-107,101,101,-92,-93,-95,-96,-97,42,-100,42,]),'~':([0,4,5,7,8,9,10,12,32,33,36,40,41,42,43,44,54,56,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,137,147,],[43,43,43,-45,-47,-43,-44,43,43,43,43,43,-101,-102,-103,-104,-10,-12,-4,-46,-48,43,43,43,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-11,-13,43,43,-5,43,43,]),'!':([0,4,5,7,8,9,10,12,32,33,36,40,41,42,43,44,54,56,62,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,81,82,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,137,147,],[44,44,44,-45,-47,-43,-44,44,44,44,44,44,-101,-102,-103,-104,-10,-12,-4,-46,-48,44,44,44,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-11,-13,44,44,-5,44,44,]),'RBRACE':([4,5,7,8,9,10,12,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,52,53,54,56,62,63,64,65,69,70,83,84,87,105,106,111,113,114,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,138,142,143,144,146,147,148,],[-8,-9,-45,-47,-43,-44,62,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-6,-7,-10,-12,-4,111,-46,-48,-55,-57,-54,-56,-99,-11,-13,-5,-71,-94,-53,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-39,-100,146,-40,-38,-41,-42,]),',':([13,28,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,57,58,59,69,70,83,84,87,89,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,138,140,141,142,144,145,146,],[66,-49,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,107,-33,-34,-55,-57,-54,-56,-99,66,-50,-71,-94,-53,-73,66,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-32,-39,-37,-35,-100,147,-36,-38,]),')':([28,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,59,69,70,83,84,87,89,110,112,113,114,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,142,145,],[-49,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-34,-55,-57,-54,-56,-99,119,141,-50,-71,-94,-53,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-37,-35,-100,-36,]),'RBRACKET':([28,29,30,31,34,35,37,38,39,45,46,47,48,49,50,51,69,70,83,84,87,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,142,],[-49,-51,-52,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-55,-57,-54,-56,-99,140,-50,-71,-94,-53,-73,142,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,145,-100,]),'OR_OP':([30,31,34,35,37,38,39,45,46,47,48,49,50,51,87,113,114,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[67,-94,-70,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-99,-71,-94,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'*':([31,35,38,39,51,87,114,119,130,131,132,133,134,142,],[-94,-98,-105,-106,102,-99,-94,-107,102,102,-95,-96,-97,-100,]),'/':([31,35,38,39,51,87,114,119,130,131,132,133,134,142,],[-94,-98,-105,-106,103,-99,-94,-107,103,103,-95,-96,-97,-100,]),'%':([31,35,38,39,51,87,114,119,130,131,132,133,134,142,],[-94,-98,-105,-106,104,-99,-94,-107,104,104,-95,-96,-97,-100,]),'LEFT_OP':([31,35,38,39,49,50,51,87,114,119,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,98,-88,-91,-99,-94,-107,98,98,98,98,-89,-90,-92,-93,-95,-96,-97,-100,]),'RIGHT_OP':([31,35,38,39,49,50,51,87,114,119,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,99,-88,-91,-99,-94,-107,99,99,99,99,-89,-90,-92,-93,-95,-96,-97,-100,]),'<':([31,35,38,39,48,49,50,51,87,114,119,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,94,-83,-88,-91,-99,-94,-107,94,94,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'>':([31,35,38,39,48,49,50,51,87,114,119,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,95,-83,-88,-91,-99,-94,-107,95,95,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'LE_OP':([31,35,38,39,48,49,50,51,87,114,119,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,96,-83,-88,-91,-99,-94,-107,96,96,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'GE_OP':([31,35,38,39,48,49,50,51,87,114,119,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,97,-83,-88,-91,-99,-94,-107,97,97,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'EQ_OP':([31,35,38,39,47,48,49,50,51,87,114,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,92,-80,-83,-88,-91,-99,-94,-107,92,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'NE_OP':([31,35,38,39,47,48,49,50,51,87,114,119,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,93,-80,-83,-88,-91,-99,-94,-107,93,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'&':([31,35,38,39,46,47,48,49,50,51,87,114,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,91,-78,-80,-83,-88,-91,-99,-94,-107,91,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'^':([31,35,38,39,45,46,47,48,49,50,51,87,114,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,-105,-106,90,-76,-78,-80,-83,-88,-91,-99,-94,90,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'|':([31,35,37,38,39,45,46,47,48,49,50,51,87,114,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,-98,88,-105,-106,-74,-76,-78,-80,-83,-88,-91,-99,-94,88,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'AND_OP':([31,34,35,37,38,39,45,46,47,48,49,50,51,87,113,114,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,142,],[-94,85,-98,-72,-105,-106,-74,-76,-78,-80,-83,-88,-91,-99,85,-94,-73,-75,-107,-77,-79,-81,-82,-84,-85,-86,-87,-89,-90,-92,-93,-95,-96,-97,-100,]),'=':([31,35,38,39,58,59,87,119,140,141,142,145,],[71,-98,-105,-106,108,-34,-99,-107,-37,-35,-100,-36,]),'COLON_ASSIGN':([31,35,38,39,87,119,142,],[72,-98,-105,-106,-99,-107,-100,]),'MUL_ASSIGN':([31,35,38,39,87,119,142,],[73,-98,-105,-106,-99,-107,-100,]),'DIV_ASSIGN':([31,35,38,39,87,119,142,],[74,-98,-105,-106,-99,-107,-100,]),'MOD_ASSIGN':([31,35,38,39,87,119,142,],[75,-98,-105,-106,-99,-107,-100,]),'ADD_ASSIGN':([31,35,38,39,87,119,142,],[76,-98,-105,-106,-99,-107,-100,]),'SUB_ASSIGN':([31,35,38,39,87,119,142,],[77,-98,-105,-106,-99,-107,-100,]),'LEFT_ASSIGN':([31,35,38,39,87,119,142,],[78,-98,-105,-106,-99,-107,-100,]),'RIGHT_ASSIGN':([31,35,38,39,87,119,142,],[79,-98,-105,-106,-99,-107,-100,]),'AND_ASSIGN':([31,35,38,39,87,119,142,],[80,-98,-105,-106,-99,-107,-100,]),'XOR_ASSIGN':([31,35,38,39,87,119,142,],[81,-98,-105,-106,-99,-107,-100,]),'OR_ASSIGN':([31,35,38,39,87,119,142,],[82,-98,-105,-106,-99,-107,-100,]),'LBRACKET':([35,38,39,58,59,110,119,140,141,145,],[86,-105,-106,109,-34,109,-107,-37,-35,-36,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'empty':([0,],[2,]),'block_items':([0,4,5,12,],[3,52,53,63,]),'declaration':([0,4,5,12,],[4,4,4,4,]),'statement':([0,4,5,12,],[5,5,5,5,]),'type_specifiers':([0,4,5,11,12,],[6,6,6,61,6,]),'compound_statement':([0,4,5,12,],[9,9,9,9,]),'expression_statement':([0,4,5,12,],[10,10,10,10,]),'type_specifier':([0,4,5,11,12,],[11,11,11,11,11,]),'expression':([0,4,5,12,40,86,],[13,13,13,13,89,117,]),'assignment_expression':([0,4,5,12,40,66,68,86,108,109,137,147,],[28,28,28,28,28,112,115,28,138,139,138,138,]),'inc_dec_assignment':([0,4,5,12,40,66,68,86,108,109,137,147,],[29,29,29,29,29,29,29,29,29,29,29,29,]),'logical_or_expression':([0,4,5,12,40,66,68,86,108,109,137,147,],[30,30,30,30,30,30,30,30,30,30,30,30,]),'unary_expression':([0,4,5,12,32,33,36,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,108,109,137,147,],[31,31,31,31,83,84,87,31,31,114,31,114,31,114,114,114,114,114,114,114,114,114,114,114,114,114,132,133,134,31,31,31,31,]),'logical_and_expression':([0,4,5,12,40,66,67,68,86,108,109,137,147,],[34,34,34,34,34,34,113,34,34,34,34,34,34,]),'primary_expression':([0,4,5,12,32,33,36,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,108,109,137,147,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'unary_operator':([0,4,5,12,32,33,36,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,108,109,137,147,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'inclusive_or_expression':([0,4,5,12,40,66,67,68,85,86,108,109,137,147,],[37,37,37,37,37,37,37,37,116,37,37,37,37,37,]),'exclusive_or_expression':([0,4,5,12,40,66,67,68,85,86,88,108,109,137,147,],[45,45,45,45,45,45,45,45,45,45,118,45,45,45,45,]),'and_expression':([0,4,5,12,40,66,67,68,85,86,88,90,108,109,137,147,],[46,46,46,46,46,46,46,46,46,46,46,120,46,46,46,46,]),'equality_expression':([0,4,5,12,40,66,67,68,85,86,88,90,91,108,109,137,147,],[47,47,47,47,47,47,47,47,47,47,47,47,121,47,47,47,47,]),'relational_expression':([0,4,5,12,40,66,67,68,85,86,88,90,91,92,93,108,109,137,147,],[48,48,48,48,48,48,48,48,48,48,48,48,48,122,123,48,48,48,48,]),'shift_expression':([0,4,5,12,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,108,109,137,147,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,124,125,126,127,49,49,49,49,]),'additive_expression':([0,4,5,12,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,98,99,108,109,137,147,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,128,129,50,50,50,50,]),'multiplicative_expression':([0,4,5,12,40,66,67,68,85,86,88,90,91,92,93,94,95,96,97,98,99,100,101,108,109,137,147,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,130,131,51,51,51,51,]),'init_declarator_list':([6,107,],[55,135,]),'init_declarator':([6,107,],[57,57,]),'declarator':([6,60,107,],[58,110,58,]),'assignment_operator':([31,],[68,]),'initializer':([108,137,147,],[136,144,144,]),'initializer_list':([137,147,],[143,148,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> empty','start',1,'p_start','action_parser.py',109),
+  ('start -> block_items','start',1,'p_start','action_parser.py',110),
+  ('empty -> <empty>','empty',0,'p_empty','action_parser.py',117),
+  ('compound_statement -> LBRACE RBRACE','compound_statement',2,'p_compound_statement','action_parser.py',121),
+  ('compound_statement -> LBRACE block_items RBRACE','compound_statement',3,'p_compound_statement','action_parser.py',122),
+  ('block_items -> declaration block_items','block_items',2,'p_block_items','action_parser.py',127),
+  ('block_items -> statement block_items','block_items',2,'p_block_items','action_parser.py',128),
+  ('block_items -> declaration','block_items',1,'p_block_items','action_parser.py',129),
+  ('block_items -> statement','block_items',1,'p_block_items','action_parser.py',130),
+  ('declaration -> type_specifiers ;','declaration',2,'p_declaration','action_parser.py',143),
+  ('declaration -> type_specifiers init_declarator_list ;','declaration',3,'p_declaration','action_parser.py',144),
+  ('declaration -> type_specifiers NEWLINE','declaration',2,'p_declaration','action_parser.py',145),
+  ('declaration -> type_specifiers init_declarator_list NEWLINE','declaration',3,'p_declaration','action_parser.py',146),
+  ('type_specifiers -> type_specifier','type_specifiers',1,'p_type_specifiers','action_parser.py',186),
+  ('type_specifiers -> type_specifier type_specifiers','type_specifiers',2,'p_type_specifiers','action_parser.py',187),
+  ('type_specifier -> CONST','type_specifier',1,'p_type_specifier','action_parser.py',194),
+  ('type_specifier -> BOOL','type_specifier',1,'p_type_specifier','action_parser.py',195),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','action_parser.py',196),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','action_parser.py',197),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','action_parser.py',198),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier','action_parser.py',199),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','action_parser.py',200),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','action_parser.py',201),
+  ('type_specifier -> INT8','type_specifier',1,'p_type_specifier','action_parser.py',202),
+  ('type_specifier -> INT16','type_specifier',1,'p_type_specifier','action_parser.py',203),
+  ('type_specifier -> INT32','type_specifier',1,'p_type_specifier','action_parser.py',204),
+  ('type_specifier -> UINT8','type_specifier',1,'p_type_specifier','action_parser.py',205),
+  ('type_specifier -> UINT16','type_specifier',1,'p_type_specifier','action_parser.py',206),
+  ('type_specifier -> UINT32','type_specifier',1,'p_type_specifier','action_parser.py',207),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','action_parser.py',211),
+  ('init_declarator_list -> init_declarator , init_declarator_list','init_declarator_list',3,'p_init_declarator_list','action_parser.py',212),
+  ('init_declarator -> declarator = initializer','init_declarator',3,'p_init_declarator','action_parser.py',219),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','action_parser.py',220),
+  ('declarator -> IDENTIFIER','declarator',1,'p_declarator','action_parser.py',227),
+  ('declarator -> ( declarator )','declarator',3,'p_declarator','action_parser.py',228),
+  ('declarator -> declarator LBRACKET assignment_expression RBRACKET','declarator',4,'p_declarator','action_parser.py',229),
+  ('declarator -> declarator LBRACKET RBRACKET','declarator',3,'p_declarator','action_parser.py',230),
+  ('initializer -> LBRACE initializer_list RBRACE','initializer',3,'p_initializer','action_parser.py',242),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer','action_parser.py',243),
+  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','action_parser.py',250),
+  ('initializer_list -> initializer ,','initializer_list',2,'p_initializer_list','action_parser.py',251),
+  ('initializer_list -> initializer , initializer_list','initializer_list',3,'p_initializer_list','action_parser.py',252),
+  ('statement -> compound_statement','statement',1,'p_statement','action_parser.py',259),
+  ('statement -> expression_statement','statement',1,'p_statement','action_parser.py',260),
+  ('expression_statement -> ;','expression_statement',1,'p_expression_statement','action_parser.py',264),
+  ('expression_statement -> expression ;','expression_statement',2,'p_expression_statement','action_parser.py',265),
+  ('expression_statement -> NEWLINE','expression_statement',1,'p_expression_statement','action_parser.py',266),
+  ('expression_statement -> expression NEWLINE','expression_statement',2,'p_expression_statement','action_parser.py',267),
+  ('expression -> assignment_expression','expression',1,'p_expression','action_parser.py',274),
+  ('expression -> expression , assignment_expression','expression',3,'p_expression','action_parser.py',275),
+  ('assignment_expression -> inc_dec_assignment','assignment_expression',1,'p_assignment_expression','action_parser.py',288),
+  ('assignment_expression -> logical_or_expression','assignment_expression',1,'p_assignment_expression','action_parser.py',289),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','action_parser.py',290),
+  ('inc_dec_assignment -> INC_OP unary_expression','inc_dec_assignment',2,'p_inc_dec_assignment','action_parser.py',301),
+  ('inc_dec_assignment -> unary_expression INC_OP','inc_dec_assignment',2,'p_inc_dec_assignment','action_parser.py',302),
+  ('inc_dec_assignment -> DEC_OP unary_expression','inc_dec_assignment',2,'p_inc_dec_assignment','action_parser.py',303),
+  ('inc_dec_assignment -> unary_expression DEC_OP','inc_dec_assignment',2,'p_inc_dec_assignment','action_parser.py',304),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','action_parser.py',315),
+  ('assignment_operator -> COLON_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',316),
+  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',317),
+  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',318),
+  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',319),
+  ('assignment_operator -> ADD_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',320),
+  ('assignment_operator -> SUB_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',321),
+  ('assignment_operator -> LEFT_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',322),
+  ('assignment_operator -> RIGHT_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',323),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',324),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',325),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','action_parser.py',326),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','action_parser.py',330),
+  ('logical_or_expression -> logical_or_expression OR_OP logical_and_expression','logical_or_expression',3,'p_logical_or_expression','action_parser.py',331),
+  ('logical_and_expression -> inclusive_or_expression','logical_and_expression',1,'p_logical_and_expression','action_parser.py',338),
+  ('logical_and_expression -> logical_and_expression AND_OP inclusive_or_expression','logical_and_expression',3,'p_logical_and_expression','action_parser.py',339),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','action_parser.py',346),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','action_parser.py',347),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','action_parser.py',354),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','action_parser.py',355),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','action_parser.py',362),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','action_parser.py',363),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','action_parser.py',370),
+  ('equality_expression -> equality_expression EQ_OP relational_expression','equality_expression',3,'p_equality_expression','action_parser.py',371),
+  ('equality_expression -> equality_expression NE_OP relational_expression','equality_expression',3,'p_equality_expression','action_parser.py',372),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','action_parser.py',379),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','action_parser.py',380),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','action_parser.py',381),
+  ('relational_expression -> relational_expression LE_OP shift_expression','relational_expression',3,'p_relational_expression','action_parser.py',382),
+  ('relational_expression -> relational_expression GE_OP shift_expression','relational_expression',3,'p_relational_expression','action_parser.py',383),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','action_parser.py',390),
+  ('shift_expression -> shift_expression LEFT_OP additive_expression','shift_expression',3,'p_shift_expression','action_parser.py',391),
+  ('shift_expression -> shift_expression RIGHT_OP additive_expression','shift_expression',3,'p_shift_expression','action_parser.py',392),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','action_parser.py',399),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','action_parser.py',400),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','action_parser.py',401),
+  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_multiplicative_expression','action_parser.py',408),
+  ('multiplicative_expression -> multiplicative_expression * unary_expression','multiplicative_expression',3,'p_multiplicative_expression','action_parser.py',409),
+  ('multiplicative_expression -> multiplicative_expression / unary_expression','multiplicative_expression',3,'p_multiplicative_expression','action_parser.py',410),
+  ('multiplicative_expression -> multiplicative_expression % unary_expression','multiplicative_expression',3,'p_multiplicative_expression','action_parser.py',411),
+  ('unary_expression -> primary_expression','unary_expression',1,'p_unary_expression','action_parser.py',418),
+  ('unary_expression -> unary_operator unary_expression','unary_expression',2,'p_unary_expression','action_parser.py',419),
+  ('unary_expression -> primary_expression LBRACKET expression RBRACKET','unary_expression',4,'p_unary_expression','action_parser.py',420),
+  ('unary_operator -> +','unary_operator',1,'p_unary_operator','action_parser.py',431),
+  ('unary_operator -> -','unary_operator',1,'p_unary_operator','action_parser.py',432),
+  ('unary_operator -> ~','unary_operator',1,'p_unary_operator','action_parser.py',433),
+  ('unary_operator -> !','unary_operator',1,'p_unary_operator','action_parser.py',434),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','action_parser.py',438),
+  ('primary_expression -> NUMBER','primary_expression',1,'p_primary_expression','action_parser.py',439),
+  ('primary_expression -> ( expression )','primary_expression',3,'p_primary_expression','action_parser.py',440),
+]
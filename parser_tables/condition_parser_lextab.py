@@ -0,0 +1,10 @@
+# condition_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND_OP', 'EQ_OP', 'GE_OP', 'IDENTIFIER', 'LBRACKET', 'LEFT_OP', 'LE_OP', 'NE_OP', 'NUMBER', 'OR_OP', 'RBRACKET', 'RIGHT_OP'))
+_lexreflags   = 64
+_lexliterals  = ';,:=()&!~-+*/%<>^|?'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>\\n+)|(?P<t_ignore_COMMENT>(//.*)|(/\\*(.|\\n)*?\\*/))|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_LBRACKET>(\\[|<:))|(?P<t_RBRACKET>(\\]|:>))|(?P<t_NUMBER>[0-9]+)|(?P<t_OR_OP>\\|\\|)|(?P<t_AND_OP>&&)|(?P<t_EQ_OP>==)|(?P<t_GE_OP>>=)|(?P<t_LEFT_OP><<)|(?P<t_LE_OP><=)|(?P<t_NE_OP>!=)|(?P<t_RIGHT_OP>>>)', [None, ('t_newline', 'newline'), (None, None), None, None, None, (None, 'IDENTIFIER'), (None, 'LBRACKET'), None, (None, 'RBRACKET'), None, (None, 'NUMBER'), (None, 'OR_OP'), (None, 'AND_OP'), (None, 'EQ_OP'), (None, 'GE_OP'), (None, 'LEFT_OP'), (None, 'LE_OP'), (None, 'NE_OP'), (None, 'RIGHT_OP')])]}
+_lexstateignore = {'INITIAL': ' \t\r\x0c\x0b'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
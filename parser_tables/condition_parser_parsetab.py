@@ -0,0 +1,71 @@
+
+# condition_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "AND_OP EQ_OP GE_OP IDENTIFIER LBRACKET LEFT_OP LE_OP NE_OP NUMBER OR_OP RBRACKET RIGHT_OPstart : empty\n             | logical_or_expressionempty :logical_or_expression : logical_and_expression\n            | logical_or_expression OR_OP logical_and_expressionlogical_and_expression : inclusive_or_expression\n            | logical_and_expression AND_OP inclusive_or_expressioninclusive_or_expression : exclusive_or_expression\n            | inclusive_or_expression '|' exclusive_or_expressionexclusive_or_expression : and_expression\n                               | exclusive_or_expression '^' and_expressionand_expression : equality_expression\n                      | and_expression '&' equality_expressionequality_expression : relational_expression\n                           | equality_expression EQ_OP relational_expression\n                           | equality_expression NE_OP relational_expressionrelational_expression : shift_expression\n                             | relational_expression '<' shift_expression\n                             | relational_expression '>' shift_expression\n                             | relational_expression LE_OP shift_expression\n                             | relational_expression GE_OP shift_expressionshift_expression : additive_expression\n                        | shift_expression LEFT_OP additive_expression\n                        | shift_expression RIGHT_OP additive_expressionadditive_expression : multiplicative_expression\n            | additive_expression '+' multiplicative_expression\n            | additive_expression '-' multiplicative_expressionmultiplicative_expression : unary_expression\n            | multiplicative_expression '*' unary_expression\n            | multiplicative_expression '/' unary_expression\n            | multiplicative_expression '%' unary_expressionunary_expression : primary_expression\n                        | unary_operator unary_expression\n                        | primary_expression LBRACKET NUMBER RBRACKETunary_operator : '+'\n                      | '-'\n                      | '~'\n                      | '!'primary_expression : IDENTIFIER\n                          | NUMBER\n                          | '(' logical_or_expression ')'"
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,15,16,18,19,42,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[-3,0,-1,-2,-4,-6,-8,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,-5,-7,-9,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'IDENTIFIER':([0,13,14,17,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[19,-35,-36,19,19,-37,-38,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'NUMBER':([0,13,14,17,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,],[18,-35,-36,18,18,-37,-38,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,62,]),'(':([0,13,14,17,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[20,-35,-36,20,20,-37,-38,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'+':([0,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,55,56,57,58,59,60,61,63,64,],[13,36,-25,-35,-36,-28,-32,13,-40,-39,13,-37,-38,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-33,36,36,-26,-27,-29,-30,-31,-41,-34,]),'-':([0,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,55,56,57,58,59,60,61,63,64,],[14,37,-25,-35,-36,-28,-32,14,-40,-39,14,-37,-38,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,-33,37,37,-26,-27,-29,-30,-31,-41,-34,]),'~':([0,13,14,17,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[21,-35,-36,21,21,-37,-38,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'!':([0,13,14,17,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[22,-35,-36,22,22,-37,-38,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'OR_OP':([3,4,5,6,7,8,9,10,11,12,15,16,18,19,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[23,-4,-6,-8,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,23,-5,-7,-9,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),')':([4,5,6,7,8,9,10,11,12,15,16,18,19,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[-4,-6,-8,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,63,-5,-7,-9,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'AND_OP':([4,5,6,7,8,9,10,11,12,15,16,18,19,42,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[24,-6,-8,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,24,-7,-9,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'|':([5,6,7,8,9,10,11,12,15,16,18,19,42,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[25,-8,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,25,-9,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'^':([6,7,8,9,10,11,12,15,16,18,19,42,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[26,-10,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,26,-11,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'&':([7,8,9,10,11,12,15,16,18,19,42,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[27,-12,-14,-17,-22,-25,-28,-32,-40,-39,-33,27,-13,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'EQ_OP':([8,9,10,11,12,15,16,18,19,42,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[28,-14,-17,-22,-25,-28,-32,-40,-39,-33,28,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'NE_OP':([8,9,10,11,12,15,16,18,19,42,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[29,-14,-17,-22,-25,-28,-32,-40,-39,-33,29,-15,-16,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'<':([9,10,11,12,15,16,18,19,42,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[30,-17,-22,-25,-28,-32,-40,-39,-33,30,30,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'>':([9,10,11,12,15,16,18,19,42,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[31,-17,-22,-25,-28,-32,-40,-39,-33,31,31,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'LE_OP':([9,10,11,12,15,16,18,19,42,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[32,-17,-22,-25,-28,-32,-40,-39,-33,32,32,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'GE_OP':([9,10,11,12,15,16,18,19,42,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,],[33,-17,-22,-25,-28,-32,-40,-39,-33,33,33,-18,-19,-20,-21,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'LEFT_OP':([10,11,12,15,16,18,19,42,51,52,53,54,55,56,57,58,59,60,61,63,64,],[34,-22,-25,-28,-32,-40,-39,-33,34,34,34,34,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'RIGHT_OP':([10,11,12,15,16,18,19,42,51,52,53,54,55,56,57,58,59,60,61,63,64,],[35,-22,-25,-28,-32,-40,-39,-33,35,35,35,35,-23,-24,-26,-27,-29,-30,-31,-41,-34,]),'*':([12,15,16,18,19,42,57,58,59,60,61,63,64,],[38,-28,-32,-40,-39,-33,38,38,-29,-30,-31,-41,-34,]),'/':([12,15,16,18,19,42,57,58,59,60,61,63,64,],[39,-28,-32,-40,-39,-33,39,39,-29,-30,-31,-41,-34,]),'%':([12,15,16,18,19,42,57,58,59,60,61,63,64,],[40,-28,-32,-40,-39,-33,40,40,-29,-30,-31,-41,-34,]),'LBRACKET':([16,18,19,63,],[41,-40,-39,-41,]),'RBRACKET':([62,],[64,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'empty':([0,],[2,]),'logical_or_expression':([0,20,],[3,43,]),'logical_and_expression':([0,20,23,],[4,4,44,]),'inclusive_or_expression':([0,20,23,24,],[5,5,5,45,]),'exclusive_or_expression':([0,20,23,24,25,],[6,6,6,6,46,]),'and_expression':([0,20,23,24,25,26,],[7,7,7,7,7,47,]),'equality_expression':([0,20,23,24,25,26,27,],[8,8,8,8,8,8,48,]),'relational_expression':([0,20,23,24,25,26,27,28,29,],[9,9,9,9,9,9,9,49,50,]),'shift_expression':([0,20,23,24,25,26,27,28,29,30,31,32,33,],[10,10,10,10,10,10,10,10,10,51,52,53,54,]),'additive_expression':([0,20,23,24,25,26,27,28,29,30,31,32,33,34,35,],[11,11,11,11,11,11,11,11,11,11,11,11,11,55,56,]),'multiplicative_expression':([0,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,57,58,]),'unary_expression':([0,17,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[15,42,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,59,60,61,]),'primary_expression':([0,17,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'unary_operator':([0,17,20,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> empty','start',1,'p_start','condition_parser.py',61),
+  ('start -> logical_or_expression','start',1,'p_start','condition_parser.py',62),
+  ('empty -> <empty>','empty',0,'p_empty','condition_parser.py',69),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','condition_parser.py',73),
+  ('logical_or_expression -> logical_or_expression OR_OP logical_and_expression','logical_or_expression',3,'p_logical_or_expression','condition_parser.py',74),
+  ('logical_and_expression -> inclusive_or_expression','logical_and_expression',1,'p_logical_and_expression','condition_parser.py',81),
+  ('logical_and_expression -> logical_and_expression AND_OP inclusive_or_expression','logical_and_expression',3,'p_logical_and_expression','condition_parser.py',82),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','condition_parser.py',89),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','condition_parser.py',90),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','condition_parser.py',97),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','condition_parser.py',98),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','condition_parser.py',105),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','condition_parser.py',106),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','condition_parser.py',113),
+  ('equality_expression -> equality_expression EQ_OP relational_expression','equality_expression',3,'p_equality_expression','condition_parser.py',114),
+  ('equality_expression -> equality_expression NE_OP relational_expression','equality_expression',3,'p_equality_expression','condition_parser.py',115),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','condition_parser.py',122),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','condition_parser.py',123),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','condition_parser.py',124),
+  ('relational_expression -> relational_expression LE_OP shift_expression','relational_expression',3,'p_relational_expression','condition_parser.py',125),
+  ('relational_expression -> relational_expression GE_OP shift_expression','relational_expression',3,'p_relational_expression','condition_parser.py',126),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','condition_parser.py',133),
+  ('shift_expression -> shift_expression LEFT_OP additive_expression','shift_expression',3,'p_shift_expression','condition_parser.py',134),
+  ('shift_expression -> shift_expression RIGHT_OP additive_expression','shift_expression',3,'p_shift_expression','condition_parser.py',135),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','condition_parser.py',142),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','condition_parser.py',143),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','condition_parser.py',144),
+  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_multiplicative_expression','condition_parser.py',151),
+  ('multiplicative_expression -> multiplicative_expression * unary_expression','multiplicative_expression',3,'p_multiplicative_expression','condition_parser.py',152),
+  ('multiplicative_expression -> multiplicative_expression / unary_expression','multiplicative_expression',3,'p_multiplicative_expression','condition_parser.py',153),
+  ('multiplicative_expression -> multiplicative_expression % unary_expression','multiplicative_expression',3,'p_multiplicative_expression','condition_parser.py',154),
+  ('unary_expression -> primary_expression','unary_expression',1,'p_unary_expression','condition_parser.py',161),
+  ('unary_expression -> unary_operator unary_expression','unary_expression',2,'p_unary_expression','condition_parser.py',162),
+  ('unary_expression -> primary_expression LBRACKET NUMBER RBRACKET','unary_expression',4,'p_unary_expression','condition_parser.py',163),
+  ('unary_operator -> +','unary_operator',1,'p_unary_operator','condition_parser.py',174),
+  ('unary_operator -> -','unary_operator',1,'p_unary_operator','condition_parser.py',175),
+  ('unary_operator -> ~','unary_operator',1,'p_unary_operator','condition_parser.py',176),
+  ('unary_operator -> !','unary_operator',1,'p_unary_operator','condition_parser.py',177),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','condition_parser.py',181),
+  ('primary_expression -> NUMBER','primary_expression',1,'p_primary_expression','condition_parser.py',182),
+  ('primary_expression -> ( logical_or_expression )','primary_expression',3,'p_primary_expression','condition_parser.py',183),
+]
@@ -0,0 +1,10 @@
+# state_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AFTER', 'AL_NUM', 'AT', 'BEFORE', 'BIND', 'DU', 'DURING', 'EN', 'ENTRY', 'EVERY', 'EX', 'EXIT', 'NEWLINE', 'ON', 'OTHER', 'WHITESPACE'))
+_lexreflags   = 64
+_lexliterals  = ',;:()'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_AL_NUM>\\w+)|(?P<t_NEWLINE>\\n+)|(?P<t_OTHER>[^\\s,;:()\\w]+)|(?P<t_WHITESPACE>[ \\t\\r\\f\\v]+)', [None, ('t_AL_NUM', 'AL_NUM'), ('t_NEWLINE', 'NEWLINE'), (None, 'OTHER'), (None, 'WHITESPACE')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
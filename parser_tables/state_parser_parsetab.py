@@ -0,0 +1,68 @@
+
+# state_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "AFTER AL_NUM AT BEFORE BIND DU DURING EN ENTRY EVERY EX EXIT NEWLINE ON OTHER WHITESPACEstart : ws labellabel : action_keywords actions label\n             | bind actions label\n             | on actions label\n             | emptyempty :ws : WHITESPACE ws\n          | NEWLINE ws\n          | emptyaction_keywords : action_keyword separator action_keywords\n                       | action_keyword ws ':'action_keyword : EN\n                      | DU\n                      | EX\n                      | ENTRY\n                      | DURING\n                      | EXITbind : BIND ws ':'on : ON ws event ws ':'separator : ws ',' ws\n                 | ws ';' wsevent : AL_NUM\n             | temporal '(' ws AL_NUM ws ',' ws AL_NUM ws ')'temporal : AFTER\n                | AT\n                | BEFORE\n                | EVERYactions : anything actions\n               | anythinganything : WHITESPACE\n                | NEWLINE\n                | AL_NUM\n                | OTHER\n                | ','\n                | ';'\n                | ':'\n                | '('\n                | ')'"
+    
+_lr_action_items = {'WHITESPACE':([0,3,4,7,8,9,11,12,13,14,15,16,17,18,19,23,24,25,26,27,28,29,30,31,32,43,44,45,46,47,48,49,58,59,61,63,65,67,],[3,3,3,24,24,24,3,3,3,-12,-13,-14,-15,-16,-17,24,-30,-31,-32,-33,-34,-35,-36,-37,-38,-10,-11,3,3,-18,3,-22,3,-19,3,3,3,-23,]),'NEWLINE':([0,3,4,7,8,9,11,12,13,14,15,16,17,18,19,23,24,25,26,27,28,29,30,31,32,43,44,45,46,47,48,49,58,59,61,63,65,67,],[4,4,4,25,25,25,4,4,4,-12,-13,-14,-15,-16,-17,25,-30,-31,-32,-33,-34,-35,-36,-37,-38,-10,-11,4,4,-18,4,-22,4,-19,4,4,4,-23,]),'BIND':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,40,],[-6,12,-6,-6,-9,-7,-8,12,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,12,12,-28,]),'ON':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,40,],[-6,13,-6,-6,-9,-7,-8,13,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,13,13,-28,]),'EN':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,14,-6,-6,-9,-7,-8,14,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,14,14,14,-28,-6,-6,-20,-21,]),'DU':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,15,-6,-6,-9,-7,-8,15,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,15,15,15,-28,-6,-6,-20,-21,]),'EX':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,16,-6,-6,-9,-7,-8,16,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,16,16,16,-28,-6,-6,-20,-21,]),'ENTRY':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,17,-6,-6,-9,-7,-8,17,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,17,17,17,-28,-6,-6,-20,-21,]),'DURING':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,18,-6,-6,-9,-7,-8,18,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,18,18,18,-28,-6,-6,-20,-21,]),'EXIT':([0,2,3,4,5,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,45,46,55,56,],[-6,19,-6,-6,-9,-7,-8,19,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,19,19,19,-28,-6,-6,-20,-21,]),'$end':([0,1,2,3,4,5,6,10,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,39,40,41,42,],[-6,0,-6,-6,-6,-9,-1,-5,-7,-8,-6,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-6,-6,-2,-28,-3,-4,]),':':([3,4,5,7,8,9,11,12,14,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,36,37,43,44,47,48,49,57,59,67,],[-6,-6,-9,30,30,30,-6,-6,-12,-13,-14,-15,-16,-17,-7,-8,30,-30,-31,-32,-33,-34,-35,-36,-37,-38,44,47,-10,-11,-18,-6,-22,59,-19,-23,]),',':([3,4,5,7,8,9,11,14,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,36,43,44,47,59,61,62,],[-6,-6,-9,28,28,28,-6,-12,-13,-14,-15,-16,-17,-7,-8,28,-30,-31,-32,-33,-34,-35,-36,-37,-38,45,-10,-11,-18,-19,-6,63,]),';':([3,4,5,7,8,9,11,14,15,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,36,43,44,47,59,],[-6,-6,-9,29,29,29,-6,-12,-13,-14,-15,-16,-17,-7,-8,29,-30,-31,-32,-33,-34,-35,-36,-37,-38,46,-10,-11,-18,-19,]),'AL_NUM':([3,4,5,7,8,9,13,20,21,23,24,25,26,27,28,29,30,31,32,38,43,44,47,58,59,60,63,64,],[-6,-6,-9,26,26,26,-6,-7,-8,26,-30,-31,-32,-33,-34,-35,-36,-37,-38,49,-10,-11,-18,-6,-19,61,-6,65,]),'AFTER':([3,4,5,13,20,21,38,],[-6,-6,-9,-6,-7,-8,51,]),'AT':([3,4,5,13,20,21,38,],[-6,-6,-9,-6,-7,-8,52,]),'BEFORE':([3,4,5,13,20,21,38,],[-6,-6,-9,-6,-7,-8,53,]),'EVERY':([3,4,5,13,20,21,38,],[-6,-6,-9,-6,-7,-8,54,]),')':([3,4,5,7,8,9,20,21,23,24,25,26,27,28,29,30,31,32,43,44,47,59,65,66,],[-6,-6,-9,32,32,32,-7,-8,32,-30,-31,-32,-33,-34,-35,-36,-37,-38,-10,-11,-18,-19,-6,67,]),'OTHER':([7,8,9,23,24,25,26,27,28,29,30,31,32,43,44,47,59,],[27,27,27,27,-30,-31,-32,-33,-34,-35,-36,-37,-38,-10,-11,-18,-19,]),'(':([7,8,9,23,24,25,26,27,28,29,30,31,32,43,44,47,50,51,52,53,54,59,],[31,31,31,31,-30,-31,-32,-33,-34,-35,-36,-37,-38,-10,-11,-18,58,-24,-25,-26,-27,-19,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'ws':([0,3,4,11,12,13,45,46,48,58,61,63,65,],[2,20,21,36,37,38,55,56,57,60,62,64,66,]),'empty':([0,2,3,4,11,12,13,22,33,34,45,46,48,58,61,63,65,],[5,10,5,5,5,5,5,10,10,10,5,5,5,5,5,5,5,]),'label':([2,22,33,34,],[6,39,41,42,]),'action_keywords':([2,22,33,34,35,],[7,7,7,7,43,]),'bind':([2,22,33,34,],[8,8,8,8,]),'on':([2,22,33,34,],[9,9,9,9,]),'action_keyword':([2,22,33,34,35,],[11,11,11,11,11,]),'actions':([7,8,9,23,],[22,33,34,40,]),'anything':([7,8,9,23,],[23,23,23,23,]),'separator':([11,],[35,]),'event':([38,],[48,]),'temporal':([38,],[50,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> ws label','start',2,'p_start','state_parser.py',62),
+  ('label -> action_keywords actions label','label',3,'p_label','state_parser.py',66),
+  ('label -> bind actions label','label',3,'p_label','state_parser.py',67),
+  ('label -> on actions label','label',3,'p_label','state_parser.py',68),
+  ('label -> empty','label',1,'p_label','state_parser.py',69),
+  ('empty -> <empty>','empty',0,'p_empty','state_parser.py',79),
+  ('ws -> WHITESPACE ws','ws',2,'p_ws','state_parser.py',83),
+  ('ws -> NEWLINE ws','ws',2,'p_ws','state_parser.py',84),
+  ('ws -> empty','ws',1,'p_ws','state_parser.py',85),
+  ('action_keywords -> action_keyword separator action_keywords','action_keywords',3,'p_keywords','state_parser.py',92),
+  ('action_keywords -> action_keyword ws :','action_keywords',3,'p_keywords','state_parser.py',93),
+  ('action_keyword -> EN','action_keyword',1,'p_keyword','state_parser.py',100),
+  ('action_keyword -> DU','action_keyword',1,'p_keyword','state_parser.py',101),
+  ('action_keyword -> EX','action_keyword',1,'p_keyword','state_parser.py',102),
+  ('action_keyword -> ENTRY','action_keyword',1,'p_keyword','state_parser.py',103),
+  ('action_keyword -> DURING','action_keyword',1,'p_keyword','state_parser.py',104),
+  ('action_keyword -> EXIT','action_keyword',1,'p_keyword','state_parser.py',105),
+  ('bind -> BIND ws :','bind',3,'p_bind','state_parser.py',109),
+  ('on -> ON ws event ws :','on',5,'p_on','state_parser.py',113),
+  ('separator -> ws , ws','separator',3,'p_separator','state_parser.py',117),
+  ('separator -> ws ; ws','separator',3,'p_separator','state_parser.py',118),
+  ('event -> AL_NUM','event',1,'p_event','state_parser.py',122),
+  ('event -> temporal ( ws AL_NUM ws , ws AL_NUM ws )','event',10,'p_event','state_parser.py',123),
+  ('temporal -> AFTER','temporal',1,'p_temporal','state_parser.py',130),
+  ('temporal -> AT','temporal',1,'p_temporal','state_parser.py',131),
+  ('temporal -> BEFORE','temporal',1,'p_temporal','state_parser.py',132),
+  ('temporal -> EVERY','temporal',1,'p_temporal','state_parser.py',133),
+  ('actions -> anything actions','actions',2,'p_actions','state_parser.py',137),
+  ('actions -> anything','actions',1,'p_actions','state_parser.py',138),
+  ('anything -> WHITESPACE','anything',1,'p_anything','state_parser.py',145),
+  ('anything -> NEWLINE','anything',1,'p_anything','state_parser.py',146),
+  ('anything -> AL_NUM','anything',1,'p_anything','state_parser.py',147),
+  ('anything -> OTHER','anything',1,'p_anything','state_parser.py',148),
+  ('anything -> ,','anything',1,'p_anything','state_parser.py',149),
+  ('anything -> ;','anything',1,'p_anything','state_parser.py',150),
+  ('anything -> :','anything',1,'p_anything','state_parser.py',151),
+  ('anything -> (','anything',1,'p_anything','state_parser.py',152),
+  ('anything -> )','anything',1,'p_anything','state_parser.py',153),
+]
@@ -0,0 +1,10 @@
+# transition_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AL_NUM', 'CLOSE_BRACKET', 'NEWLINE', 'OPEN_BRACKET', 'OTHER', 'WHITESPACE'))
+_lexreflags   = 64
+_lexliterals  = '{}/'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NEWLINE>\\n+)|(?P<t_OTHER>[^\\[\\]{}/\\s\\w]+)|(?P<t_WHITESPACE>[ \\t\\r\\f\\v]+)|(?P<t_AL_NUM>\\w+)|(?P<t_CLOSE_BRACKET>\\])|(?P<t_OPEN_BRACKET>\\[)', [None, ('t_NEWLINE', 'NEWLINE'), (None, 'OTHER'), (None, 'WHITESPACE'), (None, 'AL_NUM'), (None, 'CLOSE_BRACKET'), (None, 'OPEN_BRACKET')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,55 @@
+
+# transition_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "AL_NUM CLOSE_BRACKET NEWLINE OPEN_BRACKET OTHER WHITESPACElabel : ws events condition c_action t_action\n             | ws events OPEN_BRACKET A CLOSE_BRACKET ws incorrect_c_actionevents : AL_NUM ws\n              | emptycondition : OPEN_BRACKET A CLOSE_BRACKET ws\n                 | emptyc_action : '{' A '}' ws\n                | emptyt_action : '/' A\n                | emptyempty :ws : WHITESPACE ws\n          | NEWLINE ws\n          | emptyA : A2\n         | emptyA2 : AL_NUM A\n          | OTHER A\n          | WHITESPACE A\n          | NEWLINE A\n          | '/' AA2 : OPEN_BRACKET A CLOSE_BRACKET A\n          | '{' A '}' Aincorrect_c_action : AL_NUM A\n                          | OTHER A"
+    
+_lr_action_items = {'WHITESPACE':([0,3,4,7,12,16,18,22,23,24,25,26,27,29,33,41,42,44,48,49,],[3,3,3,3,24,24,24,24,24,24,24,24,24,24,3,3,24,24,24,24,]),'NEWLINE':([0,3,4,7,12,16,18,22,23,24,25,26,27,29,33,41,42,44,48,49,],[4,4,4,4,25,25,25,25,25,25,25,25,25,25,4,4,25,25,25,25,]),'AL_NUM':([0,2,3,4,5,9,10,12,16,18,22,23,24,25,26,27,29,33,42,43,44,48,49,],[-11,7,-11,-11,-14,-12,-13,22,22,22,22,22,22,22,22,22,22,-11,22,48,22,22,22,]),'OPEN_BRACKET':([0,2,3,4,5,6,7,8,9,10,12,14,16,18,22,23,24,25,26,27,29,42,44,48,49,],[-11,-11,-11,-11,-14,12,-11,-4,-12,-13,18,-3,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'{':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,16,18,22,23,24,25,26,27,29,33,42,43,44,48,49,],[-11,-11,-11,-11,-14,-11,-11,-4,-12,-13,16,27,-6,-3,27,27,27,27,27,27,27,27,27,-11,27,-5,27,27,27,]),'/':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,22,23,24,25,26,27,29,33,41,42,43,44,45,48,49,],[-11,-11,-11,-11,-14,-11,-11,-4,-12,-13,-11,26,-6,-3,29,26,-8,26,26,26,26,26,26,26,26,-11,-11,26,-5,26,-7,26,26,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,13,14,15,17,20,21,22,23,24,25,26,28,29,30,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,],[-11,0,-11,-11,-11,-14,-11,-11,-4,-12,-13,-11,-6,-3,-11,-8,-15,-16,-11,-11,-11,-11,-11,-1,-11,-10,-11,-17,-18,-19,-20,-21,-9,-11,-11,-5,-11,-7,-22,-2,-11,-11,-23,-24,-25,]),'OTHER':([3,4,5,9,10,12,16,18,22,23,24,25,26,27,29,33,42,43,44,48,49,],[-11,-11,-14,-12,-13,23,23,23,23,23,23,23,23,23,23,-11,23,49,23,23,23,]),'CLOSE_BRACKET':([12,18,19,20,21,22,23,24,25,26,32,34,35,36,37,38,42,44,46,50,],[-11,-11,33,-15,-16,-11,-11,-11,-11,-11,42,-17,-18,-19,-20,-21,-11,-11,-22,-23,]),'}':([16,20,21,22,23,24,25,26,27,31,34,35,36,37,38,39,42,44,46,50,],[-11,-15,-16,-11,-11,-11,-11,-11,-11,41,-17,-18,-19,-20,-21,44,-11,-11,-22,-23,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'label':([0,],[1,]),'ws':([0,3,4,7,33,41,],[2,9,10,14,43,45,]),'empty':([0,2,3,4,6,7,11,12,15,16,18,22,23,24,25,26,27,29,33,41,42,44,48,49,],[5,8,5,5,13,5,17,21,30,21,21,21,21,21,21,21,21,21,5,5,21,21,21,21,]),'events':([2,],[6,]),'condition':([6,],[11,]),'c_action':([11,],[15,]),'A':([12,16,18,22,23,24,25,26,27,29,42,44,48,49,],[19,31,32,34,35,36,37,38,39,40,46,50,51,52,]),'A2':([12,16,18,22,23,24,25,26,27,29,42,44,48,49,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'t_action':([15,],[28,]),'incorrect_c_action':([43,],[47,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> label","S'",1,None,None,None),
+  ('label -> ws events condition c_action t_action','label',5,'p_label','transition_parser.py',47),
+  ('label -> ws events OPEN_BRACKET A CLOSE_BRACKET ws incorrect_c_action','label',7,'p_label','transition_parser.py',48),
+  ('events -> AL_NUM ws','events',2,'p_events','transition_parser.py',53),
+  ('events -> empty','events',1,'p_events','transition_parser.py',54),
+  ('condition -> OPEN_BRACKET A CLOSE_BRACKET ws','condition',4,'p_condition','transition_parser.py',58),
+  ('condition -> empty','condition',1,'p_condition','transition_parser.py',59),
+  ('c_action -> { A } ws','c_action',4,'p_c_action','transition_parser.py',64),
+  ('c_action -> empty','c_action',1,'p_c_action','transition_parser.py',65),
+  ('t_action -> / A','t_action',2,'p_t_action','transition_parser.py',70),
+  ('t_action -> empty','t_action',1,'p_t_action','transition_parser.py',71),
+  ('empty -> <empty>','empty',0,'p_empty','transition_parser.py',76),
+  ('ws -> WHITESPACE ws','ws',2,'p_ws','transition_parser.py',80),
+  ('ws -> NEWLINE ws','ws',2,'p_ws','transition_parser.py',81),
+  ('ws -> empty','ws',1,'p_ws','transition_parser.py',82),
+  ('A -> A2','A',1,'p_action','transition_parser.py',89),
+  ('A -> empty','A',1,'p_action','transition_parser.py',90),
+  ('A2 -> AL_NUM A','A2',2,'p_action_parts','transition_parser.py',97),
+  ('A2 -> OTHER A','A2',2,'p_action_parts','transition_parser.py',98),
+  ('A2 -> WHITESPACE A','A2',2,'p_action_parts','transition_parser.py',99),
+  ('A2 -> NEWLINE A','A2',2,'p_action_parts','transition_parser.py',100),
+  ('A2 -> / A','A2',2,'p_action_parts','transition_parser.py',101),
+  ('A2 -> OPEN_BRACKET A CLOSE_BRACKET A','A2',4,'p_brackets','transition_parser.py',108),
+  ('A2 -> { A } A','A2',4,'p_brackets','transition_parser.py',109),
+  ('incorrect_c_action -> AL_NUM A','incorrect_c_action',2,'p_incorrect_c_action','transition_parser.py',113),
+  ('incorrect_c_action -> OTHER A','incorrect_c_action',2,'p_incorrect_c_action','transition_parser.py',114),
+]
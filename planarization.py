@@ -21,20 +21,137 @@ Created on Thu Sep 25 13:21:52 2014
 @author: pavla
 """
 
-import re, state_parser, transition_parser, action_parser, condition_parser
-from copy import copy
-from extendedExceptions import notSupportedException
+import re, sys, threading
+from extendedExceptions import notSupportedException, invalidInputException
+from expressions import Expression, Negation, Disjunction, FALSE
 from collections import OrderedDict
 
+# index of chart elements built in one pass over the chart
+# states - ssid = state element
+# transitions - ssid = transition element
+# labels - node type = {ssid = labelString element}
+# parents - ssid = parent element in the state hierarchy (state or chart)
+class ChartIndex:
+    states = None
+    transitions = None
+    labels = None
+    parents = None
+
+    def __init__(self, chart):
+        self.states = OrderedDict()
+        self.transitions = OrderedDict()
+        self.labels = {"state":{}, "transition":{}}
+        self.parents = {}
+
+        elements = {"state":self.states, "transition":self.transitions}
+        for el in chart.iter("state", "transition"):
+            ssid = el.get("SSID")
+            # the first element with given SSID wins, as with find()
+            if ssid in elements[el.tag]:
+                continue
+            elements[el.tag][ssid] = el
+            labelEl = el.find('P[@Name="labelString"]')
+            if labelEl is not None:
+                self.labels[el.tag][ssid] = labelEl
+            if el.tag == "state":
+                self.parents[ssid] = el.getparent().getparent()
+
+    def getState(self, ssid):
+        return self.states.get(ssid)
+
+    def getParent(self, ssid):
+        return self.parents[ssid]
+
+    def getLabel(self, ssid, nodeType):
+        return self.labels[nodeType].get(ssid)
+
+# maximal number of labels kept by labelMemo
+LABEL_MEMO_SIZE = 10000
+# stands for SSID in the memoized labels (can't appear in XML text)
+SSID_PLACEHOLDER = "\x00"
+
+# process-wide memo of parsed labels, shared by all charts
+# labels - (node type, label string) = (parsed label, label variables), both
+#          parsed with SSID_PLACEHOLDER instead of SSID, so that the SSID
+#          prefix of label variables can be applied separately
+# maxSize - maximal number of labels, least recently used are forgotten
+# hits, misses - numbers of labels found and not found in the memo
+class LabelMemo:
+    labels = None
+    maxSize = 0
+    hits = 0
+    misses = 0
+    lock = None
+
+    def __init__(self, maxSize):
+        self.labels = OrderedDict()
+        self.maxSize = maxSize
+        self.lock = threading.Lock()
+
+    def _get(self, nodeType, labelString, ssid):
+        key = (nodeType, labelString)
+        with self.lock:
+            parsed = self.labels.get(key)
+            if parsed is not None:
+                self.hits += 1
+                self.labels.move_to_end(key)
+            else:
+                self.misses += 1
+        if parsed is None:
+            # parsing outside of the lock, labels may be parsed concurrently
+            if nodeType == "state":
+                parsed = parseStateLabel(labelString, SSID_PLACEHOLDER)
+            else:
+                parsed = parseTransitionLabel(labelString, SSID_PLACEHOLDER)
+            with self.lock:
+                self.labels[key] = parsed
+                if len(self.labels) > self.maxSize:
+                    self.labels.popitem(last=False)
+        (labelDict, labelVariables) = parsed
+
+        # applying the SSID; new dictionaries and lists are created as the
+        # parsed labels are modified during planarization
+        def applySSID(value):
+            if isinstance(value, list):
+                return [action.replaceInNames(SSID_PLACEHOLDER, ssid)
+                        for action in value]
+            if isinstance(value, Expression):
+                return value.replaceInNames(SSID_PLACEHOLDER, ssid)
+            if isinstance(value, str):
+                return value.replace(SSID_PLACEHOLDER, ssid)
+            return value
+
+        newLabel = dict((part, applySSID(value))
+                        for (part, value) in labelDict.items())
+        newVars = OrderedDict()
+        for (varName, varDef) in labelVariables.items():
+            newVars[applySSID(varName)] = dict((attr, applySSID(value))
+                                               for (attr, value)
+                                               in varDef.items())
+        return (newLabel, newVars)
+
+    def getState(self, labelString, ssid):
+        return self._get("state", labelString, ssid)
+
+    def getTransition(self, labelString, ssid):
+        return self._get("transition", labelString, ssid)
+
+labelMemo = LabelMemo(LABEL_MEMO_SIZE)
+
 # labels - parsed labels of states and transitions
 # labelVariables - variables declared in labels
+# index - index of chart elements shared with the planarization
 class LabelCache:
     chart = None
+    index = None
     labels = None
     labelVariables = None
 
-    def __init__(self, chart):
+    def __init__(self, chart, index=None):
         self.chart = chart
+        if index is None:
+            index = ChartIndex(chart)
+        self.index = index
         self.labels = {}
         self.labelVariables = OrderedDict()
 
@@ -42,20 +159,19 @@ class LabelCache:
         if nodeType not in self.labels:
             self.labels[nodeType] = {}
         if key not in self.labels[nodeType]:
-            labelEl = self.chart.find('.//%s[@SSID="%s"]/P[@Name="labelString"]'
-                                      % (nodeType, key))
+            labelEl = self.index.getLabel(key, nodeType)
             if nodeType == "state":
                 if labelEl is None:
                     raise KeyError(key)
                 labelString = labelEl.findtext(".")
-                (self.labels[nodeType][key], newVars) = parseStateLabel(labelString, key)
+                (self.labels[nodeType][key], newVars) = labelMemo.getState(labelString, key)
 
             if nodeType == "transition":
                 if labelEl is None:
                     labelString = ""
                 else:
                     labelString = labelEl.findtext(".")
-                (self.labels[nodeType][key], newVars) = parseTransitionLabel(labelString, key)
+                (self.labels[nodeType][key], newVars) = labelMemo.getTransition(labelString, key)
 
             self.labelVariables.update(newVars)
 
@@ -67,6 +183,128 @@ class LabelCache:
     def getTransition(self, key):
         return self._get(key, "transition")
 
+# hierarchy of the states of a chart; every state is added once, when it is
+# first needed (so that labels are parsed in the same order as without it)
+# depths - ssid = number of states on the path from the chart to the state
+#          (1 for states directly in the chart)
+# ancestors - ssid = tuple of ssids of the superstates, innermost first
+# longNames - ssid = hierarchical name
+# enChains, duChains - ssid = entry/during actions of the superstates and
+#                      the state, outermost first
+# exChains - ssid = exit actions of the state and the superstates,
+#            innermost first
+# Actions of a part of the path are then slices of the chains.
+class StateHierarchy:
+    index = None
+    labelCache = None
+    depths = None
+    ancestors = None
+    longNames = None
+    enChains = None
+    duChains = None
+    exChains = None
+
+    def __init__(self, index, labelCache):
+        self.index = index
+        self.labelCache = labelCache
+        self.depths = {}
+        self.ancestors = {}
+        self.longNames = {}
+        self.enChains = {}
+        self.duChains = {}
+        self.exChains = {}
+
+    def addState(self, ssid):
+        # states up to the first superstate already added, innermost first
+        path = []
+        while ssid is not None and ssid not in self.depths:
+            self.labelCache.getState(ssid)
+            path.append(ssid)
+            parent = self.index.getParent(ssid)
+            if parent.tag == "state":
+                ssid = parent.get("SSID")
+            else:
+                ssid = None
+
+        for ssid in reversed(path):
+            stateLabel = self.labelCache.getState(ssid)
+            parent = self.index.getParent(ssid)
+            if parent.tag == "state":
+                parentSSID = parent.get("SSID")
+                self.depths[ssid] = self.depths[parentSSID] + 1
+                self.ancestors[ssid] = ((sys.intern(parentSSID),) +
+                                        self.ancestors[parentSSID])
+                self.longNames[ssid] = (self.longNames[parentSSID] + "_" +
+                                        stateLabel["name"])
+                self.enChains[ssid] = (self.enChains[parentSSID] +
+                                       stateLabel["en"])
+                self.duChains[ssid] = (self.duChains[parentSSID] +
+                                       stateLabel["du"])
+                self.exChains[ssid] = (stateLabel["ex"] +
+                                       self.exChains[parentSSID])
+            else:
+                self.depths[ssid] = 1
+                self.ancestors[ssid] = ()
+                self.longNames[ssid] = stateLabel["name"]
+                self.enChains[ssid] = list(stateLabel["en"])
+                self.duChains[ssid] = list(stateLabel["du"])
+                self.exChains[ssid] = list(stateLabel["ex"])
+
+    def getDepth(self, ssid):
+        self.addState(ssid)
+        return self.depths[ssid]
+
+    def getAncestors(self, ssid):
+        self.addState(ssid)
+        return self.ancestors[ssid]
+
+    def getLongName(self, ssid):
+        self.addState(ssid)
+        return self.longNames[ssid]
+
+    def isAncestor(self, ancestorSSID, ssid):
+        ancestors = self.getAncestors(ssid)
+        position = self.depths[ssid] - self.depths.get(ancestorSSID, 0) - 1
+        return (0 <= position < len(ancestors) and
+                ancestors[position] == ancestorSSID)
+
+    # Returns during actions of the superstates of the state and of the
+    # state, outermost first.
+    def getDuringActions(self, ssid):
+        self.addState(ssid)
+        return self.duChains[ssid]
+
+    # Returns during actions of the superstates of the state (outermost
+    # first), without the actions of the state itself.
+    def getParentDuringActions(self, ssid):
+        ancestors = self.getAncestors(ssid)
+        if ancestors == ():
+            return []
+        return self.duChains[ancestors[0]]
+
+    # Returns entry actions of the superstates of the state (outermost
+    # first), without the actions of the state itself.
+    def getParentEntryActions(self, ssid):
+        ancestors = self.getAncestors(ssid)
+        if ancestors == ():
+            return []
+        return self.enChains[ancestors[0]]
+
+    # Returns exit actions of the state and its superstates under given
+    # ancestor (all superstates if it is not an ancestor of the state).
+    def getExitActions(self, ssid, ancestorSSID):
+        if self.isAncestor(ancestorSSID, ssid):
+            chain = self.exChains[ssid]
+            return chain[:len(chain) - len(self.exChains[ancestorSSID])]
+        return self.exChains[ssid]
+
+    # Returns entry actions of the superstates under given ancestor (all
+    # superstates if it is not an ancestor of the state) and of the state.
+    def getEntryActions(self, ssid, ancestorSSID):
+        if self.isAncestor(ancestorSSID, ssid):
+            return self.enChains[ssid][len(self.enChains[ancestorSSID]):]
+        return self.enChains[ssid]
+
 def appendSemicolon(string):
     if string.strip()[-1] == ';':
         return string
@@ -101,9 +339,13 @@ def parseStateLabel(labelString, ssid):
     labelDict["ex"] = []
     labelVariables = OrderedDict()
 
+    # parsers are imported when first needed
+    import state_parser
     parsedLabel = state_parser.parse(labelString)
     if parsedLabel is None:
         return (labelDict, labelVariables)
+    if parsedLabel != []:
+        import action_parser
     for (keywordPart, actionPart) in parsedLabel:
         if "bind" in keywordPart:
             raise notSupportedException('"bind" actions')
@@ -127,11 +369,16 @@ def parseTransitionLabel(labelString, ssid):
     labelDict["ta"] = []
     labelVariables = OrderedDict()
 
+    # parsers are imported when first needed
+    import transition_parser
     parsedLabel = transition_parser.parse(labelString.strip())
     if parsedLabel[0] is not None:
         raise notSupportedException("events in transition labels")
     if parsedLabel[1] is not None:
-        labelDict["condition"] = condition_parser.parse(parsedLabel[1]).strip()
+        import condition_parser
+        labelDict["condition"] = condition_parser.parse(parsedLabel[1])
+    if parsedLabel[2] is not None or parsedLabel[3] is not None:
+        import action_parser
     if parsedLabel[2] is not None:
         parsedLabel[2] = appendSemicolon(parsedLabel[2])
         (labelDict["ca"], newVars) = action_parser.parse(parsedLabel[2],
@@ -147,161 +394,292 @@ def parseTransitionLabel(labelString, ssid):
 
     return (labelDict, labelVariables)
 
+# leaf state of the planarized chart
+# longName - hierarchical name
+# name - name from the label
+# en, du, ex - tuples of entry, during and exit actions; during actions
+#              include during actions of the superstates
+# parents - tuple of ssids of the superstates, innermost first
+class PlanarizedState:
+    __slots__ = ("longName", "name", "en", "du", "ex", "parents")
+
+    def __init__(self, longName, name, en, du, ex, parents):
+        self.longName = longName
+        self.name = name
+        self.en = en
+        self.du = du
+        self.ex = ex
+        self.parents = parents
+
+# transition of the planarized chart
+# ssid - ssid of the original transition, no longer unique
+# src, dst - ssids of the source and destination leaf states
+# conditions - tuple of conditions
+# segments - tuple of segments (tuples of actions, see
+#            PlanarizedChart.getSegments), the actions of the transition
+#            are their concatenation
+# srcHierarchy, transType, order - together define execution order
+#     (determined first by srcHierarchy, then by transType and then by
+#     order; in all cases lower number means higher priority)
+# Planarized charts may have hundreds of thousands of transitions, hence
+# slots instead of dicts, tuples instead of lists and interned ssids.
+class PlanarizedTransition:
+    __slots__ = ("ssid", "src", "dst", "conditions", "segments",
+                 "srcHierarchy", "transType", "order")
+
+    def __init__(self, ssid, src, dst, conditions, segments, srcHierarchy,
+                 transType, order):
+        self.ssid = ssid
+        self.src = src
+        self.dst = dst
+        self.conditions = conditions
+        self.segments = segments
+        self.srcHierarchy = srcHierarchy
+        self.transType = transType
+        self.order = order
+
+    def getPriority(self):
+        return (self.srcHierarchy, self.transType, self.order)
+
+    def getActions(self):
+        if len(self.segments) == 1:
+            return self.segments[0]
+        return tuple(action for segment in self.segments
+                            for action in segment)
+
 # planarized Stateflow chart
 # states 
 #   - leaf states of the state hierarchy
-#   - ssid = {hierarchical name, label, parents}
-#       - label = {name, entry actions, during actions, exit actions}
+#   - ssid = PlanarizedState
 # transitions
-#   - {ssid, source, destination, conditions, actions,
-#      srcHierarchy, transType, order}
-#       - ssid is no longer unique
-#       - scrHierarchy, transType and order together define execution order
-#         (determined first by srcHierarchy, then by transType and then by
-#         order; in all cases lower number means higher priority)
+#   - [PlanarizedTransition]
+# outgoing
+#   - source ssid = [transitions], in the order of transitions
 # variables
 #   - name = {variable type, constant, initialization, scope}
+# segments
+#   - segment = segment, one tuple for all equal sequences of actions
+#     (transitions created from one transition share most of their actions)
 class PlanarizedChart:
     chartID = 0
     chartName = ""
     states = None
     transitions = None
+    outgoing = None
     variables = None
+    segments = None
     
     def __init__(self):
         self.states = OrderedDict()
         self.transitions = []
+        self.outgoing = {}
         self.variables = OrderedDict()
+        self.segments = {}
 
-    def addState(self, stateEl, labelCache):
-        stateSSID = stateEl.get("SSID")
-        stateLabel = labelCache.getState(stateSSID)
+    # Returns the shared tuple equal to given sequence of actions.
+    def getSegment(self, actions):
+        segment = tuple(actions)
+        return self.segments.setdefault(segment, segment)
 
-        parents = []
-        longName = stateLabel["name"]
-        parent = stateEl.getparent().getparent()
-        while parent.tag == "state":
-            parents.append(parent.get("SSID"))
-            parentLabel = labelCache.getState(parent.get("SSID"))
-            longName = parentLabel["name"] + "_" + longName
-            stateLabel["du"] = parentLabel["du"] + stateLabel["du"]
-            parent = parent.getparent().getparent()
-
-        self.states[stateSSID] = {
-            "longName":longName,
-            "label":stateLabel,
-            "parents":parents
-        }
+    # Returns segments of the actions given by sequences of actions (already
+    # shared or not), empty sequences are left out.
+    def getSegments(self, *actionSequences):
+        return tuple(self.getSegment(actions) for actions in actionSequences
+                     if len(actions) != 0)
 
-    def addVariable(self, varEl):
-        typeConversions = {"int":["int16", "int32", "uint8", "uint16",
-                                  "uint32", "int"],
-                           "byte":["int8", "boolean"]}
-        varDef = {}
-
-        varType = varEl.findtext('P[@Name="dataType"]')
-        if varType in typeConversions["int"]:
-            varDef["type"] = "int"
-        elif varType in typeConversions["byte"]:
-            varDef["type"] = "byte"
-        else:
-            raise notSupportedException("variables of type %s" % varType)
-
-        varScope = varEl.findtext('P[@Name="scope"]')
-        varDef["const"] = False
-        if varScope == "LOCAL_DATA" or varScope == "OUTPUT_DATA":
-            varDef["scope"] = "local"
-        elif varScope == "INPUT_DATA":
-            varDef["scope"] = "input"
-        elif varScope == "CONSTANT":
-            varDef["scope"] = "local"
-            varDef["const"] = True
-        else:
-            raise notSupportedException("variables of scope %s" % varScope)
+    def addTransition(self, transition):
+        self.transitions.append(transition)
+        self.outgoing.setdefault(transition.src, []).append(transition)
 
-        initialValueEl = varEl.find('props/P[@Name="initialValue"]')
-        if initialValueEl is None:
-            varDef["init"] = None
-        else:
-            varDef["init"] = initialValueEl.findtext(".")
+    def setTransitions(self, transitions):
+        self.transitions = []
+        self.outgoing = {}
+        for transition in transitions:
+            self.addTransition(transition)
 
-        self.variables[varEl.get("name")] = varDef
+    def getOutgoing(self, ssid):
+        return self.outgoing.get(ssid, [])
+
+    def addState(self, stateEl, labelCache, hierarchy):
+        stateSSID = sys.intern(stateEl.get("SSID"))
+        stateLabel = labelCache.getState(stateSSID)
+        self.states[stateSSID] = PlanarizedState(
+            hierarchy.getLongName(stateSSID), stateLabel["name"],
+            tuple(stateLabel["en"]),
+            tuple(hierarchy.getDuringActions(stateSSID)),
+            tuple(stateLabel["ex"]), hierarchy.getAncestors(stateSSID))
+
+    def addVariable(self, varEl):
+        self.variables[varEl.get("name")] = getVariableDefinition(varEl)
+
+# Returns definition of the variable given by data element. Raises
+# notSupportedException for unsupported types and scopes.
+def getVariableDefinition(varEl):
+    typeConversions = {"int":["int16", "int32", "uint8", "uint16",
+                              "uint32", "int"],
+                       "byte":["int8", "boolean"]}
+    varDef = {}
+
+    varType = varEl.findtext('P[@Name="dataType"]')
+    if varType in typeConversions["int"]:
+        varDef["type"] = "int"
+    elif varType in typeConversions["byte"]:
+        varDef["type"] = "byte"
+    else:
+        raise notSupportedException("variables of type %s" % varType)
+
+    varScope = varEl.findtext('P[@Name="scope"]')
+    varDef["const"] = False
+    if varScope == "LOCAL_DATA" or varScope == "OUTPUT_DATA":
+        varDef["scope"] = "local"
+    elif varScope == "INPUT_DATA":
+        varDef["scope"] = "input"
+    elif varScope == "CONSTANT":
+        varDef["scope"] = "local"
+        varDef["const"] = True
+    else:
+        raise notSupportedException("variables of scope %s" % varScope)
+
+    initialValueEl = varEl.find('props/P[@Name="initialValue"]')
+    if initialValueEl is None:
+        varDef["init"] = None
+    else:
+        varDef["init"] = initialValueEl.findtext(".")
+
+    return varDef
 
 def negateConditions(conditions):
-    if conditions == []:
-        return "false"
+    if len(conditions) == 0:
+        return FALSE
 
     negatedConditions = []
     for cond in conditions:
         if cond == "":
-            negatedConditions.append("false")
+            negatedConditions.append(FALSE)
         else:
-            negatedConditions.append("not (%s)" % cond)
-    return " or ".join(negatedConditions)
-
-def findSrcPaths(currentPath, paths, labelCache, chart):
-    if currentPath[0].find("Children") is None:
-        return paths + [currentPath]
-
-    children = currentPath[0].findall("Children/state")
-    for child in children:
-        newActions = labelCache.getState(child.get("SSID"))["ex"] + currentPath[1]
-        paths = findSrcPaths((child, newActions), paths, labelCache, chart)
-
-    return paths
+            negatedConditions.append(Negation(cond))
+    if len(negatedConditions) == 1:
+        return negatedConditions[0]
+    return Disjunction(tuple(negatedConditions))
+
+# Returns the leaf states in which the chart can be when given state is
+# exited, as [(leaf ssid, exit actions of the states under given state)].
+# The paths of every state are computed once and stored in memo (ssid =
+# paths), so they are shared by all transitions from the state. States are
+# processed with an explicit stack, so deep hierarchies don't hit the
+# recursion limit.
+def findSrcPaths(stateEl, memo, labelCache):
+    stack = [stateEl]
+    while stack:
+        currentEl = stack[-1]
+        currentSSID = currentEl.get("SSID")
+        if currentSSID in memo:
+            stack.pop()
+            continue
+        if currentEl.find("Children") is None:
+            memo[currentSSID] = [(sys.intern(currentSSID), [])]
+            stack.pop()
+            continue
 
-def findDstPaths(currentPath, paths, labelCache, chart):
-    if currentPath[0].find("Children") is None:
-        return paths + [currentPath]
+        children = currentEl.findall("Children/state")
+        missing = [child for child in children if child.get("SSID") not in memo]
+        if missing != []:
+            stack.extend(reversed(missing))
+            continue
 
-    defTrans = sorted(filter(lambda x:x.find('src/P[@Name="SSID"]') is None,
-                             currentPath[0].findall('Children/transition')),
-                      key=lambda transEl:transEl.findtext('P[@Name="executionOrder"]'))
+        paths = []
+        for child in children:
+            exActions = labelCache.getState(child.get("SSID"))["ex"]
+            for (leafSSID, actions) in memo[child.get("SSID")]:
+                paths.append((leafSSID, actions + exActions))
+        memo[currentSSID] = paths
+        stack.pop()
+
+    return memo[stateEl.get("SSID")]
+
+# Returns the leaf states the chart can get to by default transitions when
+# given state is entered, as [(leaf ssid, conditions, actions)]; the last
+# path leads to the state "error" (none of the default transitions can be
+# taken). Conditions are tuples. Memoized and iterative as findSrcPaths.
+# Raises invalidInputException if a default transition doesn't lead to
+# a substate of its state (so the default transitions can't form a cycle).
+def findDstPaths(stateEl, memo, labelCache, index):
+    stack = [stateEl]
+    while stack:
+        currentEl = stack[-1]
+        currentSSID = currentEl.get("SSID")
+        if currentSSID in memo:
+            stack.pop()
+            continue
+        if currentEl.find("Children") is None:
+            memo[currentSSID] = [(sys.intern(currentSSID), (), [])]
+            stack.pop()
+            continue
 
-    negatedConditions = []
+        defTrans = sorted(filter(lambda x:x.find('src/P[@Name="SSID"]') is None,
+                                 currentEl.findall('Children/transition')),
+                          key=lambda transEl:transEl.findtext('P[@Name="executionOrder"]'))
+        missing = []
+        for transEl in defTrans:
+            dstSSID = transEl.findtext('dst/P[@Name="SSID"]')
+            dstEl = index.getState(dstSSID)
+            if dstEl is None or index.getParent(dstSSID) is not currentEl:
+                raise invalidInputException("default transition %s doesn't "
+                                            "lead to a substate of state %s"
+                                            % (transEl.get("SSID"),
+                                               currentSSID))
+            if dstSSID not in memo:
+                missing.append(dstEl)
+        if missing != []:
+            stack.extend(reversed(missing))
+            continue
 
-    for transEl in defTrans:
-        dstSSID = transEl.findtext('dst/P[@Name="SSID"]')
-        dstEl = currentPath[0].find('Children/state[@SSID="%s"]' % dstSSID)
-        transLabel = labelCache.getTransition(transEl.get("SSID"))
+        paths = []
+        negatedConditions = []
+        for transEl in defTrans:
+            dstSSID = transEl.findtext('dst/P[@Name="SSID"]')
+            transLabel = labelCache.getTransition(transEl.get("SSID"))
 
-        newConditions = currentPath[1] + negatedConditions
-        if transLabel["condition"] != "":
-            newConditions.append(transLabel["condition"])
-        negatedConditions.append(negateConditions([transLabel["condition"]]))
-        newActions = currentPath[2] + transLabel["ca"] + transLabel["ta"] + labelCache.getState(dstSSID)["en"]
+            newConditions = list(negatedConditions)
+            if transLabel["condition"] != "":
+                newConditions.append(transLabel["condition"])
+            newConditions = tuple(newConditions)
+            negatedConditions.append(negateConditions([transLabel["condition"]]))
+            newActions = transLabel["ca"] + transLabel["ta"] + labelCache.getState(dstSSID)["en"]
 
-        paths = findDstPaths((dstEl, newConditions, newActions), 
-                                 paths, labelCache, chart)
+            for (leafSSID, conditions, actions) in memo[dstSSID]:
+                paths.append((leafSSID, newConditions + conditions,
+                              newActions + actions))
 
-    paths.append(("error", currentPath[1] + negatedConditions, currentPath[2]))
+        paths.append(("error", tuple(negatedConditions), []))
+        memo[currentSSID] = paths
+        stack.pop()
 
-    return paths
+    return memo[stateEl.get("SSID")]
 
 def makePlanarized(chart):
     planarizedChart = PlanarizedChart()
-    labelCache = LabelCache(chart)
+    index = ChartIndex(chart)
+    labelCache = LabelCache(chart, index)
+    hierarchy = StateHierarchy(index, labelCache)
+    # ssid = paths, see findSrcPaths and findDstPaths
+    srcPathMemo = {}
+    dstPathMemo = {}
 
     planarizedChart.chartID = chart.get("id")
     planarizedChart.chartName = chart.findtext('P[@Name="name"]')
 
     # storing states
-    for stateEl in chart.findall(".//state"):
+    for stateEl in index.states.values():
         if stateEl.find("Children") is None:
-            planarizedChart.addState(stateEl, labelCache)
-    planarizedChart.states["start"] = {
-        "longName":"start",
-        "label":{"name":"start", "en":[], "du":[], "ex":[]},
-        "parents":[]
-    }
-    planarizedChart.states["error"] = {
-        "longName":"error",
-        "label":{"name":"error", "en":[], "du":[], "ex":[]},
-        "parents":[]
-    }
+            planarizedChart.addState(stateEl, labelCache, hierarchy)
+    planarizedChart.states["start"] = PlanarizedState("start", "start",
+                                                      (), (), (), ())
+    planarizedChart.states["error"] = PlanarizedState("error", "error",
+                                                      (), (), (), ())
 
     # storing transitions
-    for trans in chart.findall(".//transition"):
+    for trans in index.transitions.values():
         transLabel = labelCache.getTransition(trans.get("SSID"))
         transParent = trans.getparent().getparent()
         transParentSSID = transParent.get("SSID")
@@ -322,37 +700,19 @@ def makePlanarized(chart):
         # updating condition actions with during actions of superstates of the
         # source state
         if srcSSID != "start":
-            srcLabel = labelCache.getState(srcSSID)
             if srcSSID == transParentSSID:
-                duActions = copy(srcLabel["du"])
+                duActions = hierarchy.getDuringActions(srcSSID)
                 exActions = []
-                exiting = False
             else:
-                duActions = []
-                exActions = copy(srcLabel["ex"])
-                exiting = True
-            src = chart.find('.//state[@SSID="%s"]' % srcSSID)
-            srcParent = src.getparent().getparent()
-            while srcParent.tag == "state":
-                if srcParent.get("SSID") == transParentSSID:
-                    exiting = False
-                parentLabel = labelCache.getState(srcParent.get("SSID"))
-                duActions = parentLabel["du"] + duActions
-                if exiting:
-                    exActions = exActions + parentLabel["ex"]
-                srcParent = srcParent.getparent().getparent()
+                duActions = hierarchy.getParentDuringActions(srcSSID)
+                exActions = hierarchy.getExitActions(srcSSID, transParentSSID)
             transLabel["ca"] = duActions + transLabel["ca"]
             transLabel["ta"] = exActions + transLabel["ta"]
 
         if dstSSID == transParentSSID:
-            enActions = []
+            enActions = hierarchy.getParentEntryActions(dstSSID)
         else:
-            enActions = copy(labelCache.getState(dstSSID)["en"])
-        dst = chart.find('.//state[@SSID="%s"]' % dstSSID)
-        dstParent = dst.getparent().getparent()
-        while dstParent.tag == "state" and dstParent.get("SSID") != transParentSSID:
-            enActions = labelCache.getState(dstParent.get("SSID"))["en"] + enActions
-            dstParent = dstParent.getparent().getparent()
+            enActions = hierarchy.getEntryActions(dstSSID, transParentSSID)
         transLabel["ta"] = transLabel["ta"] + enActions
 
         # for transition from a superstate, one transition from each substate
@@ -360,30 +720,24 @@ def makePlanarized(chart):
         if srcSSID == "start" and transParent.tag == "chart":
             srcPaths = [("start", [])]
         else:
-            srcEl = chart.find('.//state[@SSID="%s"]' % srcSSID)
-            srcPaths = findSrcPaths((srcEl, []), [], labelCache, chart)
+            srcPaths = findSrcPaths(index.getState(srcSSID), srcPathMemo,
+                                    labelCache)
 
         # for transition to a superstate, one transition to each substate with
         # default transition is created (and to an error state, if there
         # are labeled default transitions)
-        dstEl = chart.find('.//state[@SSID="%s"]' % dstSSID)
-        if transLabel["condition"] == "":
-            conditions = []
-        else:
-            conditions = [transLabel["condition"]]
-        dstPaths = findDstPaths((dstEl, conditions, []), 
-                                [], labelCache, chart)
+        dstPaths = findDstPaths(index.getState(dstSSID), dstPathMemo,
+                                labelCache, index)
+        if transLabel["condition"] != "":
+            conditions = (transLabel["condition"],)
+            dstPaths = [(leafSSID, conditions + pathConditions, actions)
+                        for (leafSSID, pathConditions, actions) in dstPaths]
 
         # determining source hierarchy, transition type and order
         if srcSSID == "start":
             srcHierarchy = 0
         else:
-            srcHierarchy = 1
-            src = chart.find('.//state[@SSID="%s"]' % srcSSID)
-            srcParent = src.getparent().getparent()
-            while srcParent.tag != "chart":
-                srcHierarchy += 1
-                srcParent = srcParent.getparent().getparent()
+            srcHierarchy = hierarchy.getDepth(srcSSID)
 
         if srcSSID == "start":
             transType = 0
@@ -393,28 +747,29 @@ def makePlanarized(chart):
             transType = 1
 
         order = int(trans.findtext('P[@Name="executionOrder"]'))
-
-        for srcPath in srcPaths:
-            for dstPath in dstPaths:
-                if isinstance(srcPath[0], str):
-                    srcSSID = "start"
-                else:
-                    srcSSID = srcPath[0].get("SSID")
-                if isinstance(dstPath[0], str):
-                    dstSSID = "error"
-                else:
-                    dstSSID = dstPath[0].get("SSID")
-
-                planarizedChart.transitions.append({"ssid":trans.get("SSID"),
-                "src":srcSSID, "dst":dstSSID, "conditions":dstPath[1],
-                "actions": transLabel["ca"] + srcPath[1] + transLabel["ta"] + dstPath[2],
-                "srcHierarchy":srcHierarchy, "transType":transType,
-                "order":order})
+        transSSID = sys.intern(trans.get("SSID"))
+
+        # actions of all transitions created from this one are made of
+        # shared segments
+        caSegments = planarizedChart.getSegments(transLabel["ca"])
+        taSegments = planarizedChart.getSegments(transLabel["ta"])
+        srcPaths = [(srcSSID, planarizedChart.getSegments(srcActions))
+                    for (srcSSID, srcActions) in srcPaths]
+        dstPaths = [(dstSSID, dstConditions,
+                     planarizedChart.getSegments(dstActions))
+                    for (dstSSID, dstConditions, dstActions) in dstPaths]
+
+        for (srcSSID, srcSegments) in srcPaths:
+            for (dstSSID, dstConditions, dstSegments) in dstPaths:
+                planarizedChart.addTransition(PlanarizedTransition(transSSID,
+                    srcSSID, dstSSID, dstConditions,
+                    caSegments + srcSegments + taSegments + dstSegments,
+                    srcHierarchy, transType, order))
 
     # storing transition from state "start" to state "error"
-    planarizedChart.transitions.append({"ssid":"start", "src":"start",
-    "dst":"error", "conditions":[], "actions": [], "srcHierarchy":1,
-    "transType":0, "order":0})
+    planarizedChart.addTransition(PlanarizedTransition("start", "start",
+                                                       "error", (), (),
+                                                       1, 0, 0))
 
     # storing variables
     for varEl in chart.findall(".//data"):
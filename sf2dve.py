@@ -22,162 +22,314 @@ Created on Sat Mar 15 21:30:39 2014
 @author: pavla
 """
 
-import sys, re, zipfile
+import sys, os, re, zipfile, posixpath
 from lxml import etree
-from copy import copy
-from extendedExceptions import notSupportedException, invalidInputException
+from heapq import merge
+from itertools import chain
+from expressions import FALSE, Name, Unary
+from collections import OrderedDict
+import dve
+from extendedExceptions import (notSupportedException, invalidInputException,
+                                limitExceededException, inputProblemsException)
+from validation import checkInput, checkChart, checkLabels, raiseProblems
+
+VERSION = "1.1"
 
 PROCESS_PREFIX = "process_"
 STATE_PREFIX = "state_"
 ALTERNATION_VAR = "sf2dve_alt"
+# members of SLX archive
+BLOCKDIAGRAM_PART = "simulink/blockdiagram.xml"
+BLOCKDIAGRAM_RELS = "simulink/_rels/blockdiagram.xml.rels"
+# relationship types and names of the parts with the Stateflow data
+STATEFLOW_PART_RE = re.compile("stateflow", re.IGNORECASE)
+
+# Returns True if given element is a chart of the machine, i.e. its path
+# is Stateflow/machine/Children/chart (Stateflow being the root or its child).
+def isMachineChart(element, root):
+    if element.tag != "chart":
+        return False
+    path = ["Children", "machine", "Stateflow"]
+    ancestor = element
+    for tag in path:
+        ancestor = ancestor.getparent()
+        if ancestor is None or ancestor.tag != tag:
+            return False
+    return ancestor is root or ancestor.getparent() is root
+
+# Parses Stateflow XML from given stream. Only the Stateflow subtree is
+# built, other elements are freed as soon as they are parsed. Each chart of
+# the machine is passed to handleChart as soon as it is parsed and cleared
+# afterwards, so that only one chart is held in memory at a time. The XML
+# may also be a separate Stateflow part of SLX file (with Stateflow as the
+# root); the returned tree has Stateflow below the root in both cases.
+def parseStateflow(infile, handleChart):
+    events = etree.iterparse(infile, events=("start", "end"))
+    root = None
+    # depth within the Stateflow subtree
+    depth = 0
+    while True:
+        try:
+            (event, element) = next(events)
+        except StopIteration:
+            break
+        except Exception:
+            raise invalidInputException("failed to parse XML")
+
+        if event == "start":
+            if root is None:
+                root = element
+                if root.tag == "Stateflow":
+                    depth = 1
+            elif depth > 0 or (element.tag == "Stateflow" and
+                               element.getparent() is root):
+                depth += 1
+            continue
 
-# Checks action language, number of machines and state labels.
-def checkInput(stateflowEtree):
-    if stateflowEtree.find("Stateflow") is None:
-        raise invalidInputException("not recognized as Stateflow")
-
-    if len(stateflowEtree.findall("Stateflow/machine")) != 1:
-        raise invalidInputException("invalid number of machines")
-
-    for chart in stateflowEtree.findall("Stateflow/machine/Children/chart"):
-        actionLanguageSetting = chart.find('P[@Name="actionLanguage"]')
-        if (actionLanguageSetting != None and
-            actionLanguageSetting.findtext(".") == "2"):
-            raise invalidInputException("invalid action language")
-
-    if stateflowEtree.find("//event") is not None:
-        raise notSupportedException("events")
-
-    if stateflowEtree.find("//junction") is not None:
-        raise notSupportedException("junctions")
-
-    for state in stateflowEtree.findall("//state"):
-        if (state.find('P[@Name="labelString"]') is None or
-            state.findtext('P[@Name="labelString"]') == ""):
-            raise invalidInputException("state without label")
-        stateType = state.findtext('P[@Name="type"]')
-        if stateType != "OR_STATE":
-            if stateType == "AND_STATE":
-                raise notSupportedException("and decomposition of states")
-            elif stateType == "FUNC_STATE":
-                raise notSupportedException("functions")
-            else:
-                raise notSupportedException("state of type %s" % stateType)
+        if depth > 0:
+            depth -= 1
+            if isMachineChart(element, root):
+                handleChart(element)
+                element.clear(keep_tail=True)
+        elif element is not root:
+            # freeing elements outside the Stateflow subtree
+            element.clear(keep_tail=True)
+            previous = element.getprevious()
+            while previous is not None and previous.tag != "Stateflow":
+                element.getparent().remove(previous)
+                previous = element.getprevious()
+
+    if root.tag == "Stateflow":
+        wrapper = etree.Element("ModelInformation")
+        wrapper.append(root)
+        root = wrapper
+    return etree.ElementTree(root)
 
 def getStateID(ssid, states, state_names):
     if state_names == "id" or ssid == "start" or ssid == "error":
         return STATE_PREFIX + ssid
     elif state_names == "hierarchical":
-        return STATE_PREFIX + states[ssid]["longName"]
+        return STATE_PREFIX + states[ssid].longName
     else:
-        return STATE_PREFIX + states[ssid]["label"]["name"]
+        return STATE_PREFIX + states[ssid].name
 
-def writeProcess(chart, outfile, state_names, input_values, force_alternation):
+# For each transition (in the order of given list) returns negated conditions
+# of the transitions from the same source with higher priority, i.e. lower
+# (srcHierarchy, transType, order). The negated conditions are ordered as the
+# transitions in the list; transitions with the same priority share one list.
+def getHigherPriorityGuards(transitions):
     from planarization import negateConditions
-    # process declaration
-    if state_names == "id":
-        outfile.write("process %s%s {\n" % (PROCESS_PREFIX, chart.chartID))
-    else:
-        outfile.write("process %s%s {\n" % (PROCESS_PREFIX, chart.chartName))
-
-    # variables
-    for varName, varDef in chart.variables.items():
-        if input_values is not None and varDef["scope"] == "input":
-            continue
-        outfile.write("\t")
-        if varDef["scope"] == "input":
-            outfile.write("input ")
-        if varDef["const"]:
-            outfile.write("const ")
-        outfile.write("%s %s" % (varDef["type"], varName))
-        if varDef["init"] != None and varDef["init"] != "":
-            outfile.write(" = %s" % varDef["init"])
-        outfile.write(";\n")
-
-    # states
-    stateList = [getStateID(ssid, chart.states, state_names) for ssid in chart.states]
-    outfile.write("\tstate %s;\n" % ", ".join(stateList))
-    outfile.write("\tinit %sstart;\n" % STATE_PREFIX)
-
-    # transitions (without loops emulating during actions)
-    startTrans = False
-    for trans in chart.transitions:
-        # from -> to
-        source = getStateID(trans["src"], chart.states, state_names)
-        destination = getStateID(trans["dst"], chart.states, state_names)
 
+    bySource = OrderedDict()
+    for i, trans in enumerate(transitions):
+        bySource.setdefault(trans.src, []).append(i)
+
+    negated = [None] * len(transitions)
+    guards = [None] * len(transitions)
+    for indices in bySource.values():
+        priority = lambda i: transitions[i].getPriority()
+        # stable sort keeps transitions of the same priority in list order
+        byPriority = sorted(indices, key=priority)
+        higher = []
+        higherGuards = []
+        start = 0
+        while start < len(byPriority):
+            end = start + 1
+            while (end < len(byPriority) and
+                   priority(byPriority[end]) == priority(byPriority[start])):
+                end += 1
+            samePriority = byPriority[start:end]
+            for i in samePriority:
+                guards[i] = higherGuards
+                negated[i] = negateConditions(transitions[i].conditions)
+            higher = list(merge(higher, samePriority))
+            higherGuards = [negated[i] for i in higher]
+            start = end
+
+    return guards
+
+# Generates the transitions of the process of given chart (without loops
+# emulating during actions); states - ssid = DVE state name
+def generateChartTransitions(chart, states, force_alternation,
+                             simplify_guards):
+    from guard_simplifier import simplifyGuard
+    higherPriorityGuards = getHigherPriorityGuards(chart.transitions)
+    # lists of negated conditions are shared by transitions, so their texts
+    # are joined only once; id of list = (list, text, list contains false)
+    texts = dve.ExpressionTexts()
+    higherTexts = {}
+    for trans, higherGuards in zip(chart.transitions, higherPriorityGuards):
         # conditions and negated conditions of transitions with higher priority
-        conditions = copy(trans["conditions"])
+        conditions = list(trans.conditions)
         if force_alternation:
-            conditions.append("not %s" % ALTERNATION_VAR)
-        for trans2 in chart.transitions:
-            if (trans2["src"] == trans["src"] and
-            (trans2["srcHierarchy"] < trans["srcHierarchy"] or
-            (trans2["srcHierarchy"] == trans["srcHierarchy"] and
-            trans2["transType"] < trans["transType"]) or
-            (trans2["srcHierarchy"] == trans["srcHierarchy"] and
-            (trans2["transType"] == trans["transType"] and
-            trans2["order"] < trans["order"])))):
-                conditions.append(negateConditions(trans2["conditions"]))
-        if "false" in conditions:
+            conditions.append(Unary("!", Name(ALTERNATION_VAR)))
+        if simplify_guards:
+            conditions = simplifyGuard(conditions + higherGuards)
+            if conditions is None:
+                continue
+        elif higherGuards != []:
+            entry = higherTexts.get(id(higherGuards))
+            if entry is None:
+                entry = (higherGuards, texts.join(higherGuards),
+                         FALSE in higherGuards)
+                higherTexts[id(higherGuards)] = entry
+            if entry[2]:
+                continue
+            conditions.append(entry[1])
+        if FALSE in conditions:
             continue
 
         # actions
-        actions = copy(trans["actions"])
+        actions = list(trans.getActions())
         if force_alternation:
             actions.append("%s = 1" % ALTERNATION_VAR)
 
-        # printing
-        if not startTrans:
-            startTrans = True
-            outfile.write("\ttrans\n")
-        outfile.write("\t\t")
-
-        outfile.write("%s -> %s" % (source, destination))
-        outfile.write((" {"))
-        if conditions != []:
-            outfile.write(" guard %s;" % ", ".join(conditions))
-        if actions != []:
-            outfile.write(" effect %s;" % ", ".join(actions))
-        outfile.write(" }\n")
-
-    # during actions
-    for stateSSID, state in chart.states.items():
-        # from -> to
-        stateID = getStateID(stateSSID, chart.states, state_names)
+        yield dve.Transition(states[trans.src], states[trans.dst],
+                             conditions, actions)
 
+# Generates the loops of the process of given chart emulating during
+# actions; states - ssid = DVE state name
+def generateDuringTransitions(chart, states, force_alternation,
+                              simplify_guards):
+    from planarization import negateConditions
+    from guard_simplifier import simplifyGuard
+    for stateSSID, state in chart.states.items():
         # conditions
         conditions = []
         if force_alternation:
-            conditions.append("not %s" % ALTERNATION_VAR)
-        for trans in filter(lambda x:x["src"] == stateSSID, chart.transitions):
-            conditions.append(negateConditions(trans["conditions"]))
-        if "false" in conditions:
+            conditions.append(Unary("!", Name(ALTERNATION_VAR)))
+        for trans in chart.getOutgoing(stateSSID):
+            conditions.append(negateConditions(trans.conditions))
+        if simplify_guards:
+            conditions = simplifyGuard(conditions)
+            if conditions is None:
+                continue
+        if FALSE in conditions:
             continue
 
         # actions
-        actions = copy(state["label"]["du"])
+        actions = list(state.du)
         if actions == []:
             continue
         if force_alternation:
             actions.append("%s = 1" % ALTERNATION_VAR)
 
-        # printing
-        if not startTrans:
-            startTrans = True
-            outfile.write("\ttrans\n")
-        outfile.write("\t\t")
+        yield dve.Transition(states[stateSSID], states[stateSSID],
+                             conditions, actions)
 
-        outfile.write("%s -> %s" % (stateID, stateID))
-        outfile.write((" {"))
-        if conditions != []:
-            outfile.write(" guard %s;" % ", ".join(conditions))
-        outfile.write(" effect %s;" % ", ".join(actions))
-        outfile.write(" }\n")
-
-    outfile.write("}\n\n")
+def getProcessName(chart, state_names):
+    if state_names == "id":
+        return "%s%s" % (PROCESS_PREFIX, chart.chartID)
+    return "%s%s" % (PROCESS_PREFIX, chart.chartName)
+
+# Writes classes of states merged by minimizeStates, one line for each
+# class: process.state: ssids of the merged states.
+# mergedStates - for each chart, representative ssid = [ssids]
+def writeStateMap(charts, mergedStates, state_names, outfile):
+    # an empty map is written too, replacing the map of an earlier run
+    outfile.write("")
+    for chart, classes in zip(charts, mergedStates):
+        processName = getProcessName(chart, state_names)
+        for ssid, members in classes.items():
+            outfile.write("%s.%s: %s\n"
+                          % (processName,
+                             getStateID(ssid, chart.states, state_names),
+                             " ".join(members)))
+
+# Returns DVE process of given planarized chart. The transitions are
+# generated as they are written.
+def getProcess(chart, state_names, input_values, force_alternation,
+               simplify_guards=False):
+    name = getProcessName(chart, state_names)
+
+    # variables (inputs are global variables assigned by feed_inputs)
+    variables = []
+    for varName, varDef in chart.variables.items():
+        if input_values is not None and varDef["scope"] == "input":
+            continue
+        variables.append(dve.Variable(varDef["type"], varName, varDef["init"],
+                                      varDef["scope"] == "input",
+                                      varDef["const"]))
+
+    # DVE names of the states are determined once
+    states = OrderedDict((ssid, getStateID(ssid, chart.states, state_names))
+                         for ssid in chart.states)
+
+    transitions = chain(generateChartTransitions(chart, states,
+                                                 force_alternation,
+                                                 simplify_guards),
+                        generateDuringTransitions(chart, states,
+                                                  force_alternation,
+                                                  simplify_guards))
+    return dve.Process(name, variables, list(states.values()),
+                       "%sstart" % STATE_PREFIX, transitions)
+
+# Generates transitions of process feed_inputs in the chain mode: instead of
+# one transition for each combination of input values, the process assigns
+# the input variables one after another, going through an intermediate state
+# after each variable. When alternating, the chain starts with a guard on the
+# alternation variable and only its last transition passes control to the
+# charts.
+def generateFeedChain(states, feedVars, force_alternation):
+    for i, (varName, (valueMin, valueMax)) in enumerate(feedVars):
+        source = states[i]
+        destination = states[(i + 1) % len(states)]
+        first = i == 0
+        last = i == len(feedVars) - 1
+        guard = []
+        if force_alternation and first:
+            guard = [ALTERNATION_VAR]
+        for value in range(valueMin, valueMax + 1):
+            effect = ["%s = %s" % (varName, value)]
+            if force_alternation and last:
+                effect.insert(0, "%s = 0" % ALTERNATION_VAR)
+            yield dve.Transition(source, destination, guard, effect)
+
+# Generates effects of the transitions of process feed_inputs in the product
+# mode. The values of the variables are counted like digits of a mixed-radix
+# number (the first variable being the least significant digit), so that the
+# n-th effect corresponds to the n-th combination of input values.
+def generateFeedEffects(feedVars):
+    assignments = [["%s = %s" % (varName, value)
+                    for value in range(valueMin, valueMax + 1)]
+                   for varName, (valueMin, valueMax) in feedVars]
+    digits = [0] * len(assignments)
+    current = [varAssignments[0] for varAssignments in assignments]
+    while True:
+        yield ", ".join(current)
+        for i, varAssignments in enumerate(assignments):
+            if digits[i] + 1 < len(varAssignments):
+                digits[i] += 1
+                current[i] = varAssignments[digits[i]]
+                break
+            digits[i] = 0
+            current[i] = varAssignments[0]
+        else:
+            return
 
-def writeProcessFeedInputs(outfile, charts, input_values, force_alternation):
+# Generates transitions of process feed_inputs in the product mode.
+def generateFeedProduct(feedVars, force_alternation):
+    if force_alternation:
+        guard = [ALTERNATION_VAR]
+        reset = "%s = 0" % ALTERNATION_VAR
+        for effect in generateFeedEffects(feedVars):
+            yield dve.Transition("start", "start", guard, [reset, effect])
+    else:
+        for effect in generateFeedEffects(feedVars):
+            yield dve.Transition("start", "start", (), [effect])
+
+def countFeedTransitions(byteVars, intVars, byteSize, intSize, feed_mode):
+    if byteVars == [] and intVars == []:
+        return 0
+    if feed_mode == "chain":
+        return byteSize * len(byteVars) + intSize * len(intVars)
+    return intSize**len(intVars) * byteSize**len(byteVars)
+
+# Returns global variables and process feed_inputs (None if there are no
+# inputs) assigning the input variables of given charts. The transitions of
+# the process are generated as they are written.
+def getFeedInputs(charts, input_values, force_alternation,
+                  feed_mode="product", max_feed_transitions=None):
     byteMin = 0
     byteMax = 1
     intMin = input_values[0]
@@ -185,77 +337,394 @@ def writeProcessFeedInputs(outfile, charts, input_values, force_alternation):
     byteSize = byteMax - byteMin + 1
     intSize = intMax - intMin + 1
     
-    if force_alternation:
-        outfile.write("byte %s;\n" % ALTERNATION_VAR)
+    inputVars = []
     byteVars = []
     intVars = []
     for chart in charts:
         for varName, varDef in chart.variables.items():
             if varDef["scope"] == "input":
-                outfile.write("%s %s;\n" % (varDef["type"], varName))
+                inputVars.append((varName, varDef["type"]))
                 if varDef["type"] == "byte":
                     byteVars.append(varName)
                 else:
                     intVars.append(varName)
 
-    if intVars == [] and byteVars == []:
-        return
+    # checking the size of the process before anything is written
+    transCount = countFeedTransitions(byteVars, intVars, byteSize, intSize,
+                                      feed_mode)
+    if (max_feed_transitions is not None and
+        transCount > max_feed_transitions):
+        raise limitExceededException("process feed_inputs would have %d " 
+                                     "transitions, the limit is %d"
+                                     % (transCount, max_feed_transitions))
+
+    variables = []
+    if force_alternation:
+        variables.append(dve.Variable("byte", ALTERNATION_VAR))
+    for varName, varType in inputVars:
+        variables.append(dve.Variable(varType, varName))
 
-    outfile.write("\nprocess feed_inputs {\n")
-    outfile.write("\tstate start;\n\tinit start;\n\ttrans\n")
+    if intVars == [] and byteVars == []:
+        return (variables, None)
 
-    if intVars == []:
-        lastVar = byteVars[-1]
+    feedVars = ([(varName, (byteMin, byteMax)) for varName in byteVars] +
+                [(varName, (intMin, intMax)) for varName in intVars])
+    if feed_mode == "chain":
+        states = ["start"] + ["feed_%d" % i for i in range(1, len(feedVars))]
+        transitions = generateFeedChain(states, feedVars, force_alternation)
     else:
-        lastVar = intVars[-1]
-    for i in range(0, intSize**len(intVars) * byteSize**len(byteVars)):
-        l = i
-        if force_alternation:
-            outfile.write("\t\tstart -> start { guard %s; effect %s = 0, "
-                          % (ALTERNATION_VAR, ALTERNATION_VAR))
-        else:
-            outfile.write("\t\tstart -> start { effect ")
-        for varName in byteVars:
-            outfile.write("%s = %s" % (varName, int(l % byteSize + byteMin)))
-            l = (l - l % byteSize) / byteSize
-            if varName != lastVar:
-                outfile.write(", ")
-        for varName in intVars:
-            outfile.write("%s = %s" % (varName, int(l % intSize) + intMin))
-            l = (l - l % intSize) / intSize
-            if varName != lastVar:
-                outfile.write(", ")
-        outfile.write("; }\n")
-    outfile.write("}\n\n")
-
-def sf2dve(infile, outfile, state_names, input_values, force_alternation):
+        states = ["start"]
+        transitions = generateFeedProduct(feedVars, force_alternation)
+    return (variables, dve.Process("feed_inputs", [], states, "start",
+                                   transitions))
+
+# Planarizes given chart. If the planarization fails on a problem of the
+# chart, returns list of all problems of the labels instead.
+def planarizeChart(chartEl):
     from planarization import makePlanarized
     try:
-        stateflowEtree = etree.parse(infile)
-    except:
-        raise invalidInputException("failed to parse XML")
-    checkInput(stateflowEtree)
-
-    charts = []
-    for chart in stateflowEtree.findall("Stateflow/machine/Children/chart"):
-        charts.append(makePlanarized(chart))
-
+        return makePlanarized(chartEl)
+    except (notSupportedException, invalidInputException, ValueError,
+            TypeError):
+        problems = checkLabels(chartEl)
+        if problems == []:
+            raise
+        return problems
+
+# Planarizes chart serialized as XML; used by the worker processes of
+# ChartPlanarizer.
+def planarizeSerialized(chartXML):
+    return planarizeChart(etree.fromstring(chartXML))
+
+# Checks and planarizes chart elements added one by one. Charts found in the
+# cache (if given) are not planarized again. With more jobs, the charts are
+# serialized and planarized in a pool of processes when all of them are
+# added; the chart elements are not needed after they are added.
+class ChartPlanarizer:
+    jobs = 1
+    cache = None
+    options = ()
+    # planarized charts (None for charts not planarized yet, list of problems
+    # for invalid charts)
+    charts = None
+    # cache keys of the planarized charts not found in the cache
+    keys = None
+    # indices and serialized XML of the charts not planarized yet
+    pending = None
+
+    def __init__(self, jobs=1, cache=None, options=()):
+        self.jobs = jobs
+        self.cache = cache
+        self.options = options
+        self.charts = []
+        self.keys = []
+        self.pending = []
+
+    def add(self, chartEl):
+        problems = checkChart(chartEl)
+        if problems != []:
+            self.charts.append(problems + checkLabels(chartEl))
+            self.keys.append(None)
+            return
+
+        key = None
+        chart = None
+        if self.cache is not None:
+            key = self.cache.getKey(chartEl, self.options)
+            chart = self.cache.get(key)
+            if chart is not None:
+                key = None
+
+        if chart is None and self.jobs <= 1:
+            chart = planarizeChart(chartEl)
+        elif chart is None:
+            self.pending.append((len(self.charts),
+                                 etree.tostring(chartEl, with_tail=False)))
+        self.charts.append(chart)
+        self.keys.append(key)
+
+    # Returns the planarized charts in the order in which they were added
+    # (lists of problems for invalid charts).
+    def getCharts(self):
+        if len(self.pending) == 1:
+            planarized = [planarizeSerialized(self.pending[0][1])]
+        elif self.pending != []:
+            from multiprocessing import Pool
+            from multiprocessing.pool import MaybeEncodingError
+            pool = Pool(min(self.jobs, len(self.pending)))
+            try:
+                results = [pool.apply_async(planarizeSerialized, (chartXML,))
+                           for (i, chartXML) in self.pending]
+                planarized = []
+                for (i, chartXML), result in zip(self.pending, results):
+                    try:
+                        planarized.append(result.get())
+                    except MaybeEncodingError:
+                        # the planarized chart couldn't be sent back from the
+                        # worker, so it is planarized again in this process
+                        planarized.append(
+                            planarizeChart(etree.fromstring(chartXML)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            planarized = []
+        for (i, chartXML), chart in zip(self.pending, planarized):
+            self.charts[i] = chart
+        self.pending = []
+
+        for chart, key in zip(self.charts, self.keys):
+            if key is not None and not isinstance(chart, list):
+                self.cache.put(key, chart)
+        self.keys = [None] * len(self.charts)
+        return self.charts
+
+# Generates DVE processes of given planarized charts (after process
+# feed_inputs, if given).
+def generateProcesses(charts, feedProcess, state_names, input_values,
+                      force_alternation, simplify_guards):
+    if feedProcess is not None:
+        yield feedProcess
+    for chart in charts:
+        yield getProcess(chart, state_names, input_values, force_alternation,
+                         simplify_guards)
+
+# Returns DVE model of given planarized charts. The processes are created
+# one by one as they are written, so only one of them is kept in memory.
+def getModel(charts, state_names, input_values, force_alternation,
+             feed_mode="product", max_feed_transitions=None,
+             simplify_guards=False):
+    variables = []
+    feedProcess = None
     if input_values is not None:
-        writeProcessFeedInputs(outfile, charts, input_values, force_alternation)
-
+        (variables, feedProcess) = getFeedInputs(charts, input_values,
+                                                 force_alternation, feed_mode,
+                                                 max_feed_transitions)
+    return dve.Model(variables,
+                     generateProcesses(charts, feedProcess, state_names,
+                                       input_values, force_alternation,
+                                       simplify_guards))
+
+def sf2dve(infile, outfile, state_names, input_values, force_alternation,
+           feed_mode="product", max_feed_transitions=None, jobs=1,
+           cache=None, simplify_guards=False, prune_infeasible=False,
+           optimize_effects=False, dedupe_transitions=False,
+           merge_transitions=False, minimize_states=False, state_map=None):
+    planarizer = ChartPlanarizer(jobs, cache,
+                                 (state_names, input_values, force_alternation))
+
+    stateflowEtree = parseStateflow(infile, planarizer.add)
+    problems = checkInput(stateflowEtree)
+    charts = planarizer.getCharts()
     for chart in charts:
-        writeProcess(chart, outfile, state_names, input_values, force_alternation)
+        if isinstance(chart, list):
+            problems.extend(chart)
+    raiseProblems(problems)
+    if optimize_effects:
+        from effect_optimizer import optimizeEffects
+        optimizeEffects(charts)
+    if prune_infeasible:
+        from feasibility import pruneInfeasible
+        pruneInfeasible(charts, input_values)
+    if dedupe_transitions or merge_transitions:
+        from transition_merger import dedupeTransitions
+        dedupeTransitions(charts, merge_transitions)
+    if minimize_states:
+        from state_minimizer import minimizeStates
+        mergedStates = [minimizeStates(chart) for chart in charts]
+
+    # limits are checked before anything is written
+    model = getModel(charts, state_names, input_values, force_alternation,
+                     feed_mode, max_feed_transitions, simplify_guards)
+    if minimize_states and state_map is not None:
+        writeStateMap(charts, mergedStates, state_names, state_map)
+    dve.writeModel(model, outfile)
+
+# Output file opened when first written, so that an existing file is not
+# overwritten when the conversion fails before producing any output.
+class LazyOutput:
+    path = None
+    outfile = None
+
+    def __init__(self, path):
+        self.path = path
+
+    def isOpened(self):
+        return self.outfile is not None
+
+    def write(self, text):
+        if self.outfile is None:
+            self.outfile = open(self.path, 'w')
+        self.outfile.write(text)
+
+    def close(self):
+        if self.outfile is not None:
+            self.outfile.close()
+
+# Returns name of the member of SLX archive with the Stateflow data. Newer
+# SLX files store it in a separate part related to the block diagram; the
+# relationships of the block diagram are looked up first, then the names of
+# the members. Without a Stateflow part, the data are in the block diagram.
+# Raises invalidInputException if several parts could hold the data.
+def getStateflowPart(archive):
+    names = set(archive.namelist())
+    parts = []
+    if BLOCKDIAGRAM_RELS in names:
+        try:
+            with archive.open(BLOCKDIAGRAM_RELS) as relsFile:
+                relationships = etree.parse(relsFile).getroot()
+        except etree.LxmlError:
+            relationships = []
+        for relationship in relationships:
+            target = relationship.get("Target")
+            if (target is None or
+                STATEFLOW_PART_RE.search(relationship.get("Type", "") +
+                                         " " + target) is None):
+                continue
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.join(posixpath.dirname(BLOCKDIAGRAM_PART),
+                                        target)
+            target = posixpath.normpath(target)
+            if target in names and target not in parts:
+                parts.append(target)
+
+    if not parts:
+        parts = [name for name in sorted(names)
+                 if name.endswith(".xml") and
+                    STATEFLOW_PART_RE.search(posixpath.basename(name))
+                    is not None]
+    if len(parts) > 1:
+        raise invalidInputException("SLX archive contains several Stateflow "
+                                    "parts: %s" % ", ".join(parts))
+    if parts:
+        return parts[0]
+    return BLOCKDIAGRAM_PART
+
+# Returns stream with the Stateflow XML contained in given SLX or XML file.
+# Only the member with the Stateflow data is decompressed, as it is read.
+# Raises KeyError if the SLX archive doesn't contain the XML and
+# invalidInputException if it contains several Stateflow parts.
+def openInput(inputFile):
+    if zipfile.is_zipfile(inputFile):
+        archive = zipfile.ZipFile(inputFile)
+        return archive.open(getStateflowPart(archive))
+    # not zipfile, unfortunately is_zipfile doesn't seek back to
+    # beginning so this needs to be done by hand (lxml.parse doesn't
+    # seek either)
+    inputFile.seek(0)
+    return inputFile
+
+def getErrorMessage(e):
+    if isinstance(e, inputProblemsException):
+        return "\n".join(getErrorMessage(problem) for problem in e.problems)
+    if isinstance(e, notSupportedException):
+        return "Following is not supported: %s" % e
+    if isinstance(e, invalidInputException):
+        return "Input is not valid stateflow: %s" % e
+    if isinstance(e, limitExceededException):
+        return "Limit exceeded: %s" % e
+    if isinstance(e, (IOError, OSError)):
+        return "Can't convert file: %s" % e
+    return "Failed to convert file: %s" % e
+
+# Converts one file in batch mode; job = (input path, output path, arguments
+# of sf2dve). Returns the input path and an error message (None on success).
+def convertFile(job):
+    (inputPath, outputPath, arguments) = job
+    outputFile = LazyOutput(outputPath)
+    try:
+        with open(inputPath, 'rb') as inputFile:
+            try:
+                stream = openInput(inputFile)
+            except KeyError:
+                return (inputPath, "Couldn't find Stateflow XML file in "
+                                   "given archive.")
+            try:
+                sf2dve(stream, outputFile, *arguments)
+            finally:
+                outputFile.close()
+    except Exception as e:
+        # not leaving incomplete output
+        if outputFile.isOpened():
+            os.remove(outputPath)
+        return (inputPath, getErrorMessage(e))
+    return (inputPath, None)
+
+# Returns SLX and XML files in given directory or files listed in given file
+# (one path per line).
+def getBatchInputs(batch):
+    if os.path.isdir(batch):
+        return [os.path.join(batch, name) for name in sorted(os.listdir(batch))
+                if name.rsplit(".", 1)[-1].lower() in ("slx", "xml")]
+    with open(batch) as listFile:
+        return [line.strip() for line in listFile if line.strip() != ""]
+
+# Converts files in batch using given number of processes. Failure of one
+# file is reported and the rest of the files is still converted.
+def convertBatch(batch, output_dir, jobs, arguments):
+    try:
+        inputPaths = getBatchInputs(batch)
+    except IOError as e:
+        print("Can't read batch input: %s" % e, file=sys.stderr)
+        return 1
 
-    outfile.write("system async;\n\n")
+    if output_dir is not None:
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            print("Can't create output directory: %s" % e, file=sys.stderr)
+            return 1
+
+    # inputs with the same output (same name in different directories or
+    # different suffixes) are not converted, not to overwrite each other
+    batchJobs = []
+    outputs = {}
+    failed = 0
+    for inputPath in inputPaths:
+        outputPath = "%s.dve" % inputPath.rsplit(".", 1)[0]
+        if output_dir is not None:
+            outputPath = os.path.join(output_dir, os.path.basename(outputPath))
+        key = os.path.normcase(os.path.abspath(outputPath))
+        if key in outputs:
+            failed += 1
+            print("%s: output %s would overwrite output of %s"
+                  % (inputPath, outputPath, outputs[key]), file=sys.stderr)
+            continue
+        outputs[key] = inputPath
+        batchJobs.append((inputPath, outputPath, arguments))
+
+    if jobs > 1:
+        from multiprocessing import Pool
+        pool = Pool(jobs)
+        results = pool.imap(convertFile, batchJobs)
+    else:
+        pool = None
+        results = map(convertFile, batchJobs)
+
+    for (inputPath, error) in results:
+        if error is not None:
+            failed += 1
+            for line in error.split("\n"):
+                print("%s: %s" % (inputPath, line), file=sys.stderr)
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    if failed:
+        print("%d of %d files failed" % (failed, len(inputPaths)),
+              file=sys.stderr)
+        return 1
 
 def main():
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("input", help="input Stateflow SLX or XML file",
-                        type=argparse.FileType('rb'))
+                        type=argparse.FileType('rb'), nargs='?')
     parser.add_argument("output", help="output DVE file; if not set, name " +\
                         "of input file with dve suffix will be used",
-                        type=argparse.FileType('w'), nargs='?')
+                        nargs='?')
     parser.add_argument("-n", "--state-names", help="as name of state " +\
                         "will be used: id (unique but not human friendly), " +\
                         "hierarchical name (longer, may not be unique) or " +\
@@ -274,35 +743,89 @@ def main():
                         "the marginal numbers in format: 0,7 If the first " +\
                         "number is negative, use format: ' -7,7'", type=str, 
                         default=None)
+    parser.add_argument("-m", "--feed-mode", help="how the feed_inputs " +\
+                        "process assigns the inputs: product (default) " +\
+                        "uses one transition for each combination of " +\
+                        "input values, chain assigns the inputs one by " +\
+                        "one through intermediate states, which keeps " +\
+                        "the process linear in the number of inputs. " +\
+                        "Use product for models processed by test.py.",
+                        choices=["product", "chain"], default="product")
+    parser.add_argument("--max-feed-transitions", help="maximal number " +\
+                        "of transitions of the feed_inputs process; if the " +\
+                        "process would be bigger, no output is written.",
+                        type=int, default=None)
     parser.add_argument("-a", "--force-alternation", help="adjusts the " +\
                         "processes, such that they are alternating - in " +\
                         "odd steps the feed_inputs process is executed, " +\
                         "in even steps some other process is executed.",
                         action='store_true')
+    parser.add_argument("-s", "--simplify-guards", help="simplifies " +\
+                        "guards of the transitions (removes duplicate and " +\
+                        "redundant conditions) and omits transitions " +\
+                        "with contradictory guards.", action='store_true')
+    parser.add_argument("-p", "--prune-infeasible", help="omits " +\
+                        "transitions whose conditions can never hold " +\
+                        "within the ranges of the variables (given by " +\
+                        "their types and by the interval of the input " +\
+                        "values).", action='store_true')
+    parser.add_argument("-e", "--optimize-effects", help="propagates " +\
+                        "constants within the effects of the transitions " +\
+                        "and removes assignments overwritten later in the " +\
+                        "same effect.", action='store_true')
+    parser.add_argument("-d", "--dedupe-transitions", help="omits " +\
+                        "transitions with the same source, destination, " +\
+                        "priority, guard and effect as another transition.",
+                        action='store_true')
+    parser.add_argument("--merge-transitions", help="like " +\
+                        "--dedupe-transitions, but also merges transitions " +\
+                        "that differ only in their guards into one " +\
+                        "transition with disjunction of the guards.",
+                        action='store_true')
+    parser.add_argument("-r", "--minimize-states", help="merges states " +\
+                        "of each chart with the same during actions and " +\
+                        "the same outgoing transitions (leading to merged " +\
+                        "states as well). States of the merged DVE model " +\
+                        "then may stand for several Stateflow states, see " +\
+                        "--state-map.", action='store_true')
+    parser.add_argument("--state-map", help="file for the list of states " +\
+                        "merged by --minimize-states, one line for each " +\
+                        "merged state: process.state: SSIDs of the " +\
+                        "Stateflow states", default=None)
+    parser.add_argument("-b", "--batch", help="converts all SLX and XML " +\
+                        "files in given directory or files listed in given " +\
+                        "file (one per line) instead of a single input. " +\
+                        "Each output is written next to its input unless " +\
+                        "--output-dir is set.", metavar="DIR_OR_LIST",
+                        type=str, default=None)
+    parser.add_argument("-o", "--output-dir", help="directory for output " +\
+                        "files in batch mode (created if it doesn't exist)",
+                        type=str, default=None)
+    parser.add_argument("-j", "--jobs", help="number of processes " +\
+                        "converting files in batch mode, or planarizing " +\
+                        "charts of the input otherwise (default 1)",
+                        type=int, default=1)
+    parser.add_argument("--cache-dir", help="directory of the cache of " +\
+                        "planarized charts (default $XDG_CACHE_HOME/sf2dve " +\
+                        "or ~/.cache/sf2dve)", type=str, default=None)
+    parser.add_argument("--cache-size", help="maximal size of the cache " +\
+                        "in megabytes (default 256); least recently used " +\
+                        "charts are removed first", type=int, default=256)
+    parser.add_argument("--no-cache", help="charts are neither looked up " +\
+                        "in nor stored to the cache; without it, " +\
+                        "planarized charts are cached in the directory " +\
+                        "given by --cache-dir", action='store_true')
     args = parser.parse_args()
 
-    input_file = args.input
-    output_file = args.output
-    if output_file is None:
-        if input_file == sys.stdin:
-            output_file = sys.stdout
-        else:
-            try:
-                output_file = open("%s.dve" % input_file.name.rsplit(".", 1)[0], 'w')
-            except IOError as e:
-                print("Can't open output file: %s" % e, file=sys.stderr)
-                return 1
-    if input_file != sys.stdin and zipfile.is_zipfile(input_file):
-        try:
-            input_file = zipfile.ZipFile(input_file).open("simulink/blockdiagram.xml")
-        except KeyError:
-            print("Couldn't find Stateflow XML file in given archive.", file=sys.stderr)
-            return 1
-    elif input_file != sys.stdin:
-        # not zipfile, unfortunately is_zipfile doesn't seek back to
-        # beginning so this needs to be done by hand (lxml.parse doesn't
-        # seek either)
-        input_file.seek(0)
+    if args.batch is None and args.input is None:
+        parser.error("input file or --batch is required")
+    if args.batch is not None and (args.input is not None or
+                                   args.output is not None):
+        parser.error("input and output files can't be used with --batch")
+    if args.batch is not None and args.state_map is not None:
+        parser.error("--state-map can't be used with --batch")
+    if args.state_map is not None and not args.minimize_states:
+        parser.error("--state-map requires --minimize-states")
 
     if args.input_values is not None:
         input_values = args.input_values.split(',')
@@ -328,15 +851,64 @@ def main():
     if input_values is None:
         args.force_alternation = False
 
+    if args.no_cache:
+        cache = None
+    else:
+        from chart_cache import ChartCache, getDefaultCacheDir, getSourceDigest
+        cacheDir = args.cache_dir
+        if cacheDir is None:
+            cacheDir = getDefaultCacheDir()
+        cache = ChartCache(cacheDir, args.cache_size * 1024 * 1024,
+                           "%s-%s" % (VERSION, getSourceDigest()))
+
+    if args.batch is not None:
+        return convertBatch(args.batch, args.output_dir, args.jobs,
+                            (args.state_names, input_values,
+                             args.force_alternation, args.feed_mode,
+                             args.max_feed_transitions, 1, cache,
+                             args.simplify_guards, args.prune_infeasible,
+                             args.optimize_effects, args.dedupe_transitions,
+                             args.merge_transitions, args.minimize_states))
+
+    # output files are opened when the conversion succeeds
+    input_file = args.input
+    if args.output == "-" or (args.output is None and input_file == sys.stdin):
+        output_file = sys.stdout
+    elif args.output is None:
+        output_file = LazyOutput("%s.dve" % input_file.name.rsplit(".", 1)[0])
+    else:
+        output_file = LazyOutput(args.output)
+    state_map = None
+    if args.state_map is not None:
+        state_map = LazyOutput(args.state_map)
+    if input_file != sys.stdin:
+        try:
+            input_file = openInput(input_file)
+        except KeyError:
+            print("Couldn't find Stateflow XML file in given archive.", file=sys.stderr)
+            return 1
+        except invalidInputException as e:
+            print(getErrorMessage(e), file=sys.stderr)
+            return 1
+
     try:
         sf2dve(input_file, output_file, args.state_names, input_values,
-               args.force_alternation)
-    except notSupportedException as e:
-        print("Following is not supported: %s" % e, file=sys.stderr)
+               args.force_alternation, args.feed_mode,
+               args.max_feed_transitions, args.jobs, cache,
+               args.simplify_guards, args.prune_infeasible,
+               args.optimize_effects, args.dedupe_transitions,
+               args.merge_transitions, args.minimize_states, state_map)
+    except (notSupportedException, invalidInputException,
+            limitExceededException, inputProblemsException) as e:
+        print(getErrorMessage(e), file=sys.stderr)
         return 1
-    except invalidInputException as e:
-        print("Input is not valid stateflow: %s" % e, file=sys.stderr)
+    except (IOError, OSError) as e:
+        print(getErrorMessage(e), file=sys.stderr)
         return 1
+    finally:
+        for outfile in (output_file, state_map):
+            if isinstance(outfile, LazyOutput):
+                outfile.close()
 
 if __name__ == "__main__":
     sys.exit(main())
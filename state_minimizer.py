@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Merging of equivalent states of the planarized charts. States are
+equivalent if they have the same during actions and their outgoing
+transitions, ordered by priority, have the same conditions and actions and
+lead to equivalent states (bisimulation). The classes of equivalent states
+are found by partition refinement: states are first split by their own
+behaviour and then repeatedly by the classes of the destinations of their
+transitions, until no class is split. Each class is replaced by its first
+state. The synthetic states start and error are never merged.
+"""
+
+from collections import OrderedDict
+
+# states added by the planarization, not equivalent to any other state
+SYNTHETIC_STATES = ("start", "error")
+
+def getTexts(expressions):
+    return tuple(str(expr) for expr in expressions)
+
+# Returns behaviour of given state without the destinations of the
+# transitions, as (during actions, [(transition key, destination)]). Only the
+# order of priorities of the transitions matters, so priorities are replaced
+# by their ranks among the priorities of the transitions from the state.
+def getBehaviour(chart, ssid):
+    outgoing = chart.getOutgoing(ssid)
+    priorities = sorted(set(trans.getPriority() for trans in outgoing))
+    ranks = dict((priority, rank) for (rank, priority) in enumerate(priorities))
+    transitions = [((ranks[trans.getPriority()], getTexts(trans.conditions),
+                     getTexts(trans.getActions())), trans.dst)
+                   for trans in outgoing]
+    return (getTexts(chart.states[ssid].du), transitions)
+
+# Returns block numbers of the states, numbered by the first state of each
+# block; signatures - ssid = signature.
+def getBlocks(signatures):
+    numbers = {}
+    blocks = {}
+    for ssid, signature in signatures.items():
+        blocks[ssid] = numbers.setdefault(signature, len(numbers))
+    return blocks
+
+# Merges equivalent states of given planarized chart. Returns the merged
+# classes as representative ssid = [ssids of the class] (only classes with
+# more than one state).
+def minimizeStates(chart):
+    behaviours = OrderedDict((ssid, getBehaviour(chart, ssid))
+                             for ssid in chart.states)
+
+    signatures = OrderedDict()
+    for ssid, (duTexts, transitions) in behaviours.items():
+        # synthetic states are kept in blocks of their own
+        synthetic = ssid if ssid in SYNTHETIC_STATES else None
+        signatures[ssid] = (synthetic, duTexts,
+                            tuple(sorted(key for (key, dst) in transitions)))
+    blocks = getBlocks(signatures)
+
+    count = None
+    while count != len(set(blocks.values())):
+        count = len(set(blocks.values()))
+        signatures = OrderedDict()
+        for ssid, (duTexts, transitions) in behaviours.items():
+            signatures[ssid] = (blocks[ssid],
+                                tuple(sorted((key, blocks[dst])
+                                             for (key, dst) in transitions)))
+        blocks = getBlocks(signatures)
+
+    # the first state of each block represents it
+    representatives = {}
+    classes = OrderedDict()
+    for ssid in chart.states:
+        representative = representatives.setdefault(blocks[ssid], ssid)
+        classes.setdefault(representative, []).append(ssid)
+
+    transitions = []
+    for trans in chart.transitions:
+        if trans.src in classes:
+            trans.dst = representatives[blocks[trans.dst]]
+            transitions.append(trans)
+    chart.setTransitions(transitions)
+    chart.states = OrderedDict((ssid, state)
+                               for (ssid, state) in chart.states.items()
+                               if ssid in classes)
+
+    return OrderedDict((ssid, members) for (ssid, members) in classes.items()
+                       if len(members) > 1)
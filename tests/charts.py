@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Construction of small Stateflow inputs for the tests.
+"""
+
+import io
+from xml.sax.saxutils import escape
+from sf2dve import sf2dve
+
+def state(ssid, label, children=""):
+    if children != "":
+        children = "<Children>%s</Children>" % children
+    return ('<state SSID="%d"><P Name="labelString">%s</P>'
+            '<P Name="type">OR_STATE</P>%s</state>'
+            % (ssid, escape(label), children))
+
+# default transition has no source
+def transition(ssid, label, src, dst, order=1):
+    srcXML = ""
+    if src is not None:
+        srcXML = '<src><P Name="SSID">%d</P></src>' % src
+    return ('<transition SSID="%d"><P Name="labelString">%s</P>%s'
+            '<dst><P Name="SSID">%d</P></dst>'
+            '<P Name="executionOrder">%d</P></transition>'
+            % (ssid, escape(label), srcXML, dst, order))
+
+def data(name, dataType="int32", scope="LOCAL_DATA", initialValue="0"):
+    return ('<data name="%s"><P Name="scope">%s</P>'
+            '<P Name="dataType">%s</P>'
+            '<props><P Name="initialValue">%s</P></props></data>'
+            % (name, scope, dataType, initialValue))
+
+def chart(chartID, name, children):
+    return ('<chart id="%d"><P Name="name">%s</P><Children>%s</Children>'
+            '</chart>' % (chartID, name, children))
+
+# Returns Stateflow XML (bytes) of given charts.
+def model(*charts):
+    return ('<?xml version="1.0" encoding="utf-8"?>'
+            '<ModelInformation><Stateflow><machine id="1"><Children>%s'
+            '</Children></machine></Stateflow></ModelInformation>'
+            % "".join(charts)).encode("utf-8")
+
+# Returns chart with states A and B and one transition from A to B with
+# given label.
+def simpleChart(chartID, label, variables=("x",)):
+    base = chartID * 100
+    return chart(chartID, "c%d" % chartID,
+                 state(base + 1, "A") + state(base + 2, "B") +
+                 transition(base + 3, "", None, base + 1) +
+                 transition(base + 4, label, base + 1, base + 2) +
+                 "".join(data(name) for name in variables))
+
+# Converts given Stateflow XML with given options of sf2dve, returns the DVE
+# text.
+def convert(modelXML, state_names=False, input_values=None,
+            force_alternation=False, **options):
+    outfile = io.StringIO()
+    sf2dve(io.BytesIO(modelXML), outfile, state_names, input_values,
+           force_alternation, **options)
+    return outfile.getvalue()
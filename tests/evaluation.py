@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Evaluation of expression trees as in DiVinE, used to compare expressions and
+effects before and after an optimization on concrete valuations.
+"""
+
+from expressions import (Constant, Number, Name, Unary, Binary, Chain, Paren,
+                         Assign, Comma, Negation, Disjunction)
+
+# domains of the DVE types, values assigned to variables wrap around
+DOMAINS = {"byte":(0, 255), "int":(-32768, 32767)}
+
+# evaluation fails in DiVinE (division by zero)
+class EvaluationError(Exception): pass
+
+def divide(a, b):
+    if b == 0:
+        raise EvaluationError("division by zero")
+    quotient = abs(a) // abs(b)
+    if (a < 0) != (b < 0):
+        return -quotient
+    return quotient
+
+def modulo(a, b):
+    return a - b * divide(a, b)
+
+OPERATORS = {"+":lambda a, b: a + b, "-":lambda a, b: a - b,
+             "*":lambda a, b: a * b, "/":divide, "%":modulo,
+             "<":lambda a, b: int(a < b), "<=":lambda a, b: int(a <= b),
+             ">":lambda a, b: int(a > b), ">=":lambda a, b: int(a >= b),
+             "==":lambda a, b: int(a == b), "!=":lambda a, b: int(a != b),
+             "&":lambda a, b: a & b, "|":lambda a, b: a | b,
+             "^":lambda a, b: a ^ b, "<<":lambda a, b: a << b,
+             ">>":lambda a, b: a >> b}
+
+UNARY_OPERATORS = {"!":lambda a: int(not a), "-":lambda a: -a,
+                   "+":lambda a: a, "~":lambda a: ~a}
+
+def wrap(value, varType):
+    (low, high) = DOMAINS[varType]
+    return (value - low) % (high - low + 1) + low
+
+# Returns value of given expression (or DVE text of a condition), assignments
+# modify the valuation env. types - variable = DVE type
+def evaluate(expr, env, types):
+    if isinstance(expr, str):
+        import condition_parser
+        expr = condition_parser.parse(expr)
+    if isinstance(expr, Constant):
+        return int(expr.value == "true")
+    if isinstance(expr, Number):
+        return int(expr.value)
+    if isinstance(expr, Name):
+        return env[expr.name]
+    if isinstance(expr, (Paren, Negation)):
+        value = evaluate(expr.expr, env, types)
+        if isinstance(expr, Negation):
+            return int(not value)
+        return value
+    if isinstance(expr, Unary):
+        return UNARY_OPERATORS[expr.op](evaluate(expr.operand, env, types))
+    if isinstance(expr, Disjunction):
+        return int(any(evaluate(item, env, types) for item in expr.items))
+    if isinstance(expr, Binary):
+        items = (expr.left, expr.right)
+    elif isinstance(expr, Chain):
+        items = expr.items
+    elif isinstance(expr, Assign):
+        value = wrap(evaluate(expr.value, env, types), types[expr.target.name])
+        env[expr.target.name] = value
+        return value
+    elif isinstance(expr, Comma):
+        for item in expr.items:
+            value = evaluate(item, env, types)
+        return value
+    else:
+        raise TypeError("can't evaluate %r" % expr)
+
+    if expr.op in ("and", "or"):
+        for item in items:
+            value = int(bool(evaluate(item, env, types)))
+            if value == (expr.op == "or"):
+                return value
+        return value
+    value = evaluate(items[0], env, types)
+    for item in items[1:]:
+        value = OPERATORS[expr.op](value, evaluate(item, env, types))
+    return value
+
+# Returns True if all given conditions hold in valuation env.
+def holds(conditions, env, types):
+    return all(evaluate(cond, dict(env), types) for cond in conditions)
+
+# Returns valuation after given actions, or None if the evaluation fails.
+def execute(actions, env, types):
+    env = dict(env)
+    try:
+        for action in actions:
+            evaluate(action, env, types)
+    except EvaluationError:
+        return None
+    return env
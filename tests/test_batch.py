@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the conversion of several files in batch mode.
+"""
+
+import os, io, shutil, tempfile, unittest
+from contextlib import redirect_stderr
+import sf2dve
+from tests.charts import model, chart, state, transition, data, simpleChart
+
+ARGUMENTS = ("id", None, False)
+
+# Chart with two inputs, so that the process feed_inputs has 4 transitions
+# for the interval <0,1>.
+def getInputsModelXML():
+    return model(chart(1, "c",
+                       state(11, "A") + state(12, "B") +
+                       transition(13, "", None, 11) +
+                       transition(14, "[x > 0]", 11, 12) +
+                       data("x") + data("a", "int8", "INPUT_DATA") +
+                       data("b", "int8", "INPUT_DATA")))
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def writeInput(self, name, modelXML):
+        path = os.path.join(self.directory, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as inputFile:
+            inputFile.write(modelXML)
+        return path
+
+    def readOutput(self, *names):
+        with open(os.path.join(self.directory, *names)) as outputFile:
+            return outputFile.read()
+
+    def convertBatch(self, batch, output_dir=None, jobs=1):
+        with redirect_stderr(io.StringIO()) as stderr:
+            result = sf2dve.convertBatch(batch, output_dir, jobs, ARGUMENTS)
+        return (result, stderr.getvalue())
+
+    def testConvertFile(self):
+        inputPath = self.writeInput("model.xml", getInputsModelXML())
+        outputPath = os.path.join(self.directory, "model.dve")
+        with open(outputPath, "w") as outputFile:
+            outputFile.write("previous\n")
+
+        # rejected output doesn't replace the previous one
+        arguments = ("id", [0, 7], False, "product", 3)
+        (path, error) = sf2dve.convertFile((inputPath, outputPath, arguments))
+        self.assertEqual(path, inputPath)
+        self.assertIn("Limit exceeded", error)
+        self.assertEqual(self.readOutput("model.dve"), "previous\n")
+
+        arguments = ("id", [0, 7], False, "product", 4)
+        (path, error) = sf2dve.convertFile((inputPath, outputPath, arguments))
+        self.assertIsNone(error)
+        self.assertIn("process feed_inputs", self.readOutput("model.dve"))
+
+    def testFailures(self):
+        for jobs in (1, 2):
+            self.writeInput("a.xml", model(simpleChart(1, "[x > 0]")))
+            self.writeInput("b.xml", model(simpleChart(1, "[x >]")))
+            self.writeInput("c.xml", b"<Stateflow")
+            self.writeInput("d.xml", model(simpleChart(1, "{x = 1;}")))
+
+            (result, errors) = self.convertBatch(self.directory, jobs=jobs)
+            self.assertEqual(result, 1)
+            self.assertIn("b.xml: ", errors)
+            self.assertIn("c.xml: ", errors)
+            self.assertIn("2 of 4 files failed", errors)
+            self.assertIn("process process_1", self.readOutput("a.dve"))
+            self.assertIn("process process_1", self.readOutput("d.dve"))
+            for name in ("b.dve", "c.dve"):
+                self.assertFalse(os.path.exists(os.path.join(self.directory,
+                                                             name)))
+            for name in os.listdir(self.directory):
+                os.remove(os.path.join(self.directory, name))
+
+    def testMissingOutputDirectory(self):
+        self.writeInput("a.xml", model(simpleChart(1, "[x > 0]")))
+        outputDir = os.path.join(self.directory, "out", "dve")
+        (result, errors) = self.convertBatch(self.directory, outputDir)
+        self.assertIsNone(result)
+        self.assertEqual(errors, "")
+        self.assertIn("process process_1",
+                      self.readOutput("out", "dve", "a.dve"))
+
+        # output directory that can't be created is reported before
+        # converting any file
+        outputDir = os.path.join(self.directory, "a.xml", "dve")
+        (result, errors) = self.convertBatch(self.directory, outputDir)
+        self.assertEqual(result, 1)
+        self.assertIn("Can't create output directory", errors)
+
+    def testCollisions(self):
+        first = self.writeInput(os.path.join("one", "model.xml"),
+                                model(simpleChart(1, "[x > 0]")))
+        second = self.writeInput(os.path.join("two", "model.xml"),
+                                 model(simpleChart(2, "[x > 0]")))
+        listPath = os.path.join(self.directory, "list.txt")
+        with open(listPath, "w") as listFile:
+            listFile.write("%s\n%s\n" % (first, second))
+
+        outputDir = os.path.join(self.directory, "out")
+        (result, errors) = self.convertBatch(listPath, outputDir)
+        self.assertEqual(result, 1)
+        self.assertIn("%s: output" % second, errors)
+        self.assertIn("1 of 2 files failed", errors)
+        self.assertIn("process process_1", self.readOutput("out", "model.dve"))
+
+        # next to the inputs, the outputs don't collide
+        (result, errors) = self.convertBatch(listPath)
+        self.assertIsNone(result)
+        self.assertIn("process process_1", self.readOutput("one", "model.dve"))
+        self.assertIn("process process_2", self.readOutput("two", "model.dve"))
+
+        # different suffixes of the same name
+        self.writeInput(os.path.join("one", "model.slx"), b"")
+        (result, errors) = self.convertBatch(os.path.join(self.directory,
+                                                          "one"))
+        self.assertEqual(result, 1)
+        self.assertIn("model.xml: output", errors)
+
+if __name__ == "__main__":
+    unittest.main()
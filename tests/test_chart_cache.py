@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the on-disk cache of planarized charts.
+"""
+
+import os, time, shutil, tempfile, unittest
+from chart_cache import ChartCache, STALE_TEMP_AGE
+
+# object failing when pickled
+class Unpicklable:
+    def __reduce__(self):
+        raise RecursionError("maximum recursion depth exceeded")
+
+class ChartCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ChartCache(self.directory, 1024 * 1024, "test")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testPutAndGet(self):
+        self.cache.put("key", ["chart"])
+        self.assertEqual(self.cache.get("key"), ["chart"])
+        self.assertIsNone(self.cache.get("other"))
+
+    def testFailedPutLeavesNoFiles(self):
+        self.cache.put("key", Unpicklable())
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def testEvictRemovesStaleTemporaryFiles(self):
+        stale = os.path.join(self.directory, "stale.tmp")
+        fresh = os.path.join(self.directory, "fresh.tmp")
+        for path in (stale, fresh):
+            open(path, "wb").close()
+        old = time.time() - STALE_TEMP_AGE - 10
+        os.utime(stale, (old, old))
+        self.cache.evict()
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+    def testEvictLeastRecentlyUsed(self):
+        self.cache.maxSize = 3500
+        for (index, key) in enumerate(["a", "b", "c"]):
+            self.cache.put(key, "x" * 1000)
+            path = os.path.join(self.directory, key + ".chart")
+            os.utime(path, (index, index))
+        self.cache.get("a")
+        self.cache.put("d", "x" * 1000)
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("d"))
+
+    def testBrokenFiles(self):
+        self.cache.put("key", ["chart"])
+        path = os.path.join(self.directory, "key.chart")
+        with open(path, "rb") as cacheFile:
+            data = cacheFile.read()
+        # truncated, unsupported protocol (ValueError), huge length
+        # (OverflowError or MemoryError) and garbage
+        for broken in [data[:len(data) // 2], b"\x80\x09.",
+                       b"\x80\x04\x8d\xff\xff\xff\xff\xff\xff\xff\x7f",
+                       b"garbage"]:
+            with open(path, "wb") as cacheFile:
+                cacheFile.write(broken)
+            self.assertIsNone(self.cache.get("key"))
+            self.assertFalse(os.path.exists(path))
+
+    def testEvictOnlyWhenFull(self):
+        sweeps = []
+        evict = self.cache.evict
+        def countingEvict():
+            sweeps.append(self.cache.size)
+            evict()
+        self.cache.evict = countingEvict
+        self.cache.maxSize = 5000
+        for key in ["a", "b", "c", "d"]:
+            self.cache.put(key, "x" * 1000)
+        # only the first sweep, the size is counted since then
+        self.assertEqual(sweeps, [None])
+        # over the limit
+        self.cache.put("e", "x" * 1000)
+        self.assertEqual(len(sweeps), 2)
+        self.assertLessEqual(self.cache.size, 5000)
+        self.assertEqual(len(os.listdir(self.directory)), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the planarization of charts in a pool of processes.
+"""
+
+import os, unittest, multiprocessing
+import sf2dve
+from tests.charts import model, simpleChart, convert
+
+def getLongGuard(terms):
+    return " && ".join("x != %d" % i for i in range(terms))
+
+# object failing when pickled
+class Unpicklable:
+    def __reduce__(self):
+        raise RecursionError("maximum recursion depth exceeded")
+
+parentPid = None
+planarizeSerialized = sf2dve.planarizeSerialized
+
+# in the worker processes, returns chart which can't be sent back
+def planarizeUnpicklable(chartXML):
+    if os.getpid() != parentPid:
+        return Unpicklable()
+    return planarizeSerialized(chartXML)
+
+class ChartPlanarizerTest(unittest.TestCase):
+    def setUp(self):
+        self.modelXML = model(*[simpleChart(i, "[%s]{x = x + 1;}"
+                                            % getLongGuard(300))
+                                for i in range(1, 4)])
+
+    def testJobs(self):
+        self.assertEqual(convert(self.modelXML, jobs=2),
+                         convert(self.modelXML, jobs=1))
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork",
+                         "workers don't see patched functions")
+    def testUnpicklableResult(self):
+        global parentPid
+        parentPid = os.getpid()
+        expected = convert(self.modelXML, jobs=1)
+        sf2dve.planarizeSerialized = planarizeUnpicklable
+        try:
+            self.assertEqual(convert(self.modelXML, jobs=2), expected)
+        finally:
+            sf2dve.planarizeSerialized = planarizeSerialized
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Stress test of parsing labels from many threads at once; the results must
+be the same as when the labels are parsed one after another.
+"""
+
+import sys, unittest, threading
+import action_parser, condition_parser, state_parser, transition_parser
+import planarization
+
+THREADS = 16
+ROUNDS = 2
+
+STATE_LABELS = ["S%d\nen: int q = %d; x = q;\ndu: x += %d;\nex: y = x * 2;"
+                % (i, i % 7, i) for i in range(20)]
+TRANSITION_LABELS = ["[x > %d && y != %d]{int t = x; x = t + %d;}/{y++;}"
+                     % (i, i % 5, i) for i in range(20)]
+
+# Returns comparable form of a parsed label (expressions as their texts).
+def normalize(value):
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, normalize(item)) for (key, item) in value.items())
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    return str(value)
+
+def parseAll(labels):
+    results = []
+    for i, label in enumerate(STATE_LABELS):
+        results.append(normalize(labels.getState(label, str(i))))
+    for i, label in enumerate(TRANSITION_LABELS):
+        results.append(normalize(labels.getTransition(label, str(i))))
+        results.append(str(condition_parser.parse("x > %d || !y" % i)))
+        results.append(normalize(action_parser.parse("a = b * %d, c = !a;"
+                                                     % i, "p_")))
+    return results
+
+# labels parsed directly, without the memo
+class DirectLabels:
+    def getState(self, labelString, ssid):
+        return planarization.parseStateLabel(labelString, ssid)
+
+    def getTransition(self, labelString, ssid):
+        return planarization.parseTransitionLabel(labelString, ssid)
+
+class ConcurrentParsingTest(unittest.TestCase):
+    def runThreads(self, labels):
+        barrier = threading.Barrier(THREADS)
+        results = [None] * THREADS
+        errors = []
+        def run(i):
+            try:
+                barrier.wait()
+                results[i] = [parseAll(labels) for r in range(ROUNDS)]
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(THREADS)]
+        # threads are switched as often as possible
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        return results
+
+    def testParsers(self):
+        expected = parseAll(DirectLabels())
+        # the parsers are created again by the threads
+        for module in (action_parser, condition_parser, state_parser,
+                       transition_parser):
+            module.lexer = None
+            module.parser = None
+        for results in self.runThreads(DirectLabels()):
+            for result in results:
+                self.assertEqual(result, expected)
+
+    def testLabelMemo(self):
+        expected = parseAll(DirectLabels())
+        # small memo, so that labels are forgotten and parsed again
+        labels = planarization.LabelMemo(len(STATE_LABELS))
+        for results in self.runThreads(labels):
+            for result in results:
+                self.assertEqual(result, expected)
+        self.assertEqual(labels.hits + labels.misses,
+                         THREADS * ROUNDS * (len(STATE_LABELS) +
+                                             len(TRANSITION_LABELS)))
+
+if __name__ == "__main__":
+    unittest.main()
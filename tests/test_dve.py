@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the DVE model and its serializer.
+"""
+
+import io, unittest
+from lxml import etree
+import dve, sf2dve
+from planarization import makePlanarized
+from expressions import Name, Binary, Number
+from tests.charts import model, simpleChart
+
+# output file recording the number of processes created before each write
+class RecordingFile:
+    def __init__(self, created):
+        self.created = created
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append((len(self.created), text))
+
+class WriterTest(unittest.TestCase):
+    def testWriteModel(self):
+        transitions = (dve.Transition("a", "b", ["x > %d" % i], ["x = 0"])
+                       for i in range(2))
+        process = dve.Process("p", [dve.Variable("int", "x", "1")],
+                              ["a", "b"], "a", transitions)
+        outfile = io.StringIO()
+        dve.writeModel(dve.Model([dve.Variable("byte", "y", isInput=True)],
+                                 iter([process])), outfile)
+        self.assertEqual(outfile.getvalue(),
+                         "input byte y;\n\n"
+                         "process p {\n"
+                         "\tint x = 1;\n"
+                         "\tstate a, b;\n"
+                         "\tinit a;\n"
+                         "\ttrans\n"
+                         "\t\ta -> b { guard x > 0; effect x = 0; }\n"
+                         "\t\ta -> b { guard x > 1; effect x = 0; }\n"
+                         "}\n\n"
+                         "system async;\n\n")
+
+    def testProcessesCreatedWhenWritten(self):
+        root = etree.fromstring(model(*[simpleChart(i, "[x > %d]" % i)
+                                        for i in range(1, 4)]))
+        charts = [makePlanarized(chartEl) for chartEl in root.iter("chart")]
+        created = []
+        getProcess = sf2dve.getProcess
+        def recordProcess(chart, *args):
+            created.append(chart)
+            return getProcess(chart, *args)
+        sf2dve.getProcess = recordProcess
+        try:
+            outfile = RecordingFile(created)
+            # buffer flushed after every part of the text
+            bufferParts = dve.BUFFER_PARTS
+            dve.BUFFER_PARTS = 1
+            try:
+                dve.writeModel(sf2dve.getModel(charts, False, None, False),
+                               outfile)
+            finally:
+                dve.BUFFER_PARTS = bufferParts
+        finally:
+            sf2dve.getProcess = getProcess
+        self.assertEqual(created, charts)
+        # the first process is written before the second one is created
+        self.assertIn((1, "process process_c1 {\n"), outfile.writes)
+
+class ExpressionTextsTest(unittest.TestCase):
+    def testBounded(self):
+        texts = dve.ExpressionTexts(2)
+        shared = Binary(">", Name("x"), Number("0"))
+        self.assertEqual(texts.join([shared, "y", Name("z")]), "x > 0, y, z")
+        self.assertEqual(len(texts.texts), 2)
+        self.assertEqual(texts.get(Name("w")), "w")
+        self.assertEqual(len(texts.texts), 2)
+        self.assertNotIn(id(shared), texts.texts)
+        self.assertEqual(texts.get(shared), "x > 0")
+
+    def testWriterBounded(self):
+        outfile = io.StringIO()
+        writer = dve.Writer(outfile)
+        sizes = []
+        shared = Binary(">", Name("x"), Number("0"))
+        def generateTransitions():
+            for i in range(dve.WRITER_TEXTS * 2):
+                sizes.append(len(writer.texts.texts))
+                yield dve.Transition("a", "a",
+                                     [shared, Binary("<", Name("x"),
+                                                     Number(str(i)))])
+        writer.writeProcess(dve.Process("p", [], ["a"], "a",
+                                        generateTransitions()))
+        writer.flush()
+        self.assertEqual(max(sizes), dve.WRITER_TEXTS)
+        lines = outfile.getvalue().split("\n")
+        self.assertEqual(lines[4], "\t\ta -> a { guard x > 0, x < 0; }")
+        self.assertEqual(lines[-4], "\t\ta -> a { guard x > 0, x < %d; }"
+                                    % (dve.WRITER_TEXTS * 2 - 1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the optimization of effects.
+"""
+
+import random, unittest
+from lxml import etree
+import action_parser
+from effect_optimizer import optimizeActions, optimizeEffects
+from planarization import makePlanarized
+from tests.charts import model, chart, state, transition, data
+from tests.evaluation import execute, DOMAINS
+
+TYPES = {"x":"int", "y":"int", "b":"byte"}
+VARIABLES = dict((varName, {"type":varType})
+                 for (varName, varType) in TYPES.items())
+
+def parse(text):
+    return action_parser.parse(text)[0]
+
+def getTexts(actions):
+    return [str(action) for action in actions]
+
+def getRandomExpression(generator, depth):
+    if depth == 0 or generator.random() < 0.3:
+        return generator.choice(["x", "y", "b", "0", "1", "2", "7", "255",
+                                 "300", "32767"])
+    return "(%s %s %s)" % (getRandomExpression(generator, depth - 1),
+                           generator.choice(["+", "-", "*", "+", "*", "/",
+                                             "%"]),
+                           getRandomExpression(generator, depth - 1))
+
+def getRandomAction(generator):
+    varName = generator.choice(sorted(TYPES))
+    choice = generator.random()
+    if choice < 0.6:
+        return "%s = %s;" % (varName, getRandomExpression(generator, 2))
+    if choice < 0.7:
+        return "%s %s= %s;" % (varName, generator.choice("+-*"),
+                               getRandomExpression(generator, 1))
+    if choice < 0.8:
+        return "%s%s;" % (varName, generator.choice(["++", "--"]))
+    if choice < 0.9:
+        # nested assignment
+        return "%s = (%s = %s) + 1;" % (varName,
+                                        generator.choice(sorted(TYPES)),
+                                        getRandomExpression(generator, 1))
+    return "%s = %s, %s = %s;" % (varName, getRandomExpression(generator, 1),
+                                  generator.choice(sorted(TYPES)),
+                                  getRandomExpression(generator, 1))
+
+class OptimizeActionsTest(unittest.TestCase):
+    def assertEquivalent(self, actions, optimized, env):
+        self.assertEqual(execute(optimized, env, TYPES),
+                         execute(actions, env, TYPES),
+                         (getTexts(actions), getTexts(optimized), env))
+
+    def testRandomEffects(self):
+        generator = random.Random(15)
+        changed = 0
+        for i in range(1500):
+            text = " ".join(getRandomAction(generator)
+                            for j in range(generator.randint(1, 6)))
+            actions = parse(text)
+            optimized = optimizeActions(actions, VARIABLES)
+            if getTexts(optimized) != getTexts(actions):
+                changed += 1
+            for j in range(5):
+                env = dict((varName, generator.randint(*DOMAINS[varType]))
+                           for (varName, varType) in TYPES.items())
+                if j < 2:
+                    env = dict((varName, generator.randint(-2, 2) % 256)
+                               for varName in TYPES)
+                self.assertEquivalent(actions, optimized, env)
+        # the test is not vacuous
+        self.assertGreater(changed, 300)
+
+    def assertOptimized(self, text, expected):
+        self.assertEqual(getTexts(optimizeActions(parse(text), VARIABLES)),
+                         expected)
+
+    def testPropagation(self):
+        self.assertOptimized("x = 2; y = x + 3;", ["x = 2", "y = 5"])
+        self.assertOptimized("x = 2; y = x * x * 3 + y;",
+                             ["x = 2", "y = 12 + y"])
+        self.assertOptimized("x = 1, y = x;", ["x = 1", "y = 1"])
+        # results out of the folded range are not folded
+        self.assertOptimized("x = 32767; y = x + 1;", ["x = 32767",
+                                                       "y = 32767 + 1"])
+        self.assertOptimized("x = 0; y = x - 1;", ["x = 0", "y = 0 - 1"])
+
+    def testDomainBounds(self):
+        # 300 doesn't fit into byte, b is 44 after the assignment
+        self.assertOptimized("b = 300; x = b;", ["b = 300", "x = b"])
+        self.assertOptimized("b = 255; x = b;", ["b = 255", "x = 255"])
+        self.assertOptimized("b = 200 + 100; x = b;", ["b = 300", "x = b"])
+        self.assertOptimized("x = 40000; y = x;", ["x = 40000", "y = x"])
+
+    def testDeadStores(self):
+        self.assertOptimized("x = 1; x = 2;", ["x = 2"])
+        self.assertOptimized("x += 3; x = 0;", ["x = 0"])
+        self.assertOptimized("x = 1; y = x; x = 2;", ["y = 1", "x = 2"])
+        self.assertOptimized("x = y; y = x + 1; x = 0;",
+                             ["x = y", "y = x + 1", "x = 0"])
+
+    def testBarriers(self):
+        # assignments which may fail are not removed
+        self.assertOptimized("x = y / b; x = 1;", ["x = y / b", "x = 1"])
+        self.assertOptimized("x = y % b; x = 1;", ["x = y % b", "x = 1"])
+        actions = parse("x = y % 0; x = 1;")
+        self.assertIsNone(execute(optimizeActions(actions, VARIABLES),
+                                  {"x":0, "y":0, "b":0}, TYPES))
+        # nested assignments end propagation and dead-store elimination
+        self.assertOptimized("x = 1; y = (x = 2) + 1; y = x;",
+                             ["x = 1", "y = (x = 2) + 1", "y = x"])
+        self.assertOptimized("x = 1; y = (b = 2) + x; x = 2;",
+                             ["x = 1", "y = (b = 2) + x", "x = 2"])
+
+class OptimizeEffectsTest(unittest.TestCase):
+    def testSharedSegments(self):
+        modelXML = model(chart(1, "c",
+            state(10, "S", state(11, "A") + state(12, "B") +
+                           transition(13, "", None, 11)) +
+            state(20, "C\nen: x = 1; x = 2;\ndu: y = 1; y = 2;") +
+            transition(1, "", None, 10) +
+            transition(2, "{x = 3; y = x;}", 10, 20) +
+            data("x") + data("y")))
+        planarized = makePlanarized(etree.fromstring(modelXML)
+                                    .find(".//chart"))
+        fromS = [trans for trans in planarized.transitions
+                 if trans.src in ("11", "12")]
+        self.assertEqual(len(fromS), 2)
+        self.assertIs(fromS[0].segments[0], fromS[1].segments[0])
+
+        optimizeEffects([planarized])
+        self.assertIs(fromS[0].segments, fromS[1].segments)
+        self.assertEqual(getTexts(fromS[0].getActions()),
+                         ["y = 3", "x = 2"])
+        self.assertEqual(getTexts(planarized.states["20"].du), ["y = 2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the expression trees built by the label parsers.
+"""
+
+import pickle, unittest
+import condition_parser, action_parser
+from expressions import Chain, TRUE, FALSE
+from tests.charts import (model, chart, state, transition, data,
+                          simpleChart, convert)
+
+TERMS = 3000
+
+def getLongGuard(terms):
+    return " && ".join("x != %d" % i for i in range(terms))
+
+class LongChainTest(unittest.TestCase):
+    def testConditionIsFlat(self):
+        expr = condition_parser.parse(getLongGuard(TERMS))
+        self.assertIsInstance(expr, Chain)
+        self.assertEqual(expr.op, "and")
+        self.assertEqual(len(expr.items), TERMS)
+
+    def testWriteAndReplace(self):
+        text = getLongGuard(TERMS)
+        expr = condition_parser.parse(text)
+        self.assertEqual(str(expr), text.replace("&&", "and"))
+        replaced = expr.replaceInNames("x", "y")
+        self.assertEqual(str(replaced), text.replace("&&", "and")
+                                            .replace("x", "y"))
+
+    def testPickle(self):
+        expr = condition_parser.parse(getLongGuard(TERMS))
+        self.assertEqual(str(pickle.loads(pickle.dumps(expr))), str(expr))
+
+    def testLongSum(self):
+        text = " + ".join("x" for i in range(TERMS))
+        expr = action_parser.parse("y = %s;" % text)
+        self.assertEqual(str(pickle.loads(pickle.dumps(expr))), str(expr))
+
+    def testMixedOperators(self):
+        for (text, expected) in [("a - b - c", "a - b - c"),
+                                 ("a + b * c + d", "a + b * c + d"),
+                                 ("a || b && c || d", "a or b and c or d"),
+                                 ("(a && b) && c", "(a and b) and c")]:
+            self.assertEqual(str(condition_parser.parse(text)), expected)
+
+    def testConversion(self):
+        label = "[%s]{x = x + 1;}" % getLongGuard(1000)
+        self.assertIn("x != 999", convert(model(simpleChart(1, label))))
+
+class ConstantsTest(unittest.TestCase):
+    def testParsed(self):
+        self.assertIs(condition_parser.parse("false"), FALSE)
+        self.assertIs(condition_parser.parse("!true").operand, TRUE)
+        (actions, variables) = action_parser.parse("x = true;")
+        self.assertIs(actions[0].value, TRUE)
+
+    def testFalseLabel(self):
+        modelXML = model(chart(1, "c",
+            state(10, "A") + state(11, "B") + state(12, "C") +
+            transition(13, "", None, 10) +
+            transition(14, "[false]", 10, 11, 1) +
+            transition(15, "[true]", 10, 12, 2) +
+            data("x")))
+        for options in [{}, {"simplify_guards":True},
+                        {"prune_infeasible":True}]:
+            text = convert(modelXML, state_names="id", **options)
+            self.assertNotIn("state_10 -> state_11", text)
+            self.assertIn("state_10 -> state_12", text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the removal of transitions with infeasible conditions.
+"""
+
+import random, itertools, unittest
+import condition_parser
+from expressions import Unary, Paren, Negation, Disjunction, makeOperation
+from feasibility import isFeasible
+from tests.charts import model, chart, state, transition, data, convert
+from tests.evaluation import holds
+
+# b - byte, i - int, k - int never assigned, n - input fed from -2..5
+DOMAINS = {"b":(0, 255), "i":(-32768, 32767), "k":(3, 3), "n":(-2, 5)}
+TYPES = {"b":"byte", "i":"int", "k":"int", "n":"int"}
+CONSTANTS = [-32769, -32768, -2, -1, 0, 1, 3, 5, 255, 256, 32767]
+OPERATORS = ["<", ">", "<=", ">=", "==", "!="]
+
+def parse(text):
+    return condition_parser.parse(text)
+
+# Returns values of given variable at which the comparisons with CONSTANTS
+# may change, so that satisfiable conditions hold for some combination of
+# them.
+def getCandidates(varName):
+    (low, high) = DOMAINS[varName]
+    values = set([low, high])
+    for constant in CONSTANTS:
+        for value in (constant - 1, constant, constant + 1):
+            if low <= value <= high:
+                values.add(value)
+    return sorted(values)
+
+def getRandomCondition(generator, varNames, depth):
+    choice = generator.random()
+    if depth == 0 or choice < 0.5:
+        operands = [generator.choice(varNames),
+                    str(generator.choice(CONSTANTS))]
+        generator.shuffle(operands)
+        return parse("%s %s %s" % (operands[0], generator.choice(OPERATORS),
+                                   operands[1]))
+    if choice < 0.6:
+        return Unary("!", Paren(getRandomCondition(generator, varNames,
+                                                   depth - 1)))
+    if choice < 0.7:
+        return Negation(getRandomCondition(generator, varNames, depth - 1))
+    if choice < 0.8:
+        return Disjunction(tuple(getRandomCondition(generator, varNames,
+                                                    depth - 1)
+                                 for i in range(generator.randint(1, 3))))
+    return makeOperation(generator.choice(["and", "or"]),
+                         Paren(getRandomCondition(generator, varNames,
+                                                  depth - 1)),
+                         Paren(getRandomCondition(generator, varNames,
+                                                  depth - 1)))
+
+class IsFeasibleTest(unittest.TestCase):
+    def testRandomConditions(self):
+        generator = random.Random(14)
+        pruned = 0
+        for i in range(600):
+            varNames = generator.sample(sorted(DOMAINS), 2)
+            conditions = [getRandomCondition(generator, varNames, 2)
+                          for j in range(generator.randint(1, 4))]
+            if isFeasible(conditions, DOMAINS):
+                continue
+            pruned += 1
+            for values in itertools.product(*[getCandidates(varName)
+                                               for varName in varNames]):
+                env = dict(zip(varNames, values))
+                self.assertFalse(holds(conditions, env, TYPES),
+                                 ([str(cond) for cond in conditions], env))
+        # the test is not vacuous
+        self.assertGreater(pruned, 100)
+
+    def assertFeasible(self, text, feasible=True):
+        self.assertEqual(isFeasible([parse(text)], DOMAINS), feasible, text)
+
+    def testDomainBounds(self):
+        self.assertFeasible("b < 0", False)
+        self.assertFeasible("b <= 0")
+        self.assertFeasible("b > 255", False)
+        self.assertFeasible("256 <= b", False)
+        self.assertFeasible("b == 255")
+        self.assertFeasible("b == -1", False)
+        self.assertFeasible("i > 32767", False)
+        self.assertFeasible("i < -32768", False)
+        self.assertFeasible("i == -32768")
+        self.assertFeasible("k != 3", False)
+        self.assertFeasible("k == 3")
+        self.assertFeasible("n > 5", False)
+        self.assertFeasible("n == -2")
+
+    def testNegatedComparisons(self):
+        self.assertFeasible("!(b <= 255)", False)
+        self.assertFeasible("!(b >= 0)", False)
+        self.assertFeasible("!(k == 3)", False)
+        self.assertFeasible("!(b != 0) && b > 0", False)
+        self.assertEqual(isFeasible([Negation(parse("n < 6"))], DOMAINS),
+                         False)
+        self.assertEqual(isFeasible([Negation(parse("b > 0 || b == 0"))],
+                                    DOMAINS), False)
+
+    def testIntervals(self):
+        self.assertFeasible("b > 3 && b < 5")
+        self.assertFeasible("b > 3 && b < 4", False)
+        self.assertFeasible("b != 0 && b != 1 && b < 2", False)
+        self.assertFeasible("(b < 2 || i > 0) && b > 5")
+        self.assertFeasible("(b < 2 || k > 3) && b > 5", False)
+
+    def testOtherAtoms(self):
+        # comparisons of variables and other expressions are not restricted
+        self.assertFeasible("b < i && i < 0")
+        self.assertFeasible("b / 2 > 200")
+        self.assertFeasible("b % 2 == 1 && b == 2")
+
+class PruneInfeasibleTest(unittest.TestCase):
+    def testChart(self):
+        modelXML = model(chart(1, "c",
+            state(11, "A") + state(12, "B") +
+            transition(13, "", None, 11) +
+            transition(14, "[b > 255]", 11, 12, 1) +
+            transition(15, "[k != 3]", 11, 12, 2) +
+            transition(16, "[n > 5]", 11, 12, 3) +
+            transition(17, "[b == 255]{i = 1;}", 11, 12, 4) +
+            transition(18, "{b = b + 1;}", 12, 11) +
+            data("b", "int8") + data("i") + data("k", initialValue="3") +
+            data("n", scope="INPUT_DATA")))
+        text = convert(modelXML, input_values=[-2, 5],
+                       prune_infeasible=True)
+        self.assertNotIn("guard b > 255;", text)
+        self.assertNotIn("guard k != 3;", text)
+        self.assertNotIn("guard n > 5;", text)
+        self.assertIn("guard b == 255", text)
+        # without input values, n may have any value
+        self.assertIn("guard n > 5;", convert(modelXML,
+                                              prune_infeasible=True))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the process feed_inputs and of its limit.
+"""
+
+import os, sys, io, shutil, tempfile, unittest
+from contextlib import redirect_stderr
+import sf2dve
+from extendedExceptions import limitExceededException
+from tests.charts import model, chart, state, transition, data, convert
+
+def getModelXML(inputs):
+    return model(chart(1, "c",
+                       state(11, "A") + state(12, "B") +
+                       transition(13, "", None, 11) +
+                       transition(14, "[x > 0]", 11, 12) +
+                       data("x") +
+                       "".join(data(name, "int8", "INPUT_DATA")
+                               for name in inputs)))
+
+class FeedTransitionsTest(unittest.TestCase):
+    def testCount(self):
+        for mode in ("product", "chain"):
+            self.assertEqual(sf2dve.countFeedTransitions([], [], 2, 8, mode),
+                             0)
+        self.assertEqual(sf2dve.countFeedTransitions(["a"], ["b", "c"], 2, 8,
+                                                     "product"), 128)
+        self.assertEqual(sf2dve.countFeedTransitions(["a"], ["b", "c"], 2, 8,
+                                                     "chain"), 18)
+
+    def testZeroLimitWithoutInputs(self):
+        text = convert(getModelXML([]), input_values=[0, 7],
+                       max_feed_transitions=0)
+        self.assertNotIn("feed_inputs", text)
+
+    def testLimit(self):
+        self.assertRaises(limitExceededException, convert,
+                          getModelXML(["a", "b"]), input_values=[0, 7],
+                          max_feed_transitions=3)
+        text = convert(getModelXML(["a", "b"]), input_values=[0, 7],
+                       max_feed_transitions=4)
+        self.assertIn("process feed_inputs", text)
+
+class RejectedOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.inputPath = os.path.join(self.directory, "model.xml")
+        with open(self.inputPath, "wb") as inputFile:
+            inputFile.write(getModelXML(["a", "b"]))
+        self.outputPath = os.path.join(self.directory, "model.dve")
+        with open(self.outputPath, "w") as outputFile:
+            outputFile.write("previous\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def getOutput(self):
+        with open(self.outputPath) as outputFile:
+            return outputFile.read()
+
+    def testMain(self):
+        argv = sys.argv
+        sys.argv = ["sf2dve.py", "--no-cache", "-i", "0,7",
+                    "--max-feed-transitions", "3", self.inputPath,
+                    self.outputPath]
+        try:
+            with redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(sf2dve.main(), 1)
+        finally:
+            sys.argv = argv
+        self.assertIn("Limit exceeded", stderr.getvalue())
+        self.assertEqual(self.getOutput(), "previous\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the simplification of guards.
+"""
+
+import random, itertools, unittest
+import condition_parser
+from expressions import (TRUE, FALSE, Unary, Paren, Negation, Disjunction,
+                         makeOperation)
+from guard_simplifier import simplifyGuard
+from tests.evaluation import holds
+
+TYPES = {"x":"int", "y":"int"}
+VALUATIONS = [{"x":x, "y":y} for (x, y) in itertools.product(range(-1, 4),
+                                                              repeat=2)]
+OPERATORS = ["<", ">", "<=", ">=", "==", "!="]
+
+def parse(text):
+    return condition_parser.parse(text)
+
+def getTexts(conditions):
+    if conditions is None:
+        return None
+    return [str(cond) for cond in conditions]
+
+# Returns random condition, as written in labels or as created by the
+# planarization (negations and disjunctions of conditions).
+def getRandomCondition(generator, depth):
+    choice = generator.random()
+    if depth == 0 or choice < 0.4:
+        operands = [generator.choice(["x", "y"]),
+                    generator.choice(["0", "1", "2", "x", "y"])]
+        generator.shuffle(operands)
+        return parse("%s %s %s" % (operands[0], generator.choice(OPERATORS),
+                                   operands[1]))
+    if choice < 0.5:
+        return generator.choice([TRUE, FALSE])
+    if choice < 0.6:
+        return Unary("!", Paren(getRandomCondition(generator, depth - 1)))
+    if choice < 0.7:
+        return Negation(getRandomCondition(generator, depth - 1))
+    if choice < 0.8:
+        return Disjunction(tuple(getRandomCondition(generator, depth - 1)
+                                 for i in range(generator.randint(1, 3))))
+    return makeOperation(generator.choice(["and", "or"]),
+                         Paren(getRandomCondition(generator, depth - 1)),
+                         Paren(getRandomCondition(generator, depth - 1)))
+
+class GuardSimplifierTest(unittest.TestCase):
+    def assertEquivalent(self, conditions, simplified):
+        for env in VALUATIONS:
+            expected = holds(conditions, env, TYPES)
+            if simplified is None:
+                self.assertFalse(expected, (getTexts(conditions), env))
+            else:
+                self.assertEqual(holds(simplified, env, TYPES), expected,
+                                 (getTexts(conditions), getTexts(simplified),
+                                  env))
+
+    def testRandomGuards(self):
+        generator = random.Random(13)
+        for i in range(2000):
+            conditions = [getRandomCondition(generator, 3)
+                          for j in range(generator.randint(1, 5))]
+            self.assertEquivalent(conditions, simplifyGuard(conditions))
+
+    def testNegatedComparisons(self):
+        for op in OPERATORS:
+            conditions = [parse("x %s 1" % op), parse("!(x %s 1)" % op)]
+            self.assertIsNone(simplifyGuard(conditions))
+            conditions = [parse("x %s 1" % op), Negation(parse("1 %s x" % op))]
+            self.assertEquivalent(conditions, simplifyGuard(conditions))
+        self.assertIsNone(simplifyGuard([parse("x < 1"),
+                                         Negation(parse("1 > x"))]))
+        self.assertEqual(getTexts(simplifyGuard([parse("!(x < 1)")])),
+                         ["x >= 1"])
+        self.assertEqual(getTexts(simplifyGuard([Negation(parse("x == y"))])),
+                         ["x != y"])
+
+    def testConstants(self):
+        self.assertEqual(simplifyGuard([TRUE, parse("1")]), [])
+        self.assertIsNone(simplifyGuard([parse("x < 1"), FALSE]))
+        self.assertIsNone(simplifyGuard([parse("0 || 0")]))
+
+    def testClauses(self):
+        # tautology
+        self.assertEqual(simplifyGuard([parse("x < 1 || x >= 1")]), [])
+        # absorption and unit propagation
+        self.assertEqual(getTexts(simplifyGuard([parse("x < 1 || y == 2"),
+                                                 parse("x < 1")])),
+                         ["x < 1"])
+        self.assertEqual(getTexts(simplifyGuard([parse("x < 1 || y == 2"),
+                                                 parse("x >= 1")])),
+                         ["y == 2", "x >= 1"])
+        # duplicates
+        self.assertEqual(getTexts(simplifyGuard([parse("x < 1"),
+                                                 parse("(x < 1)")])),
+                         ["x < 1"])
+
+    def testChains(self):
+        conditions = [parse("x < 2 && y > 0 && x != y && !(x == 0)"),
+                      parse("x == 1 || y == 1 || x < y")]
+        simplified = simplifyGuard(conditions)
+        self.assertEqual(len(simplified), 5)
+        self.assertEquivalent(conditions, simplified)
+        self.assertIsNone(simplifyGuard([parse("x < 1 && y < 1 && x >= 1")]))
+
+    def testOtherAtoms(self):
+        conditions = [parse("x / 2 + y"), Negation(parse("x / 2 + y"))]
+        self.assertIsNone(simplifyGuard(conditions))
+        conditions = [parse("x % 2 == 1 || x & 1")]
+        self.assertEquivalent(conditions, simplifyGuard(conditions))
+
+if __name__ == "__main__":
+    unittest.main()
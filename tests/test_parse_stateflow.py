@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the streaming parser of the Stateflow XML.
+"""
+
+import io, unittest
+from sf2dve import parseStateflow
+from extendedExceptions import invalidInputException
+from tests.charts import chart, simpleChart
+
+# Simulink part of the model, with a chart element that isn't a chart of the
+# machine.
+SIMULINK = ('<Model><System><Block BlockType="SubSystem" Name="c1">'
+            '<P Name="Position">[0, 0, 10, 10]</P></Block>'
+            '<chart id="9"><P Name="name">block</P></chart>'
+            '</System></Model>')
+
+def getModelXML(*charts, before=SIMULINK, after="<Description/>"):
+    return ('<?xml version="1.0" encoding="utf-8"?><ModelInformation>%s'
+            '<Stateflow><machine id="1"><P Name="name">m</P><Children>%s'
+            '</Children></machine><instance id="5">%s</instance></Stateflow>'
+            '%s</ModelInformation>'
+            % (before, "".join(charts), chart(8, "instance", ""), after)
+            ).encode("utf-8")
+
+# Records the charts passed by parseStateflow, with their names and numbers of
+# states at the time they are passed.
+class Recorder:
+    def __init__(self):
+        self.elements = []
+        self.charts = []
+
+    def __call__(self, element):
+        self.elements.append(element)
+        self.charts.append((element.get("id"),
+                            element.findtext('P[@Name="name"]'),
+                            len(element.findall("Children/state"))))
+
+class ParseStateflowTest(unittest.TestCase):
+    def testChartsInOrder(self):
+        recorder = Recorder()
+        modelXML = getModelXML(simpleChart(3, "[x > 0]"),
+                               simpleChart(1, "[x > 1]"),
+                               simpleChart(2, "[x > 2]"))
+        tree = parseStateflow(io.BytesIO(modelXML), recorder)
+        self.assertEqual(recorder.charts, [("3", "c3", 2), ("1", "c1", 2),
+                                           ("2", "c2", 2)])
+
+        # the charts are cleared after they are handled, the machine is kept
+        for element in recorder.elements:
+            self.assertEqual(len(element), 0)
+            self.assertIsNone(element.get("id"))
+        self.assertEqual(tree.findtext('Stateflow/machine/P[@Name="name"]'),
+                         "m")
+        self.assertEqual(len(tree.findall("Stateflow/machine/Children/*")),
+                         3)
+
+    def testOtherElementsSkipped(self):
+        recorder = Recorder()
+        tree = parseStateflow(io.BytesIO(getModelXML(simpleChart(1, ""))),
+                              recorder)
+        # charts outside the machine are not passed
+        self.assertEqual(recorder.charts, [("1", "c1", 2)])
+
+        # elements outside Stateflow are freed
+        root = tree.getroot()
+        self.assertEqual(root.tag, "ModelInformation")
+        self.assertEqual([len(element) for element in root
+                          if element.tag != "Stateflow"], [0, 0])
+        self.assertIsNone(root.find(".//Block"))
+        self.assertIsNotNone(root.find("Stateflow/instance/chart"))
+
+    def testStateflowRoot(self):
+        recorder = Recorder()
+        modelXML = ('<Stateflow><machine id="1"><Children>%s</Children>'
+                    '</machine></Stateflow>' % (simpleChart(1, "") +
+                                                simpleChart(2, "")))
+        tree = parseStateflow(io.BytesIO(modelXML.encode("utf-8")), recorder)
+        self.assertEqual([entry[0] for entry in recorder.charts], ["1", "2"])
+        self.assertEqual(tree.getroot().tag, "ModelInformation")
+        self.assertEqual(len(tree.findall("Stateflow/machine")), 1)
+
+    def testInvalidXML(self):
+        recorder = Recorder()
+        modelXML = getModelXML(simpleChart(1, ""))[:-20]
+        self.assertRaises(invalidInputException, parseStateflow,
+                          io.BytesIO(modelXML), recorder)
+        self.assertEqual(recorder.charts, [("1", "c1", 2)])
+
+if __name__ == "__main__":
+    unittest.main()
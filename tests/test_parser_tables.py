@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests that the generated lexer and parser tables match the grammars; if they
+fail, run build_tables.py.
+"""
+
+import unittest, importlib, types
+from ply import lex, yacc
+import parser_tables
+from build_tables import PARSERS
+
+class ParserTablesTest(unittest.TestCase):
+    def testParserTablesCurrent(self):
+        for name in PARSERS:
+            self.assertTrue(parser_tables.isTableCurrent(
+                importlib.import_module(name),
+                "parser_tables.%s_parsetab" % name), name)
+
+    def testLexerTablesCurrent(self):
+        for name in PARSERS:
+            module = importlib.import_module(name)
+            table = importlib.import_module("parser_tables.%s_lextab" % name)
+            lexer = lex.lex(module=module, optimize=False,
+                            errorlog=yacc.NullLogger())
+            self.assertEqual(table._lextokens, lexer.lextokens, name)
+            self.assertEqual(table._lexliterals, lexer.lexliterals, name)
+            self.assertEqual(table._lexstateignore, lexer.lexstateignore,
+                             name)
+            self.assertEqual(dict((state, [pattern for (pattern, functions)
+                                           in patterns])
+                                  for (state, patterns)
+                                  in table._lexstatere.items()),
+                             lexer.lexstateretext, name)
+            self.assertTrue(parser_tables.isLexTableCurrent(
+                module, "parser_tables.%s_lextab" % name), name)
+
+    def testOutdatedTable(self):
+        # table of another grammar
+        self.assertFalse(parser_tables.isTableCurrent(
+            importlib.import_module("condition_parser"),
+            "parser_tables.action_parser_parsetab"))
+        self.assertFalse(parser_tables.isTableCurrent(
+            importlib.import_module("condition_parser"),
+            "parser_tables.missing_parsetab"))
+
+    def testOutdatedLexTable(self):
+        module = importlib.import_module("condition_parser")
+        self.assertFalse(parser_tables.isLexTableCurrent(
+            module, "parser_tables.action_parser_lextab"))
+        self.assertFalse(parser_tables.isLexTableCurrent(
+            module, "parser_tables.missing_lextab"))
+
+        # changed rule and added token
+        changed = getChangedModule(module, t_NE_OP=r"<>")
+        self.assertFalse(parser_tables.isLexTableCurrent(
+            changed, "parser_tables.condition_parser_lextab"))
+        changed = getChangedModule(module, tokens=module.tokens + ("XOR_OP",),
+                                   t_XOR_OP=r"\^\^")
+        self.assertFalse(parser_tables.isLexTableCurrent(
+            changed, "parser_tables.condition_parser_lextab"))
+
+    def testOutdatedLexTableNotUsed(self):
+        module = importlib.import_module("condition_parser")
+        (lexer, parser) = parser_tables.buildParser(
+            getChangedModule(module, t_NE_OP=r"<>"))
+        lexer.input("a <> b")
+        self.assertEqual([token.type for token in iter(lexer.token, None)],
+                         ["IDENTIFIER", "NE_OP", "IDENTIFIER"])
+
+# Returns copy of given parser module with given attributes changed.
+def getChangedModule(module, **attributes):
+    changed = types.ModuleType(module.__name__)
+    changed.__dict__.update(module.__dict__)
+    changed.__dict__.update(attributes)
+    return changed
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the planarization of the state hierarchy.
+"""
+
+import unittest
+from lxml import etree
+from extendedExceptions import invalidInputException
+from planarization import makePlanarized, LabelMemo, parseStateLabel
+from planarization import parseTransitionLabel
+from tests.charts import model, chart, state, transition, data, convert
+
+def planarize(children):
+    modelXML = model(chart(1, "c", children + data("x")))
+    return makePlanarized(etree.fromstring(modelXML).find(".//chart"))
+
+class DefaultTransitionsTest(unittest.TestCase):
+    def testNestedDefaults(self):
+        planarized = planarize(
+            state(10, "S", state(11, "A", state(12, "B") +
+                                          transition(13, "", None, 12)) +
+                           state(14, "C") +
+                           transition(15, "[x == 0]", None, 11) +
+                           transition(16, "", None, 14, 2)) +
+            transition(1, "", None, 10))
+        paths = [(trans.dst, [str(cond) for cond in trans.conditions])
+                 for trans in planarized.getOutgoing("start")]
+        self.assertEqual(paths, [("12", ["x == 0"]),
+                                 ("error", ["x == 0", "false"]),
+                                 ("14", ["not (x == 0)"]),
+                                 ("error", ["not (x == 0)", "false"]),
+                                 ("error", [])])
+
+    def testDefaultToItself(self):
+        children = (state(10, "S", state(11, "A") +
+                                   transition(12, "", None, 10)) +
+                    transition(1, "", None, 10))
+        self.assertRaises(invalidInputException, planarize, children)
+        self.assertRaises(invalidInputException, convert,
+                          model(chart(1, "c", children + data("x"))))
+
+    def testDefaultOutOfState(self):
+        children = (state(10, "S", state(11, "A") +
+                                   transition(12, "", None, 20)) +
+                    state(20, "B") +
+                    transition(1, "", None, 10))
+        self.assertRaises(invalidInputException, planarize, children)
+
+class LabelMemoTest(unittest.TestCase):
+    def testLeastRecentlyUsed(self):
+        memo = LabelMemo(4)
+        stateLabels = ["S%d\nen: int q = %d; x = q;" % (i, i)
+                       for i in range(6)]
+        for i, label in enumerate(stateLabels):
+            memo.getState(label, str(i))
+            memo.getTransition("[x > %d]{x = %d;}" % (i, i), str(i))
+            self.assertLessEqual(len(memo.labels), 4)
+        self.assertEqual((memo.hits, memo.misses), (0, 12))
+        self.assertEqual(list(memo.labels),
+                         [("state", stateLabels[4]),
+                          ("transition", "[x > 4]{x = 4;}"),
+                          ("state", stateLabels[5]),
+                          ("transition", "[x > 5]{x = 5;}")])
+
+        # used label becomes the most recent one
+        memo.getState(stateLabels[4], "10")
+        self.assertEqual(memo.hits, 1)
+        self.assertEqual(list(memo.labels)[-1], ("state", stateLabels[4]))
+
+        # forgotten labels are parsed again, with the SSID applied (the
+        # parsed labels are compared as their texts)
+        for i in (0, 1):
+            self.assertEqual(repr(memo.getState(stateLabels[i], "2%d" % i)),
+                             repr(parseStateLabel(stateLabels[i], "2%d" % i)))
+            label = "[x > %d]{x = %d;}" % (i, i)
+            self.assertEqual(repr(memo.getTransition(label, "3%d" % i)),
+                             repr(parseTransitionLabel(label, "3%d" % i)))
+        self.assertEqual((memo.hits, memo.misses), (1, 16))
+        self.assertEqual(len(memo.labels), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of looking up the Stateflow data in SLX archives.
+"""
+
+import io, unittest, zipfile
+from sf2dve import getStateflowPart, openInput
+from extendedExceptions import invalidInputException
+from tests.charts import model, simpleChart, convert
+
+STATEFLOW_TYPE = ("http://schemas.mathworks.com/simulinkModel/2016/"
+                  "relationships/stateflow")
+SYSTEM_TYPE = ("http://schemas.mathworks.com/simulinkModel/2016/"
+               "relationships/system")
+
+# Returns relationships of the block diagram; relationships = [(type,
+# target)]
+def getRelationships(relationships):
+    return ("<Relationships xmlns=\"http://schemas.openxmlformats.org/"
+            "package/2006/relationships\">" +
+            "".join("<Relationship Id=\"rId%d\" Type=\"%s\" Target=\"%s\"/>"
+                    % (index, relType, target)
+                    for index, (relType, target)
+                    in enumerate(relationships)) +
+            "</Relationships>")
+
+# Returns in-memory SLX archive with given members (name = data).
+def getArchive(members):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    data.seek(0)
+    return zipfile.ZipFile(data)
+
+class StateflowPartTest(unittest.TestCase):
+    def testRelationships(self):
+        archive = getArchive({
+            "simulink/blockdiagram.xml": "<ModelInformation/>",
+            "simulink/_rels/blockdiagram.xml.rels": getRelationships(
+                [(SYSTEM_TYPE, "systems/system_root.xml"),
+                 (STATEFLOW_TYPE, "sf/chart_data.xml")]),
+            "simulink/systems/system_root.xml": "<System/>",
+            "simulink/sf/chart_data.xml": model(),
+            "simulink/stateflow_old.xml": model()})
+        self.assertEqual(getStateflowPart(archive),
+                         "simulink/sf/chart_data.xml")
+
+        # absolute target
+        archive = getArchive({
+            "simulink/blockdiagram.xml": "<ModelInformation/>",
+            "simulink/_rels/blockdiagram.xml.rels": getRelationships(
+                [(STATEFLOW_TYPE, "/charts/data.xml")]),
+            "charts/data.xml": model()})
+        self.assertEqual(getStateflowPart(archive), "charts/data.xml")
+
+    def testNames(self):
+        # relationship to a missing part is ignored
+        archive = getArchive({
+            "simulink/blockdiagram.xml": "<ModelInformation/>",
+            "simulink/_rels/blockdiagram.xml.rels": getRelationships(
+                [(STATEFLOW_TYPE, "missing.xml")]),
+            "simulink/stateflow.xml": model(),
+            "simulink/stateflow.txt": ""})
+        self.assertEqual(getStateflowPart(archive), "simulink/stateflow.xml")
+
+    def testBlockDiagram(self):
+        archive = getArchive({
+            "simulink/blockdiagram.xml": model(),
+            "simulink/_rels/blockdiagram.xml.rels": "<Relationships",
+            "metadata/coreProperties.xml": "<coreProperties/>"})
+        self.assertEqual(getStateflowPart(archive),
+                         "simulink/blockdiagram.xml")
+
+    def testSeveralParts(self):
+        archive = getArchive({
+            "simulink/blockdiagram.xml": "<ModelInformation/>",
+            "simulink/_rels/blockdiagram.xml.rels": getRelationships(
+                [(STATEFLOW_TYPE, "stateflow.xml"),
+                 (STATEFLOW_TYPE, "stateflow.xml"),
+                 (STATEFLOW_TYPE, "stateflow2.xml")]),
+            "simulink/stateflow.xml": model(),
+            "simulink/stateflow2.xml": model()})
+        with self.assertRaises(invalidInputException) as context:
+            getStateflowPart(archive)
+        self.assertIn("simulink/stateflow.xml, simulink/stateflow2.xml",
+                      str(context.exception))
+
+        archive = getArchive({
+            "simulink/blockdiagram.xml": "<ModelInformation/>",
+            "simulink/stateflow.xml": model(),
+            "simulink/charts/stateflow.xml": model()})
+        self.assertRaises(invalidInputException, getStateflowPart, archive)
+
+class OpenInputTest(unittest.TestCase):
+    def testArchive(self):
+        modelXML = model(simpleChart(1, "[x > 0]"))
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as members:
+            members.writestr("simulink/blockdiagram.xml",
+                             "<ModelInformation/>")
+            members.writestr("simulink/stateflow.xml", modelXML)
+        self.assertEqual(openInput(archive).read(), modelXML)
+
+        # not an archive
+        self.assertEqual(convert(openInput(io.BytesIO(modelXML)).read()),
+                         convert(modelXML))
+
+    def testMissingPart(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as members:
+            members.writestr("metadata/coreProperties.xml",
+                             "<coreProperties/>")
+        self.assertRaises(KeyError, openInput, archive)
+
+if __name__ == "__main__":
+    unittest.main()
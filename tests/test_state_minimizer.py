@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the merging of equivalent planarized states.
+"""
+
+import os
+import tempfile
+import unittest
+from lxml import etree
+from planarization import makePlanarized
+from state_minimizer import minimizeStates
+from sf2dve import LazyOutput
+from tests.charts import model, chart, state, transition, data, convert
+from tests.charts import simpleChart
+
+# Chart with superstate S entered by a labeled default transition (so that
+# the state error is reachable), and deadlock leaves B and C.
+def getModelXML():
+    return model(chart(1, "c",
+        state(10, "S", state(11, "A") + transition(12, "[x == 0]", None, 11)) +
+        state(20, "B") + state(30, "C") +
+        transition(1, "", None, 10) +
+        transition(2, "[x == 1]", 11, 20, 1) +
+        transition(3, "[x == 2]", 11, 30, 2) +
+        data("x")))
+
+def getPlanarized():
+    return makePlanarized(etree.fromstring(getModelXML()).find(".//chart"))
+
+class StateMinimizerTest(unittest.TestCase):
+    def testDeadlockLeavesAndError(self):
+        planarized = getPlanarized()
+        self.assertEqual(minimizeStates(planarized), {"20": ["20", "30"]})
+        self.assertEqual(set(planarized.states), set(["11", "20", "start",
+                                                      "error"]))
+        destinations = set((trans.src, trans.dst)
+                           for trans in planarized.transitions)
+        self.assertEqual(destinations, set([("start", "11"),
+                                            ("start", "error"),
+                                            ("11", "20")]))
+
+    def testSyntheticStatesKept(self):
+        text = convert(getModelXML(), minimize_states=True)
+        self.assertIn("state_error", text)
+        self.assertIn("state_start -> state_error", text)
+
+    def testStateMap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "map.txt")
+            stateMap = LazyOutput(path)
+            convert(getModelXML(), minimize_states=True, state_map=stateMap)
+            stateMap.close()
+            with open(path) as mapFile:
+                self.assertEqual(mapFile.read(), "process_c.state_B: 20 30\n")
+
+            # the map of an earlier run is replaced even if nothing is merged
+            stateMap = LazyOutput(path)
+            convert(model(simpleChart(1, "{x = 1;}")), minimize_states=True,
+                    state_map=stateMap)
+            stateMap.close()
+            with open(path) as mapFile:
+                self.assertEqual(mapFile.read(), "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of the removal of duplicate transitions and of merging transitions.
+"""
+
+import random, itertools, unittest
+import condition_parser, action_parser
+from expressions import FALSE
+from planarization import PlanarizedChart, PlanarizedTransition
+from transition_merger import dedupeTransitions, mergeConditions
+from tests.evaluation import holds
+
+TYPES = {"x":"int", "y":"int"}
+VALUATIONS = [{"x":x, "y":y} for (x, y) in itertools.product(range(-1, 3),
+                                                              repeat=2)]
+CONDITIONS = ["x < 1", "x == 0", "y > 0", "x != y", "y == 1 || x == 2",
+              "x >= 1 && y < 2"]
+ACTIONS = ["x = 1;", "y = x;", "x = y + 1;"]
+STATES = ["A", "B", "C"]
+
+def getTexts(expressions):
+    return [str(expr) for expr in expressions]
+
+# Returns planarized chart with given transitions, given as (src, dst,
+# conditions, texts of segments of actions, priority). Actions with the same
+# text are parsed once, as they are in the planarization.
+def getChart(transitions):
+    chart = PlanarizedChart()
+    parsed = {}
+    for (src, dst, conditions, actions, priority) in transitions:
+        for text in actions:
+            if text not in parsed:
+                parsed[text] = action_parser.parse(text)[0]
+        segments = chart.getSegments(*[parsed[text] for text in actions])
+        conditions = tuple(condition_parser.parse(text)
+                           if isinstance(text, str) else text
+                           for text in conditions)
+        chart.addTransition(PlanarizedTransition("1", src, dst, conditions,
+                                                 segments, *priority))
+    return chart
+
+# Returns the transitions of the chart which may be taken in given valuation,
+# as (source, destination, texts of actions); transitions from the same
+# source with higher priority exclude the others.
+def getEnabled(chart, env):
+    enabled = set()
+    for src in STATES:
+        holding = [trans for trans in chart.getOutgoing(src)
+                   if holds(trans.conditions, env, TYPES)]
+        if holding == []:
+            continue
+        highest = min(trans.getPriority() for trans in holding)
+        for trans in holding:
+            if trans.getPriority() == highest:
+                enabled.add((src, trans.dst,
+                             tuple(getTexts(trans.getActions()))))
+    return enabled
+
+def getRandomTransitions(generator):
+    transitions = []
+    for i in range(generator.randint(1, 10)):
+        conditions = generator.sample(CONDITIONS, generator.randint(0, 2))
+        if generator.random() < 0.1:
+            conditions.append(FALSE)
+        # actions split into segments in different ways
+        actions = generator.sample(ACTIONS, generator.randint(0, 2))
+        if len(actions) == 2 and generator.random() < 0.5:
+            actions = [" ".join(actions)]
+        transitions.append((generator.choice(STATES[:2]),
+                            generator.choice(STATES), conditions, actions,
+                            (generator.randint(1, 2), 1,
+                             generator.randint(1, 2))))
+    # duplicates
+    return transitions + generator.sample(
+        transitions, generator.randint(0, min(3, len(transitions))))
+
+class DedupeTransitionsTest(unittest.TestCase):
+    def testRandomCharts(self):
+        generator = random.Random(24)
+        removed = {False:0, True:0}
+        for i in range(400):
+            transitions = getRandomTransitions(generator)
+            for merge in (False, True):
+                chart = getChart(transitions)
+                dedupeTransitions([chart], merge)
+                removed[merge] += len(transitions) - len(chart.transitions)
+                original = getChart(transitions)
+                for env in VALUATIONS:
+                    self.assertEqual(getEnabled(chart, env),
+                                     getEnabled(original, env),
+                                     (transitions, merge, env))
+        # the test is not vacuous
+        self.assertGreater(removed[True], removed[False])
+        self.assertGreater(removed[False], 100)
+
+    def testDuplicates(self):
+        transition = ("A", "B", ["x < 1"], ["x = 1;"], (1, 1, 1))
+        chart = getChart([transition, transition,
+                          ("A", "B", ["x < 1"], ["x = 1;"], (1, 1, 2))])
+        dedupeTransitions([chart])
+        self.assertEqual(len(chart.transitions), 2)
+
+    def testSharedSegments(self):
+        # the same actions split into different segments
+        chart = getChart([("A", "B", ["x < 1"], ["x = 1;", "y = x;"],
+                           (1, 1, 1)),
+                          ("A", "B", ["x < 1"], ["x = 1;", "y = x;"],
+                           (1, 1, 1)),
+                          ("A", "B", ["y > 0"], ["x = 1; y = x;"],
+                           (1, 1, 1))])
+        segments = chart.transitions[0].segments
+        for (segment, other) in zip(segments, chart.transitions[1].segments):
+            self.assertIs(segment, other)
+        self.assertEqual(len(chart.transitions[2].segments), 1)
+        dedupeTransitions([chart], True)
+        self.assertEqual(len(chart.transitions), 1)
+        self.assertIs(chart.transitions[0].segments, segments)
+        self.assertEqual(getTexts(chart.transitions[0].conditions),
+                         ["(x < 1) or (y > 0)"])
+
+    def testFalseNotMerged(self):
+        chart = getChart([("A", "B", ["x < 1"], [], (1, 1, 1)),
+                          ("A", "B", ["y > 0", FALSE], [], (1, 1, 1))])
+        dedupeTransitions([chart], True)
+        self.assertEqual(len(chart.transitions), 2)
+        self.assertEqual(getTexts(chart.transitions[0].conditions),
+                         ["x < 1"])
+
+class MergeConditionsTest(unittest.TestCase):
+    def parse(self, *texts):
+        return tuple(condition_parser.parse(text) for text in texts)
+
+    def testCommonPrefix(self):
+        merged = mergeConditions([self.parse("x < 1", "y > 0"),
+                                  self.parse("x < 1", "y < 0", "x > y")])
+        self.assertEqual(getTexts(merged),
+                         ["x < 1", "(y > 0) or ((y < 0) and (x > y))"])
+
+    def testImplied(self):
+        # the conditions of the first transition are implied by the second
+        merged = mergeConditions([self.parse("x < 1"),
+                                  self.parse("x < 1", "y < 0")])
+        self.assertEqual(getTexts(merged), ["x < 1"])
+        self.assertEqual(mergeConditions([(), self.parse("y < 0")]), ())
+
+    def testEqualLists(self):
+        merged = mergeConditions([self.parse("x < 1", "y > 0"),
+                                  self.parse("x < 1", "y > 0")])
+        self.assertEqual(getTexts(merged), ["x < 1", "y > 0"])
+        merged = mergeConditions([self.parse("x < 1"), self.parse("y > 0"),
+                                  self.parse("x < 1")])
+        self.assertEqual(getTexts(merged), ["(x < 1) or (y > 0)"])
+
+if __name__ == "__main__":
+    unittest.main()
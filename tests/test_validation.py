@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests of reporting all problems of the input at once.
+"""
+
+import unittest
+from sf2dve import getErrorMessage
+from extendedExceptions import (notSupportedException, invalidInputException,
+                                inputProblemsException)
+from tests.charts import model, chart, state, transition, data, convert
+
+# Chart c has only invalid labels (found when its planarization fails),
+# chart d has invalid structure as well (found before the planarization).
+def getModelXML():
+    return model(
+        chart(1, "c",
+              state(11, "A\nentry: x = ;") + state(12, "B\nduring: x = x +;") +
+              state(15, "C") +
+              transition(13, "", None, 11) +
+              transition(14, "[x >]", 11, 12) +
+              transition(16, "{x = }", 12, 15) +
+              data("x")),
+        chart(2, "d",
+              state(21, "") + state(22, "B") +
+              transition(23, "", None, 21) +
+              transition(24, "[y >", 21, 22) +
+              data("y", "double") + '<junction id="25"/>'))
+
+PROBLEMS = [(invalidInputException, "state 11 in chart c"),
+            (invalidInputException, "state 12 in chart c"),
+            (invalidInputException, "transition 14 in chart c"),
+            (invalidInputException, "transition 16 in chart c"),
+            (invalidInputException, "state without label (state 21 in "
+                                    "chart d)"),
+            (notSupportedException, "variables of type double (variable y "
+                                    "in chart d)"),
+            (notSupportedException, "junctions (junction 25 in chart d)"),
+            (invalidInputException, "transition 24 in chart d")]
+
+class ProblemsTest(unittest.TestCase):
+    def testAllReported(self):
+        for jobs in (1, 2):
+            with self.assertRaises(inputProblemsException) as context:
+                convert(getModelXML(), jobs=jobs)
+            problems = context.exception.problems
+            self.assertEqual(len(problems), len(PROBLEMS))
+            for (problem, (exceptionType, text)) in zip(problems, PROBLEMS):
+                self.assertIsInstance(problem, exceptionType)
+                self.assertIn(text, str(problem))
+                self.assertIn(str(problem), str(context.exception))
+
+            # one line for each problem
+            lines = getErrorMessage(context.exception).split("\n")
+            self.assertEqual(len(lines), len(PROBLEMS))
+            self.assertTrue(lines[0].startswith("Input is not valid "
+                                                "stateflow: "))
+            self.assertTrue(lines[5].startswith("Following is not "
+                                                "supported: "))
+
+    def testSingleProblem(self):
+        modelXML = model(chart(1, "c",
+                               state(11, "A") + state(12, "B") +
+                               transition(13, "", None, 11) +
+                               transition(14, "[x >]", 11, 12) + data("x")))
+        self.assertRaises(invalidInputException, convert, modelXML)
+
+if __name__ == "__main__":
+    unittest.main()
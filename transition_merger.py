@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Removal of duplicate planarized transitions and merging of transitions that
+differ only in their conditions. Only transitions with the same source and
+the same priority are compared: such transitions don't exclude each other,
+so a duplicate adds no behaviour and transitions with the same destination
+and actions can be replaced by one transition with disjunction of their
+conditions. Negated conditions of the merged transition (in the guards of
+transitions with lower priority) are equivalent to the negated conditions
+of the original transitions.
+"""
+
+from expressions import Chain, Paren, Disjunction, FALSE
+
+# Returns one expression for given (non-empty) list of conditions, all of
+# which must hold.
+def getConjunction(conditions):
+    if len(conditions) == 1:
+        return Paren(conditions[0])
+    return Chain("and", tuple(Paren(cond) for cond in conditions))
+
+# Returns conditions holding if the conditions of any of given transitions
+# hold. Conditions common to the beginnings of all lists stay separate, equal
+# lists are taken once.
+def mergeConditions(conditionLists):
+    texts = []
+    uniqueLists = []
+    seen = set()
+    for conditions in conditionLists:
+        condTexts = tuple(str(cond) for cond in conditions)
+        if condTexts not in seen:
+            seen.add(condTexts)
+            texts.append(condTexts)
+            uniqueLists.append(conditions)
+    conditionLists = uniqueLists
+
+    common = 0
+    while (all(len(condTexts) > common for condTexts in texts) and
+           all(condTexts[common] == texts[0][common] for condTexts in texts)):
+        common += 1
+
+    merged = list(conditionLists[0][:common])
+    items = []
+    for conditions in conditionLists:
+        if len(conditions) == common:
+            # rest of the conditions of this transition is true
+            return tuple(merged)
+        # conjunction of one condition is already parenthesized
+        conjunction = getConjunction(conditions[common:])
+        if len(conditions) - common > 1:
+            conjunction = Paren(conjunction)
+        items.append(conjunction)
+    merged.append(Disjunction(tuple(items)))
+    return tuple(merged)
+
+# Removes duplicate transitions (same source, destination, priority,
+# conditions and actions) from given planarized charts. With merge,
+# transitions with the same source, destination, priority and actions are
+# merged into the first of them.
+def dedupeTransitions(charts, merge=False):
+    for chart in charts:
+        # key of transition = [transitions]
+        groups = {}
+        order = []
+        for trans in chart.transitions:
+            key = (trans.src, trans.dst, trans.getPriority(),
+                   tuple(str(action) for action in trans.getActions()))
+            if FALSE in trans.conditions or not merge:
+                key += (tuple(str(cond) for cond in trans.conditions),)
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(trans)
+
+        transitions = []
+        for key in order:
+            group = groups[key]
+            first = group[0]
+            if len(group) > 1 and merge and FALSE not in first.conditions:
+                first.conditions = mergeConditions([trans.conditions
+                                                    for trans in group])
+            transitions.append(first)
+        chart.setTransitions(transitions)
@@ -21,9 +21,9 @@ Created on Sat Oct 18 16:48:32 2014
 @author: pavla
 """
 
-from ply import lex, yacc
 from extendedExceptions import notSupportedException
-import os
+import sys, threading, parser_tables
+from copy import copy
 
 tokens = ("OPEN_BRACKET", "CLOSE_BRACKET", "AL_NUM", "WHITESPACE", "NEWLINE",
           "OTHER")
@@ -120,16 +120,21 @@ def p_error(p):
         raise ValueError("Unknown error")
     raise ValueError("Syntax error, line %s: %s" % (p.lineno, p.type))
 
-directory = os.path.join(os.path.dirname(__file__), 
-                         "parser_tables", 
-                         os.path.basename(__file__).rsplit('.', 1)[0])
-try:
-    os.makedirs(directory, exist_ok=True)
-except OSError:
-    pass
-
-lexer = lex.lex(debug=False, optimize=True, outputdir=directory)
-parser = yacc.yacc(debug=False, optimize=True, outputdir=directory)
-
-def parse(text, lexer=lexer):
-    return parser.parse(text, lexer)
+lexer = None
+parser = None
+lock = threading.Lock()
+
+# lexer and parser are created when first needed
+def getParser():
+    global lexer, parser
+    with lock:
+        if parser is None:
+            (lexer, parser) = parser_tables.buildParser(sys.modules[__name__])
+    return (lexer, parser)
+
+def parse(text, lexer=None):
+    (defaultLexer, defaultParser) = getParser()
+    if lexer is None:
+        lexer = defaultLexer.clone()
+    # the parser keeps some state of the parse in its attributes
+    return copy(defaultParser).parse(text, lexer)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of sf2dve.
+#
+#    sf2dve is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Lesser General Public License as published by
+#    the Free Software Foundation, either version 2.1 of the License, or
+#    (at your option) any later version.
+#
+#    sf2dve is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public License
+#    along with sf2dve.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Checks of the input. Instead of stopping at the first problem, the checks
+return lists of all problems found (as notSupportedException and
+invalidInputException instances), so that all of them can be reported at
+once.
+"""
+
+from extendedExceptions import (notSupportedException, invalidInputException,
+                                inputProblemsException)
+
+# Returns description of given element of the chart for the messages.
+def describe(element, chartName):
+    identifier = element.get("SSID")
+    if identifier is None:
+        identifier = element.get("id")
+    return "%s %s in chart %s" % (element.tag, identifier, chartName)
+
+# Checks number of machines and events of the machine. The charts are
+# checked separately by checkChart.
+def checkInput(stateflowEtree):
+    if stateflowEtree.find("Stateflow") is None:
+        return [invalidInputException("not recognized as Stateflow")]
+
+    problems = []
+    if len(stateflowEtree.findall("Stateflow/machine")) != 1:
+        problems.append(invalidInputException("invalid number of machines"))
+
+    for event in stateflowEtree.iterfind("Stateflow//event"):
+        problems.append(notSupportedException("events (event %s)"
+                                              % event.get("id")))
+    return problems
+
+# Checks action language, events, junctions, states and variables of the
+# chart in one pass over the chart.
+def checkChart(chart):
+    from planarization import getVariableDefinition
+    problems = []
+    chartName = chart.findtext('P[@Name="name"]')
+
+    actionLanguageSetting = chart.find('P[@Name="actionLanguage"]')
+    if (actionLanguageSetting != None and
+        actionLanguageSetting.findtext(".") == "2"):
+        problems.append(invalidInputException("invalid action language "
+                                              "(chart %s)" % chartName))
+
+    for element in chart.iter("event", "junction", "state", "data"):
+        where = describe(element, chartName)
+        if element.tag == "event":
+            problems.append(notSupportedException("events (%s)" % where))
+
+        elif element.tag == "junction":
+            problems.append(notSupportedException("junctions (%s)" % where))
+
+        elif element.tag == "state":
+            if (element.find('P[@Name="labelString"]') is None or
+                element.findtext('P[@Name="labelString"]') == ""):
+                problems.append(invalidInputException("state without label "
+                                                      "(%s)" % where))
+            stateType = element.findtext('P[@Name="type"]')
+            if stateType == "OR_STATE":
+                continue
+            if stateType == "AND_STATE":
+                problem = "and decomposition of states"
+            elif stateType == "FUNC_STATE":
+                problem = "functions"
+            else:
+                problem = "state of type %s" % stateType
+            problems.append(notSupportedException("%s (%s)"
+                                                  % (problem, where)))
+
+        else:
+            try:
+                getVariableDefinition(element)
+            except notSupportedException as e:
+                problems.append(notSupportedException(
+                    "%s (variable %s in chart %s)"
+                    % (e, element.get("name"), chartName)))
+
+    return problems
+
+# Parses labels of all states and transitions of the chart and returns
+# the problems found. Parsed labels are memoized, so this is cheap for
+# labels already parsed by the planarization.
+def checkLabels(chart):
+    from planarization import labelMemo
+    problems = []
+    chartName = chart.findtext('P[@Name="name"]')
+    for element in chart.iter("state", "transition"):
+        labelString = element.findtext('P[@Name="labelString"]')
+        if element.tag == "state" and not labelString:
+            continue
+        if labelString is None:
+            labelString = ""
+        where = describe(element, chartName)
+        try:
+            if element.tag == "state":
+                labelMemo.getState(labelString, element.get("SSID"))
+            else:
+                labelMemo.getTransition(labelString, element.get("SSID"))
+        except notSupportedException as e:
+            problems.append(notSupportedException("%s (%s)" % (e, where)))
+        except (invalidInputException, ValueError, TypeError) as e:
+            problems.append(invalidInputException("invalid label of %s: %s"
+                                                  % (where, e)))
+    return problems
+
+# Raises the problem if there is just one, inputProblemsException if there
+# are more of them.
+def raiseProblems(problems):
+    if len(problems) == 1:
+        raise problems[0]
+    if problems != []:
+        raise inputProblemsException(problems)